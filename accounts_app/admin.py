@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Profile
+from jobs_app.queue import enqueue
+from .models import Profile, StatCounter
 
 
 @admin.register(Profile)
@@ -8,3 +9,15 @@ class ProfileAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'name', 'bio', 'skills']
     list_filter = ['created_at']
     readonly_fields = ['created_at', 'updated_at']
+    actions = ['regenerate_renditions']
+
+    def regenerate_renditions(self, request, queryset):
+        for pk in queryset.exclude(profile_image='').exclude(profile_image=None).values_list('pk', flat=True):
+            enqueue('accounts.profile_image_renditions', pk=pk, force=True)
+    regenerate_renditions.short_description = 'Regenerate profile image renditions'
+
+
+@admin.register(StatCounter)
+class StatCounterAdmin(admin.ModelAdmin):
+    list_display = ['name', 'value']
+    readonly_fields = ['name', 'value']
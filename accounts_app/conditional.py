@@ -0,0 +1,21 @@
+from projects_app.conditional import make_etag
+from .models import Profile
+
+
+def _owner_profile_updated_at(request):
+    if not hasattr(request, '_owner_profile_updated_at'):
+        request._owner_profile_updated_at = (
+            Profile.objects.filter(user__is_superuser=True).values_list('updated_at', flat=True).first()
+        )
+    return request._owner_profile_updated_at
+
+
+def api_profile_etag(request, *args, **kwargs):
+    updated_at = _owner_profile_updated_at(request)
+    if updated_at is None:
+        return None
+    return make_etag(updated_at, request.get_full_path(), request.META.get('HTTP_ACCEPT', ''))
+
+
+def api_profile_last_modified(request, *args, **kwargs):
+    return _owner_profile_updated_at(request)
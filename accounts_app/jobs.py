@@ -0,0 +1,14 @@
+from jobs_app.queue import register
+from portfolio_site import page_cache
+from portfolio_site.db.routers import note_write
+from portfolio_site.images import sync_renditions
+from .models import Profile
+
+
+@register('accounts.profile_image_renditions')
+def build_profile_image_renditions(pk, force=False):
+    profile = Profile.objects.filter(pk=pk).first()
+    if profile and sync_renditions(profile, 'profile_image', 'profile_image_renditions', force=force):
+        # Through the shared cache, so the web workers see it too.
+        note_write()
+        page_cache.invalidate('profile')
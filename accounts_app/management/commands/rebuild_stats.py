@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from accounts_app.stats import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Recount the dashboard counters from the project and contact message tables'
+
+    def handle(self, *args, **options):
+        for name, value in rebuild().items():
+            self.stdout.write(f'{name}: {value}')
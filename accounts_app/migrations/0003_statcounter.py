@@ -0,0 +1,36 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:45
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def seed_counters(apps, schema_editor):
+    ContactMessage = apps.get_model('contact_app', 'ContactMessage')
+    Project = apps.get_model('projects_app', 'Project')
+    StatCounter = apps.get_model('accounts_app', 'StatCounter')
+    counts = ContactMessage.objects.order_by().aggregate(
+        messages=Count('pk'), unread_messages=Count('pk', filter=Q(is_read=False)),
+    )
+    counts['projects'] = Project.objects.order_by().count()
+    StatCounter.objects.bulk_create([StatCounter(name=name, value=value) for name, value in counts.items()])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts_app', '0002_profile_image_renditions'),
+        ('contact_app', '0002_outboundemail'),
+        ('projects_app', '0008_project_tech_list'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from jobs_app.queue import enqueue
+from portfolio_site.images import renditions_stale
 
 
 class Profile(models.Model):
@@ -7,6 +9,7 @@ class Profile(models.Model):
     name = models.CharField(max_length=100, blank=True)
     bio = models.TextField(blank=True)
     profile_image = models.ImageField(upload_to='profiles/', blank=True, null=True)
+    profile_image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     skills = models.TextField(blank=True, help_text='Comma-separated list of skills')
     title = models.CharField(max_length=200, blank=True, default='Full Stack Developer')
     location = models.CharField(max_length=100, blank=True)
@@ -23,6 +26,11 @@ class Profile(models.Model):
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if renditions_stale(self, 'profile_image', 'profile_image_renditions'):
+            enqueue('accounts.profile_image_renditions', pk=self.pk)
+
     def get_skills_list(self):
         if self.skills:
             return [s.strip() for s in self.skills.split(',') if s.strip()]
@@ -31,3 +39,12 @@ class Profile(models.Model):
     class Meta:
         verbose_name = 'Profile'
         verbose_name_plural = 'Profiles'
+
+
+class StatCounter(models.Model):
+    # Running dashboard totals, kept current by accounts_app.stats.
+    name = models.CharField(max_length=50, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f'{self.name} = {self.value}'
@@ -1,6 +1,12 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.contrib.auth.models import User
 from django.dispatch import receiver
+from contact_app.models import ContactMessage
+from portfolio_site import page_cache
+from portfolio_site.db.routers import note_write
+from projects_app.models import Project
+from . import stats
 from .models import Profile
 
 
@@ -14,3 +20,44 @@ def create_user_profile(sender, instance, created, **kwargs):
 def save_user_profile(sender, instance, **kwargs):
     if hasattr(instance, 'profile'):
         instance.profile.save()
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_pages(sender, instance, **kwargs):
+    note_write()
+    page_cache.invalidate('profile')
+    transaction.on_commit(lambda: page_cache.invalidate('profile'))
+
+
+# ─── Dashboard counters ──────────────────────────────────────────────────────
+
+@receiver(post_save, sender=Project)
+def count_project_created(sender, instance, created, **kwargs):
+    if created:
+        stats.adjust(**{stats.PROJECTS: 1})
+
+
+@receiver(post_delete, sender=Project)
+def count_project_deleted(sender, instance, **kwargs):
+    stats.adjust(**{stats.PROJECTS: -1})
+
+
+@receiver(pre_save, sender=ContactMessage)
+def remember_read_state(sender, instance, **kwargs):
+    # Only edits need the stored value, to tell whether is_read flipped.
+    if not instance._state.adding:
+        instance._was_read = sender.objects.filter(pk=instance.pk).values_list('is_read', flat=True).first()
+
+
+@receiver(post_save, sender=ContactMessage)
+def count_message_saved(sender, instance, created, **kwargs):
+    if created:
+        stats.adjust(**{stats.MESSAGES: 1, stats.UNREAD: 0 if instance.is_read else 1})
+    elif getattr(instance, '_was_read', None) is not None and instance._was_read != instance.is_read:
+        stats.adjust(**{stats.UNREAD: -1 if instance.is_read else 1})
+
+
+@receiver(post_delete, sender=ContactMessage)
+def count_message_deleted(sender, instance, **kwargs):
+    stats.adjust(**{stats.MESSAGES: -1, stats.UNREAD: 0 if instance.is_read else -1})
@@ -0,0 +1,67 @@
+"""
+Dashboard counts. With STATS_COUNTERS on (the default) they are read from the
+StatCounter table in one indexed query, whatever the table sizes; writes keep
+it current through adjust(), called from model signals and from the bulk paths
+that bypass them. rebuild() recounts from scratch.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BigIntegerField, Case, Count, F, Q, When
+from contact_app.models import ContactMessage
+from projects_app.models import Project
+from .models import StatCounter
+
+PROJECTS = 'projects'
+MESSAGES = 'messages'
+UNREAD = 'unread_messages'
+NAMES = (PROJECTS, MESSAGES, UNREAD)
+
+
+def aggregate_counts():
+    """Count from the source tables: one conditional aggregate for messages."""
+    counts = ContactMessage.objects.order_by().aggregate(
+        **{MESSAGES: Count('pk'), UNREAD: Count('pk', filter=Q(is_read=False))},
+    )
+    counts[PROJECTS] = Project.objects.order_by().count()
+    return counts
+
+
+def counter_values():
+    counts = dict(StatCounter.objects.filter(name__in=NAMES).values_list('name', 'value'))
+    if len(counts) < len(NAMES):
+        return rebuild()
+    return counts
+
+
+def dashboard_counts():
+    if settings.STATS_COUNTERS:
+        return counter_values()
+    return aggregate_counts()
+
+
+def adjust(**deltas):
+    """Add ``deltas`` (counter name -> change) to the counters in a single UPDATE."""
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    updated = StatCounter.objects.filter(name__in=deltas).update(
+        value=F('value') + Case(
+            *(When(name=name, then=delta) for name, delta in deltas.items()),
+            default=0, output_field=BigIntegerField(),
+        ),
+    )
+    if updated < len(deltas):
+        rebuild()
+
+
+def rebuild():
+    """Recount everything into the counter table; returns the counts."""
+    with transaction.atomic():
+        counts = aggregate_counts()
+        existing = {c.name: c for c in StatCounter.objects.select_for_update().filter(name__in=NAMES)}
+        for name, value in counts.items():
+            existing.setdefault(name, StatCounter(name=name)).value = value
+        stored = [c for c in existing.values() if c.pk is not None]
+        StatCounter.objects.bulk_create([c for c in existing.values() if c.pk is None])
+        StatCounter.objects.bulk_update(stored, ['value'])
+    return counts
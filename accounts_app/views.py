@@ -1,12 +1,18 @@
+from django.http import Http404
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.auth.models import User
+from portfolio_site.streaming import stream_template
+from portfolio_site.throttle import posted_username, throttle
 from .forms import SignupForm, LoginForm, ProfileForm
 from .models import Profile
+from .stats import PROJECTS, MESSAGES, UNREAD, dashboard_counts
 from projects_app.models import Project
-from contact_app.models import ContactMessage
+from projects_app.pagination import InvalidCursor, keyset_paginate
+
+DASHBOARD_PAGE_SIZE = 20
 
 
 def signup_view(request):
@@ -26,6 +32,7 @@ def signup_view(request):
     return render(request, 'accounts/signup.html', {'form': form})
 
 
+@throttle('login', ('login_account', posted_username))
 def login_view(request):
     if request.user.is_authenticated:
         return redirect('dashboard')
@@ -52,18 +59,20 @@ def logout_view(request):
 
 @login_required
 def dashboard_view(request):
-    projects = Project.objects.all().order_by('-created_at')
-    messages_count = ContactMessage.objects.count()
-    unread_count = ContactMessage.objects.filter(is_read=False).count()
-    profile, _ = Profile.objects.get_or_create(user=request.user)
+    projects = Project.objects.only('title', 'slug', 'tech_list', 'is_featured', 'created_at')
+    try:
+        page = keyset_paginate(projects, cursor=request.GET.get('cursor'), page_size=DASHBOARD_PAGE_SIZE)
+    except InvalidCursor:
+        raise Http404('Invalid cursor')
+    counts = dashboard_counts()
     context = {
-        'projects': projects,
-        'projects_count': projects.count(),
-        'messages_count': messages_count,
-        'unread_count': unread_count,
-        'profile': profile,
+        'projects': page.items,
+        'next_cursor': page.next_cursor,
+        'projects_count': counts[PROJECTS],
+        'messages_count': counts[MESSAGES],
+        'unread_count': counts[UNREAD],
     }
-    return render(request, 'accounts/dashboard.html', context)
+    return stream_template(request, 'accounts/dashboard.html', context)
 
 
 @login_required
@@ -0,0 +1,146 @@
+"""
+Token authentication with the resolved user cached per worker.
+
+DRF's TokenAuthentication joins Token and User on every request. Here a hit in
+the bounded, TTL-evicting TokenCache replaces that join with one read of a
+generation token from SHARED_CACHE_ALIAS (Redis, or the database cache table).
+Deleting or saving a token and editing a user call invalidate_tokens(), which
+clears this worker's cache and replaces the generation; every other worker and
+process sees the new generation on its next request and drops its entries, so
+a revoked token stops working everywhere at once. TOKEN_EXPIRY_SECONDS makes
+tokens expire; rotate_token() replaces one.
+"""
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from portfolio_site.metrics import register_stats
+
+GENERATION_KEY = 'token-auth:generation'
+
+
+def _shared_cache():
+    return caches[settings.SHARED_CACHE_ALIAS]
+
+
+class TokenCache:
+    """Thread-safe LRU of token key -> (user, token), entries live TOKEN_AUTH_CACHE_TTL seconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = None
+        self.hits = self.misses = self.expired = self.evictions = self.invalidations = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        size, ttl = settings.TOKEN_AUTH_CACHE_SIZE, settings.TOKEN_AUTH_CACHE_TTL
+        if size <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def sync(self, generation):
+        # Drop everything when another worker has invalidated since we last looked.
+        if generation != self._generation:
+            with self._lock:
+                self._entries.clear()
+                self._generation = generation
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+
+token_cache = TokenCache()
+register_stats('token_auth', token_cache.stats)
+
+
+def _invalidate():
+    token_cache.clear()
+    _shared_cache().set(GENERATION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_tokens():
+    # Now and again after commit, so a concurrent request can't re-cache the old state.
+    _invalidate()
+    transaction.on_commit(_invalidate)
+
+
+def token_expired(token):
+    expiry = settings.TOKEN_EXPIRY_SECONDS
+    return bool(expiry) and token.created < timezone.now() - timedelta(seconds=expiry)
+
+
+def token_expires_at(token):
+    expiry = settings.TOKEN_EXPIRY_SECONDS
+    return token.created + timedelta(seconds=expiry) if expiry else None
+
+
+def rotate_token(user):
+    """Replace ``user``'s token with a fresh one (the old key stops working at once)."""
+    with transaction.atomic():
+        Token.objects.filter(user=user).delete()
+        return Token.objects.create(user=user)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def authenticate_credentials(self, key):
+        token_cache.sync(_shared_cache().get(GENERATION_KEY))
+        entry = token_cache.get(key)
+        if entry is None:
+            entry = super().authenticate_credentials(key)
+            token_cache.set(key, entry)
+        user, token = entry
+        if token_expired(token):
+            token_cache.discard(key)
+            raise exceptions.AuthenticationFailed(_('Token has expired.'))
+        # Views may modify request.user; don't let that leak into the cached copy.
+        return copy.copy(user), token
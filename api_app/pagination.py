@@ -0,0 +1,95 @@
+from collections import OrderedDict
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from projects_app.pagination import (
+    InvalidCursor, acapped_count, akeyset_paginate, capped_count, keyset_paginate,
+)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque-cursor pagination over a stable ordering: (-created_at, -id) by default,
+    or relevance first for search results. Views can override the ordering with a
+    ``get_keyset_ordering()`` method.
+    """
+    page_size = api_settings.PAGE_SIZE or 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_cap = 1000
+
+    def get_page_size(self, request):
+        try:
+            # request.GET also works for a plain HttpRequest (async views).
+            size = int(request.GET[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _ordering(self, view):
+        if view is not None and hasattr(view, 'get_keyset_ordering'):
+            return view.get_keyset_ordering()
+        return None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count, self.count_exact = capped_count(queryset, self.count_cap)
+        try:
+            self.page = keyset_paginate(
+                queryset,
+                cursor=request.GET.get(self.cursor_query_param),
+                page_size=self.get_page_size(request),
+                ordering=self._ordering(view),
+            )
+        except InvalidCursor:
+            raise NotFound('Invalid cursor')
+        return self.page.items
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count, self.count_exact = await acapped_count(queryset, self.count_cap)
+        try:
+            self.page = await akeyset_paginate(
+                queryset,
+                cursor=request.GET.get(self.cursor_query_param),
+                page_size=self.get_page_size(request),
+                ordering=self._ordering(view),
+            )
+        except InvalidCursor:
+            raise NotFound('Invalid cursor')
+        return self.page.items
+
+    def get_next_link(self):
+        if not self.page.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.page.next_cursor,
+        )
+
+    def get_paginated_data(self, data):
+        return OrderedDict([
+            ('count', self.count),
+            ('count_exact', self.count_exact),
+            ('next', self.get_next_link()),
+            ('results', data),
+        ])
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['count', 'count_exact', 'next', 'results'],
+            'properties': {
+                'count': {'type': 'integer', 'example': 123},
+                'count_exact': {'type': 'boolean'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
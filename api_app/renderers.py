@@ -0,0 +1,14 @@
+from rest_framework.renderers import BaseRenderer
+from portfolio_site.metrics import prometheus_text
+
+
+class PrometheusRenderer(BaseRenderer):
+    media_type = 'text/plain'
+    format = 'prometheus'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, dict) or 'routes' not in data:
+            # Error responses (e.g. 403) carry a plain detail message.
+            return str(data).encode(self.charset)
+        return prometheus_text(data).encode(self.charset)
@@ -1,19 +1,37 @@
-from rest_framework import serializers
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.encoding import iri_to_uri
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
 from projects_app.models import Project
 from contact_app.models import ContactMessage
 from accounts_app.models import Profile
+from portfolio_site.images import rendition_urls
+
+
+class RenditionsField(serializers.ReadOnlyField):
+    # Exposes portfolio_site.images renditions as {'webp': {'320': url}, 'jpeg': {...}}.
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        request = self.context.get('request')
+        storage = self.parent.Meta.model._meta.get_field(self.image_field).storage
+        return rendition_urls(value, storage, request.build_absolute_uri if request else None)
 
 
 class ProjectSerializer(serializers.ModelSerializer):
     tech_list = serializers.SerializerMethodField()
     url = serializers.SerializerMethodField()
+    image_variants = RenditionsField('image', source='image_renditions')
 
     class Meta:
         model = Project
         fields = [
             'id', 'title', 'slug', 'short_description', 'description',
             'tech_stack', 'tech_list', 'github_link', 'live_demo_link',
-            'image', 'is_featured', 'order', 'created_at', 'updated_at', 'url'
+            'image', 'image_variants', 'is_featured', 'order', 'created_at', 'updated_at', 'url'
         ]
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
 
@@ -26,6 +44,13 @@ class ProjectSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.get_absolute_url())
         return obj.get_absolute_url()
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Only present on search results (see ProjectQuerySet.search).
+        if getattr(instance, 'headline', None) is not None:
+            data['headline'] = instance.headline
+        return data
+
     def validate_title(self, value):
         if len(value) < 3:
             raise serializers.ValidationError('Title must be at least 3 characters long.')
@@ -37,6 +62,88 @@ class ProjectSerializer(serializers.ModelSerializer):
         return value
 
 
+def absolute_url_builder(request):
+    """
+    request.build_absolute_uri, with the scheme and host looked up once. Paths
+    take the same shortcut Django does; anything else goes through the request.
+    """
+    if request is None:
+        return lambda location: location
+    origin = request.build_absolute_uri('/')[:-1]
+
+    def build(location):
+        if (location.startswith('/') and not location.startswith('//')
+                and '/./' not in location and '/../' not in location):
+            return iri_to_uri(origin + location)
+        return request.build_absolute_uri(location)
+    return build
+
+
+class ProjectRowSerializer:
+    """
+    Read-only fast path for list endpoints: produces exactly what
+    ProjectSerializer(many=True) does, but from .values() rows. Detail URLs and
+    absolute URLs are resolved once per request and tech_list comes from its
+    precomputed column, so there's no per-row reverse() or field machinery.
+    """
+    columns = (
+        'id', 'title', 'slug', 'short_description', 'description', 'tech_stack', 'tech_list',
+        'github_link', 'live_demo_link', 'image', 'image_renditions', 'is_featured', 'order',
+        'created_at', 'updated_at',
+    )
+
+    def __init__(self, request=None):
+        self.build_url = absolute_url_builder(request)
+        self.storage = Project._meta.get_field('image').storage
+        placeholder = 'slug-placeholder'
+        detail = reverse('project_detail', kwargs={'slug': placeholder})
+        self.url_prefix, self.url_suffix = (
+            self.build_url(detail) if request is not None else detail
+        ).split(placeholder)
+        # DateTimeField looks the current timezone up for every value; do it once.
+        self.datetime_field = serializers.DateTimeField()
+        self.timezone = self.datetime_field.default_timezone()
+        self.iso_datetimes = (api_settings.DATETIME_FORMAT or '').lower() == ISO_8601
+
+    def values(self, queryset):
+        # search() annotations: search_rank for keyset cursors, headline for the output.
+        annotations = [name for name in ('search_rank', 'headline') if name in queryset.query.annotations]
+        return queryset.values(*self.columns, *annotations)
+
+    def to_representation(self, row):
+        image = row['image']
+        data = {
+            'id': row['id'],
+            'title': row['title'],
+            'slug': row['slug'],
+            'short_description': row['short_description'],
+            'description': row['description'],
+            'tech_stack': row['tech_stack'],
+            'tech_list': row['tech_list'],
+            'github_link': row['github_link'],
+            'live_demo_link': row['live_demo_link'],
+            'image': self.build_url(self.storage.url(image)) if image else None,
+            'image_variants': rendition_urls(row['image_renditions'], self.storage, self.build_url),
+            'is_featured': row['is_featured'],
+            'order': row['order'],
+            'created_at': self.format_datetime(row['created_at']),
+            'updated_at': self.format_datetime(row['updated_at']),
+            'url': f"{self.url_prefix}{row['slug']}{self.url_suffix}",
+        }
+        if row.get('headline') is not None:
+            data['headline'] = row['headline']
+        return data
+
+    def format_datetime(self, value):
+        if not value or not self.iso_datetimes or self.timezone is None or timezone.is_naive(value):
+            return self.datetime_field.to_representation(value)
+        value = value.astimezone(self.timezone).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
+
+
 class ContactMessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = ContactMessage
@@ -58,13 +165,14 @@ class ProfileSerializer(serializers.ModelSerializer):
     username = serializers.CharField(source='user.username', read_only=True)
     email = serializers.CharField(source='user.email', read_only=True)
     skills_list = serializers.SerializerMethodField()
+    profile_image_variants = RenditionsField('profile_image', source='profile_image_renditions')
 
     class Meta:
         model = Profile
         fields = [
             'id', 'username', 'email', 'name', 'bio', 'title', 'location',
             'skills', 'skills_list', 'github_url', 'linkedin_url', 'twitter_url',
-            'website_url', 'profile_image', 'education', 'experience'
+            'website_url', 'profile_image', 'profile_image_variants', 'education', 'experience'
         ]
 
     def get_skills_list(self, obj):
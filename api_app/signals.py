@@ -0,0 +1,19 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from .authentication import invalidate_tokens
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, **kwargs):
+    invalidate_tokens()
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user(sender, instance, created, update_fields=None, **kwargs):
+    # Deactivation or permission changes must reach cached users; logins only touch last_login.
+    if created or (update_fields is not None and set(update_fields) <= {'last_login'}):
+        return
+    invalidate_tokens()
@@ -1,20 +1,35 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+if settings.ASYNC_VIEWS:
+    featured_projects = views.featured_projects_async
+    project_detail = views.project_detail_async
+    profile = views.profile_async
+else:
+    featured_projects = views.FeaturedProjectsAPIView.as_view()
+    project_detail = views.ProjectDetailAPIView.as_view()
+    profile = views.ProfileAPIView.as_view()
+
 urlpatterns = [
     # Auth
     path('auth/login/', views.api_login, name='api_login'),
     path('auth/logout/', views.api_logout, name='api_logout'),
+    path('auth/token/rotate/', views.api_rotate_token, name='api_rotate_token'),
     path('auth/profile/', views.api_profile, name='api_user_profile'),
 
     # Projects
     path('projects/', views.ProjectListCreateAPIView.as_view(), name='api_projects_list'),
-    path('projects/featured/', views.FeaturedProjectsAPIView.as_view(), name='api_projects_featured'),
-    path('projects/<slug:slug>/', views.ProjectDetailAPIView.as_view(), name='api_project_detail'),
+    path('projects/bulk/', views.ProjectBulkAPIView.as_view(), name='api_projects_bulk'),
+    path('projects/featured/', featured_projects, name='api_projects_featured'),
+    path('projects/<slug:slug>/', project_detail, name='api_project_detail'),
 
     # Contact
     path('contact/', views.ContactMessageCreateAPIView.as_view(), name='api_contact'),
 
     # Profile
-    path('profile/', views.ProfileAPIView.as_view(), name='api_portfolio_profile'),
+    path('profile/', profile, name='api_portfolio_profile'),
+
+    # Metrics (staff only)
+    path('metrics/', views.MetricsAPIView.as_view(), name='api_metrics'),
 ]
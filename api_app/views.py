@@ -1,18 +1,54 @@
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from rest_framework.authtoken.models import Token
+from rest_framework.parsers import JSONParser
+from rest_framework.settings import api_settings
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
 from django.contrib.auth import authenticate
-from django.core.mail import send_mail
-from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from projects_app.models import Project
+from projects_app.bulk import save_projects
+from projects_app.filters import apply_tech_filter
+from projects_app.pagination import FEATURED_ORDERING
+from projects_app.signals import invalidate_project_caches
+from projects_app.conditional import (
+    api_project_detail_etag, api_project_detail_last_modified,
+    api_project_list_etag, api_project_list_last_modified,
+)
+from accounts_app.conditional import api_profile_etag, api_profile_last_modified
 from contact_app.models import ContactMessage
+from contact_app.outbox import queue_contact_emails
 from accounts_app.models import Profile
-from .serializers import ProjectSerializer, ContactMessageSerializer, ProfileSerializer
+from portfolio_site import metrics
+from portfolio_site.async_views import async_condition, reads_async
+from portfolio_site.throttle import posted_username, throttle
+from .authentication import rotate_token, token_expired, token_expires_at
+from .renderers import PrometheusRenderer
+from .serializers import ProjectSerializer, ProjectRowSerializer, ContactMessageSerializer, ProfileSerializer
 
 
-class ProjectListCreateAPIView(generics.ListCreateAPIView):
+class ProjectRowListMixin:
+    """List with ProjectRowSerializer: the same JSON as ProjectSerializer, built from .values() rows."""
+    def list(self, request, *args, **kwargs):
+        rows = ProjectRowSerializer(request)
+        queryset = rows.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(rows.serialize(queryset))
+        return self.get_paginated_response(rows.serialize(page))
+
+
+@method_decorator(condition(etag_func=api_project_list_etag,
+                             last_modified_func=api_project_list_last_modified), name='get')
+class ProjectListCreateAPIView(ProjectRowListMixin, generics.ListCreateAPIView):
     queryset = Project.objects.all().order_by('-created_at')
     serializer_class = ProjectSerializer
 
@@ -21,10 +57,19 @@ class ProjectListCreateAPIView(generics.ListCreateAPIView):
             return [IsAdminUser()]
         return [AllowAny()]
 
+    def get_queryset(self):
+        queryset, _, _ = apply_tech_filter(super().get_queryset(), self.request.query_params)
+        query = self.request.query_params.get('q', '').strip()
+        if query:
+            queryset = queryset.search(query)
+        return queryset
+
     def perform_create(self, serializer):
         serializer.save()
 
 
+@method_decorator(condition(etag_func=api_project_detail_etag,
+                             last_modified_func=api_project_detail_last_modified), name='get')
 class ProjectDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
@@ -36,66 +81,130 @@ class ProjectDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         return [AllowAny()]
 
 
-class FeaturedProjectsAPIView(generics.ListAPIView):
+class ProjectBulkAPIView(APIView):
+    """
+    Apply a list of operations in one transaction:
+        [{"op": "create", "data": {...}},
+         {"op": "update", "slug": "...", "data": {...}},  # partial
+         {"op": "delete", "slug": "..."}]
+    Creates run first, then updates, then deletes. If any operation is invalid
+    nothing is applied and the per-item results say which ones failed (409 when
+    a concurrent write took a slug).
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = [JSONParser]
+    max_operations = 1000
+
+    def post(self, request):
+        operations = request.data
+        if not isinstance(operations, list) or not operations:
+            return Response({'error': 'Expected a non-empty list of operations.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(operations) > self.max_operations:
+            return Response({'error': f'At most {self.max_operations} operations per request.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        results = []
+        groups = {'create': [], 'update': [], 'delete': []}
+        for index, operation in enumerate(operations):
+            op = operation.get('op') if isinstance(operation, dict) else None
+            slug = operation.get('slug') if isinstance(operation, dict) else None
+            results.append({'op': op, 'slug': slug})
+            if not isinstance(op, str) or op not in groups:
+                results[index].update(status='invalid', errors={'op': ['Must be create, update or delete.']})
+            elif op != 'create' and not slug:
+                results[index].update(status='invalid', errors={'slug': ['This field is required.']})
+            elif op != 'create' and not isinstance(slug, str):
+                results[index].update(status='invalid', errors={'slug': ['Must be a string.']})
+            else:
+                groups[op].append(index)
+
+        existing = Project.objects.in_bulk(
+            {operations[i]['slug'] for i in groups['update'] + groups['delete']}, field_name='slug',
+        )
+        for index in groups['update']:
+            if operations[index]['slug'] not in existing:
+                results[index].update(status='invalid', errors={'slug': ['Not found.']})
+
+        creates = self._validate(operations, groups['create'], results, partial=False)
+        updates = self._validate(operations, groups['update'], results, partial=True)
+        if any(result.get('status') == 'invalid' for result in results):
+            for result in results:
+                result.setdefault('status', 'not_applied')
+            return Response({'results': results}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                new = {index: Project(**data) for index, data in creates}
+                changed, fields = {}, set()
+                for index, data in updates:
+                    project = existing[operations[index]['slug']]
+                    for field, value in data.items():
+                        setattr(project, field, value)
+                    changed[project.pk] = project
+                    fields.update(data)
+                save_projects(new.values(), changed.values(), sorted(fields))
+                deleted = {operations[i]['slug'] for i in groups['delete'] if operations[i]['slug'] in existing}
+                Project.objects.filter(slug__in=deleted).delete()
+        except IntegrityError:
+            # Slugs are the only unique column written here; a concurrent request took one.
+            for index in groups['create']:
+                results[index].update(status='invalid', errors={'slug': ['Taken by a concurrent write; retry.']})
+            for result in results:
+                result.setdefault('status', 'not_applied')
+            return Response({'results': results}, status=status.HTTP_409_CONFLICT)
+        invalidate_project_caches()
+
+        for index, project in new.items():
+            results[index]['slug'] = project.slug
+        for index in groups['create']:
+            results[index]['status'] = 'created'
+        for index in groups['update']:
+            results[index]['status'] = 'updated'
+        for index in groups['delete']:
+            results[index]['status'] = 'deleted' if operations[index]['slug'] in deleted else 'not_found'
+        return Response({'results': results})
+
+    def _validate(self, operations, indexes, results, partial):
+        # One ProjectSerializer(many=True) pass per operation type.
+        if not indexes:
+            return []
+        serializer = ProjectSerializer(
+            data=[operations[i].get('data') or {} for i in indexes],
+            many=True, partial=partial, context={'request': self.request},
+        )
+        if serializer.is_valid():
+            return list(zip(indexes, serializer.validated_data))
+        for index, errors in zip(indexes, serializer.errors):
+            if errors:
+                results[index].update(status='invalid', errors=errors)
+        return []
+
+
+@method_decorator(condition(etag_func=api_project_list_etag,
+                             last_modified_func=api_project_list_last_modified), name='get')
+class FeaturedProjectsAPIView(ProjectRowListMixin, generics.ListAPIView):
     queryset = Project.objects.filter(is_featured=True).order_by('order')
     serializer_class = ProjectSerializer
     permission_classes = [AllowAny]
 
+    def get_keyset_ordering(self):
+        return FEATURED_ORDERING
 
+
+@method_decorator(throttle('contact', api=True), name='dispatch')
 class ContactMessageCreateAPIView(generics.CreateAPIView):
     queryset = ContactMessage.objects.all()
     serializer_class = ContactMessageSerializer
     permission_classes = [AllowAny]
 
     def perform_create(self, serializer):
-        contact_msg = serializer.save()
-
-        # 1. Notify admin
-        try:
-            send_mail(
-                subject=f'[Portfolio Contact] {contact_msg.subject or "New Message"} from {contact_msg.name}',
-                message=(
-                    f'You received a new contact message.\n\n'
-                    f'Name: {contact_msg.name}\n'
-                    f'Email: {contact_msg.email}\n'
-                    f'Subject: {contact_msg.subject or "N/A"}\n\n'
-                    f'Message:\n{contact_msg.message}'
-                ),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[settings.ADMIN_EMAIL],
-                fail_silently=False,
-            )
-        except Exception as e:
-            # Log the error but don't break the request
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f'Failed to send admin notification email: {e}')
-
-        # 2. Send confirmation email to the sender
-        try:
-            send_mail(
-                subject='Thanks for reaching out!',
-                message=(
-                    f'Hi {contact_msg.name},\n\n'
-                    f'Thank you for your message! I have received it and will get back to you as soon as possible.\n\n'
-                    f'Here is a copy of what you sent:\n'
-                    f'---\n'
-                    f'Subject: {contact_msg.subject or "N/A"}\n'
-                    f'{contact_msg.message}\n'
-                    f'---\n\n'
-                    f'Best regards,\n'
-                    f'Rahul'
-                ),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[contact_msg.email],
-                fail_silently=False,
-            )
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f'Failed to send confirmation email to {contact_msg.email}: {e}')
+        with transaction.atomic():
+            contact_msg = serializer.save()
+            queue_contact_emails(contact_msg)
 
 
+@method_decorator(condition(etag_func=api_profile_etag,
+                             last_modified_func=api_profile_last_modified), name='get')
 class ProfileAPIView(generics.RetrieveAPIView):
     serializer_class = ProfileSerializer
     permission_classes = [AllowAny]
@@ -104,7 +213,9 @@ class ProfileAPIView(generics.RetrieveAPIView):
         return Profile.objects.filter(user__is_superuser=True).first()
 
 
+@throttle('login', ('login_account', posted_username), api=True)
 @api_view(['POST'])
+@authentication_classes([])  # a stale or expired token must not block logging in again
 @permission_classes([AllowAny])
 def api_login(request):
     username = request.data.get('username')
@@ -113,9 +224,12 @@ def api_login(request):
         return Response({'error': 'Username and password required'}, status=status.HTTP_400_BAD_REQUEST)
     user = authenticate(username=username, password=password)
     if user:
-        token, created = Token.objects.get_or_create(user=user)
+        token = Token.objects.filter(user=user).first()
+        if token is None or token_expired(token):
+            token = rotate_token(user)
         return Response({
             'token': token.key,
+            'expires_at': token_expires_at(token),
             'user_id': user.pk,
             'username': user.username,
             'email': user.email,
@@ -131,6 +245,13 @@ def api_logout(request):
     return Response({'message': 'Logged out successfully'})
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def api_rotate_token(request):
+    token = rotate_token(request.user)
+    return Response({'token': token.key, 'expires_at': token_expires_at(token)})
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def api_profile(request):
@@ -140,3 +261,52 @@ def api_profile(request):
         return Response(serializer.data)
     except Profile.DoesNotExist:
         return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+
+
+class MetricsAPIView(APIView):
+    permission_classes = [IsAdminUser]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, PrometheusRenderer]
+
+    def get(self, request):
+        return Response(metrics.registry.snapshot())
+
+
+# Async versions of the public reads, routed instead of the views above when
+# settings.ASYNC_VIEWS is on. They answer GET/HEAD with JSON only (no browsable
+# API) and hand every other method to the sync view for the same URL.
+
+def _json_response(data, view_class, status=200):
+    response = HttpResponse(JSONRenderer().render(data), status=status, content_type='application/json')
+    response['Allow'] = ', '.join(view_class().allowed_methods)
+    patch_vary_headers(response, ['Accept'])
+    return response
+
+
+@reads_async(FeaturedProjectsAPIView.as_view())
+@async_condition(etag_func=api_project_list_etag, last_modified_func=api_project_list_last_modified)
+async def featured_projects_async(request):
+    view = FeaturedProjectsAPIView()
+    paginator = view.pagination_class()
+    rows = ProjectRowSerializer(request)
+    try:
+        page = await paginator.apaginate_queryset(rows.values(view.queryset.all()), request, view=view)
+    except NotFound as e:
+        return _json_response({'detail': e.detail}, FeaturedProjectsAPIView, status=e.status_code)
+    return _json_response(paginator.get_paginated_data(rows.serialize(page)), FeaturedProjectsAPIView)
+
+
+@reads_async(ProjectDetailAPIView.as_view())
+@async_condition(etag_func=api_project_detail_etag, last_modified_func=api_project_detail_last_modified)
+async def project_detail_async(request, slug):
+    project = await Project.objects.filter(slug=slug).afirst()
+    if project is None:
+        return _json_response({'detail': 'No Project matches the given query.'}, ProjectDetailAPIView,
+                              status=status.HTTP_404_NOT_FOUND)
+    return _json_response(ProjectSerializer(project, context={'request': request}).data, ProjectDetailAPIView)
+
+
+@reads_async(ProfileAPIView.as_view())
+@async_condition(etag_func=api_profile_etag, last_modified_func=api_profile_last_modified)
+async def profile_async(request):
+    profile = await Profile.objects.select_related('user').filter(user__is_superuser=True).afirst()
+    return _json_response(ProfileSerializer(profile, context={'request': request}).data, ProfileAPIView)
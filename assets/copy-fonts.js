@@ -0,0 +1,27 @@
+// Copies the font files site.css references from node_modules into static/.
+const fs = require('fs');
+const path = require('path');
+
+const root = path.resolve(__dirname, '..');
+const modules = path.join(root, 'node_modules');
+
+const FONTS = {
+  // url(../webfonts/...) in Font Awesome's CSS, relative to static/css/site.css.
+  'static/webfonts': [
+    '@fortawesome/fontawesome-free/webfonts/fa-solid-900.woff2',
+    '@fortawesome/fontawesome-free/webfonts/fa-solid-900.ttf',
+    '@fortawesome/fontawesome-free/webfonts/fa-brands-400.woff2',
+    '@fortawesome/fontawesome-free/webfonts/fa-brands-400.ttf',
+  ],
+  'static/fonts': [
+    '@fontsource-variable/inter/files/inter-latin-wght-normal.woff2',
+    '@fontsource-variable/inter/files/inter-latin-ext-wght-normal.woff2',
+  ],
+};
+
+for (const [dest, files] of Object.entries(FONTS)) {
+  fs.mkdirSync(path.join(root, dest), { recursive: true });
+  for (const file of files) {
+    fs.copyFileSync(path.join(modules, file), path.join(root, dest, path.basename(file)));
+  }
+}
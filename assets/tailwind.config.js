@@ -0,0 +1,16 @@
+// Only classes that appear in these files end up in static/css/site.css.
+module.exports = {
+  content: [
+    './templates/**/*.html',
+    './*_app/forms.py',
+  ],
+  theme: {
+    extend: {
+      colors: {
+        primary: { 50: '#eef2ff', 100: '#e0e7ff', 500: '#6366f1', 600: '#4f46e5', 700: '#4338ca', 900: '#312e81' },
+        accent: { 400: '#34d399', 500: '#10b981', 600: '#059669' },
+      },
+      fontFamily: { sans: ['Inter', 'system-ui', 'sans-serif'] },
+    },
+  },
+};
@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import ContactMessage
+from django.db import transaction
+from django.utils import timezone
+from accounts_app import stats
+from .models import ContactMessage, OutboundEmail
 
 
 @admin.register(ContactMessage)
@@ -12,10 +15,31 @@ class ContactMessageAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at']
     actions = ['mark_as_read', 'mark_as_unread']
 
+    # update() skips the model signals, so adjust the unread counter by the rows that changed.
     def mark_as_read(self, request, queryset):
-        queryset.update(is_read=True)
+        with transaction.atomic():
+            changed = queryset.filter(is_read=False).update(is_read=True)
+            stats.adjust(**{stats.UNREAD: -changed})
     mark_as_read.short_description = 'Mark selected messages as read'
 
     def mark_as_unread(self, request, queryset):
-        queryset.update(is_read=False)
+        with transaction.atomic():
+            changed = queryset.filter(is_read=True).update(is_read=False)
+            stats.adjust(**{stats.UNREAD: changed})
     mark_as_unread.short_description = 'Mark selected messages as unread'
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'status', 'attempts', 'next_attempt_at', 'created_at', 'sent_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['subject', 'recipients']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'sent_at', 'last_error']
+    actions = ['requeue']
+
+    def requeue(self, request, queryset):
+        queryset.exclude(status=OutboundEmail.STATUS_SENT).update(
+            status=OutboundEmail.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now(),
+        )
+    requeue.short_description = 'Requeue selected unsent emails'
@@ -0,0 +1,34 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from contact_app.outbox import send_queued_batch
+
+
+class Command(BaseCommand):
+    help = 'Send queued outbound emails in batches, retrying failures with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--max-attempts', type=int, default=settings.MAIL_QUEUE_MAX_ATTEMPTS)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new mail')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds to sleep when the queue is empty')
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        try:
+            while True:
+                sent, failed = send_queued_batch(options['batch_size'], options['max_attempts'])
+                total_sent += sent
+                total_failed += failed
+                if sent or failed:
+                    self.stdout.write(f'Sent {sent}, failed {failed}')
+                    continue
+                if not options['loop']:
+                    break
+                # Long-running loop: apply CONN_MAX_AGE/health checks like a request would.
+                close_old_connections()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f'Done: {total_sent} sent, {total_failed} failed'))
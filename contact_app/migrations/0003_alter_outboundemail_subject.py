@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-17 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact_app', '0002_outboundemail'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboundemail',
+            name='subject',
+            field=models.TextField(),
+        ),
+    ]
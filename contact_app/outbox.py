@@ -0,0 +1,115 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def build_contact_emails(contact_msg):
+    """The admin notification and the sender's confirmation for a contact message."""
+    subject = contact_msg.subject or 'N/A'
+    notification = OutboundEmail(
+        subject=f'[Portfolio Contact] {contact_msg.subject or "New Message"} from {contact_msg.name}',
+        body=(
+            f'You received a new contact message.\n\n'
+            f'Name: {contact_msg.name}\n'
+            f'Email: {contact_msg.email}\n'
+            f'Subject: {subject}\n\n'
+            f'Message:\n{contact_msg.message}'
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipients=[settings.ADMIN_EMAIL],
+    )
+    confirmation = OutboundEmail(
+        subject='Thanks for reaching out!',
+        body=(
+            f'Hi {contact_msg.name},\n\n'
+            f'Thank you for your message! I have received it and will get back to you as soon as possible.\n\n'
+            f'Here is a copy of what you sent:\n'
+            f'---\n'
+            f'Subject: {subject}\n'
+            f'{contact_msg.message}\n'
+            f'---\n\n'
+            f'Best regards,\n'
+            f'Portfolio Team'
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipients=[contact_msg.email],
+    )
+    return [notification, confirmation]
+
+
+def queue_contact_emails(contact_msg):
+    """Queue both contact emails with a single INSERT; send_queued_mail delivers them."""
+    return OutboundEmail.objects.bulk_create(build_contact_emails(contact_msg))
+
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2x base, 4x base, ... capped at one hour."""
+    return timedelta(seconds=min(settings.MAIL_QUEUE_RETRY_BACKOFF * 2 ** (attempts - 1), 3600))
+
+
+def send_queued_batch(batch_size=50, max_attempts=None):
+    """
+    Send up to ``batch_size`` due emails over one SMTP connection.
+    Returns (sent, failed). Rows are locked with SKIP LOCKED, so several
+    workers can drain the queue without sending anything twice.
+    """
+    max_attempts = max_attempts or settings.MAIL_QUEUE_MAX_ATTEMPTS
+    now = timezone.now()
+    sent = failed = 0
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+        if not batch:
+            return sent, failed
+
+        connection = get_connection()
+        try:
+            connection.open()
+            open_error = None
+        except Exception as e:
+            open_error = e
+
+        for email in batch:
+            email.attempts += 1
+            try:
+                if open_error:
+                    raise open_error
+                EmailMessage(
+                    subject=email.subject,
+                    body=email.body,
+                    from_email=email.from_email,
+                    to=email.recipients,
+                    connection=connection,
+                ).send()
+            except Exception as e:
+                failed += 1
+                email.last_error = f'{type(e).__name__}: {e}'
+                if email.attempts >= max_attempts:
+                    email.status = OutboundEmail.STATUS_DEAD
+                    logger.error('Dead-lettered email %s after %s attempts: %s', email.pk, email.attempts, e)
+                else:
+                    email.next_attempt_at = now + retry_delay(email.attempts)
+                    logger.warning('Failed to send email %s (attempt %s): %s', email.pk, email.attempts, e)
+            else:
+                sent += 1
+                email.status = OutboundEmail.STATUS_SENT
+                email.sent_at = timezone.now()
+                email.last_error = ''
+
+        if not open_error:
+            connection.close()
+        OutboundEmail.objects.bulk_update(
+            batch, ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at'],
+        )
+    return sent, failed
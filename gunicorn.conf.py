@@ -0,0 +1,106 @@
+"""
+Gunicorn configuration, picked up automatically from the working directory
+(or pass `-c gunicorn.conf.py`). Every value can be overridden from the
+environment; see the Deployment section of the README.
+
+    GUNICORN_WORKER_CLASS  sync (default) | gthread | gevent | uvicorn
+    GUNICORN_WORKERS       default 2 x CPUs + 1
+    GUNICORN_THREADS       threads per gthread worker (default 4)
+    GUNICORN_PRELOAD       load the app once in the master (default true)
+"""
+import multiprocessing
+import os
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'gevent': 'gevent',  # pip install gevent
+    'uvicorn': 'uvicorn.workers.UvicornWorker',
+}
+
+
+def _env(name, default):
+    return os.environ.get(name, default)
+
+
+def _flag(name, default):
+    return _env(name, str(default)).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+_worker_class = _env('GUNICORN_WORKER_CLASS', 'sync').strip().lower()
+if _worker_class not in WORKER_CLASSES:
+    raise RuntimeError(f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}')
+
+if _worker_class == 'uvicorn':
+    # Async read views, and no persistent connections: under ASGI each request
+    # runs its queries in a thread of its own (DB_POOL=True shares connections).
+    os.environ.setdefault('ASYNC_VIEWS', 'True')
+    os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
+wsgi_app = 'portfolio_site.asgi:application' if _worker_class == 'uvicorn' else 'portfolio_site.wsgi:application'
+bind = _env('GUNICORN_BIND', f'0.0.0.0:{_env("PORT", "8000")}')
+worker_class = WORKER_CLASSES[_worker_class]
+workers = int(_env('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(_env('GUNICORN_THREADS', 4 if _worker_class == 'gthread' else 1))
+worker_connections = int(_env('GUNICORN_WORKER_CONNECTIONS', 1000))
+preload_app = _flag('GUNICORN_PRELOAD', True)
+
+timeout = int(_env('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(_env('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(_env('GUNICORN_KEEPALIVE', 5))
+# Recycle workers now and then to bound memory growth; jitter avoids restarting all at once.
+max_requests = int(_env('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = int(_env('GUNICORN_MAX_REQUESTS_JITTER', 200))
+# Heartbeat files on tmpfs; a disk-backed /tmp in containers can stall workers.
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+accesslog = _env('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = _env('GUNICORN_LOG_LEVEL', 'info')
+
+
+def _warm_up(log, requests=True):
+    if not _flag('GUNICORN_WARMUP', True):
+        return
+    try:
+        from portfolio_site.warmup import warm_up
+        warm_up(requests=requests)
+    except Exception:
+        log.exception('Warm-up failed; serving cold')
+
+
+def _check_cache(log):
+    # Shared state goes to the database cache table, but with locmem every worker
+    # still renders and caches each public page for itself.
+    from decouple import config
+    if workers > 1 and config('CACHE_BACKEND', default='locmem') == 'locmem':
+        log.warning('CACHE_BACKEND=locmem with %d workers: each worker keeps its own page cache; '
+                    'set CACHE_BACKEND=redis to share it', workers)
+
+
+def when_ready(server):
+    _check_cache(server.log)
+    # With preload the app is already imported here, before any worker forks.
+    # Only code and templates: caches filled here would be inherited by every
+    # worker, even ones forked hours later, and never see invalidations since.
+    if preload_app:
+        _warm_up(server.log, requests=False)
+
+
+_inherited_connections = []
+
+
+def post_fork(server, worker):
+    # Connections must never cross a fork. warm_up() closes its own, but drop
+    # anything else the master opened. Keeping a reference stops the driver
+    # from closing (and so terminating) a socket the master still owns.
+    from django.db import connections
+    for conn in connections.all(initialized_only=True):
+        if conn.connection is not None:
+            _inherited_connections.append(conn.connection)
+            conn.connection = None
+
+
+def post_worker_init(worker):
+    # The warm-up requests fill this worker's own caches.
+    _warm_up(worker.log)
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['name', 'status', 'attempts', 'run_after', 'created_at', 'finished_at']
+    list_filter = ['status', 'name', 'created_at']
+    search_fields = ['name']
+    ordering = ['-created_at']
+    readonly_fields = ['created_at', 'finished_at', 'locked_at', 'last_error']
+    actions = ['retry']
+
+    def retry(self, request, queryset):
+        queryset.exclude(status=Job.STATUS_DONE).update(
+            status=Job.STATUS_PENDING, attempts=0, run_after=timezone.now(), locked_at=None,
+        )
+    retry.short_description = 'Retry selected unfinished jobs'
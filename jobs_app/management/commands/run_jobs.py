@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+from jobs_app.queue import claim_batch, run_job
+
+
+def _init_worker():
+    # Forked children must not reuse the parent's database sockets; spawned
+    # children (macOS, Windows) need Django set up from scratch.
+    import django
+    django.setup()
+    connections.close_all()
+
+
+def _run(pk):
+    try:
+        return run_job(pk)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs (image processing, ...) across a pool of worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=settings.JOBS_WORKER_PROCESSES,
+                            help='Worker processes; 0 runs jobs in this process')
+        parser.add_argument('--batch-size', type=int, default=20)
+        parser.add_argument('--loop', action='store_true', help='Keep polling for new jobs')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds to sleep when the queue is empty')
+
+    def handle(self, *args, **options):
+        processes = options['processes']
+        pool = None
+        if processes > 0:
+            connections.close_all()
+            pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker)
+        run = pool.map if pool else map
+        total_done = total_failed = 0
+        try:
+            while True:
+                ids = claim_batch(options['batch_size'])
+                if ids:
+                    results = list(run(_run if pool else run_job, ids))
+                    done = sum(results)
+                    total_done += done
+                    total_failed += len(results) - done
+                    self.stdout.write(f'Ran {len(results)} jobs, {len(results) - done} failed')
+                    continue
+                if not options['loop']:
+                    break
+                # Long-running loop: apply CONN_MAX_AGE/health checks like a request would.
+                close_old_connections()
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if pool:
+                pool.shutdown()
+        self.stdout.write(self.style.SUCCESS(f'Done: {total_done} succeeded, {total_failed} failed'))
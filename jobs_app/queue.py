@@ -0,0 +1,109 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from portfolio_site.db.routers import pin_primary
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+def register(name):
+    """Register the decorated function as the handler for jobs called ``name``."""
+    def decorator(func):
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+def get_handler(name):
+    return _handlers[name]
+
+
+def enqueue(name, **payload):
+    """
+    Queue ``name(**payload)`` for the run_jobs worker. A pending job with the
+    same name and payload is reused, so repeated saves do not pile up work.
+    Handlers must be idempotent: a job may run again after a crash or retry.
+    """
+    if settings.JOBS_RUN_INLINE:
+        transaction.on_commit(lambda: get_handler(name)(**payload))
+        return None
+    existing = Job.objects.filter(name=name, payload=payload, status=Job.STATUS_PENDING).first()
+    if existing:
+        return existing
+    return Job.objects.create(name=name, payload=payload)
+
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2x base, 4x base, ... capped at one hour."""
+    return timedelta(seconds=min(settings.JOBS_RETRY_BACKOFF * 2 ** (attempts - 1), 3600))
+
+
+def claim_batch(batch_size=20, max_attempts=None):
+    """
+    Mark up to ``batch_size`` due jobs as running and return their ids. Rows are
+    locked with SKIP LOCKED, so several workers never claim the same job. Jobs
+    left running longer than JOBS_LEASE_TIMEOUT (a crashed worker) are reclaimed.
+    The attempt is counted here rather than after the handler returns, so a job
+    that kills its worker still runs out of attempts.
+    """
+    max_attempts = max_attempts or settings.JOBS_MAX_ATTEMPTS
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.JOBS_LEASE_TIMEOUT)
+    with transaction.atomic():
+        rows = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=Job.STATUS_PENDING, run_after__lte=now)
+                | Q(status=Job.STATUS_RUNNING, locked_at__lt=stale)
+            )
+            .order_by('run_after', 'id')
+            .values_list('pk', 'status', 'attempts')[:batch_size]
+        )
+        lost = [pk for pk, status, attempts in rows if status == Job.STATUS_RUNNING and attempts >= max_attempts]
+        if lost:
+            Job.objects.filter(pk__in=lost).update(
+                status=Job.STATUS_FAILED, locked_at=None, finished_at=now,
+                last_error='Lease expired: the worker died during the last attempt.',
+            )
+            logger.error('Jobs %s failed: their worker died on the last attempt', lost)
+        ids = [pk for pk, status, attempts in rows if pk not in lost]
+        Job.objects.filter(pk__in=ids).update(
+            status=Job.STATUS_RUNNING, locked_at=now, attempts=F('attempts') + 1,
+        )
+    return ids
+
+
+@pin_primary()
+def run_job(pk, max_attempts=None):
+    """Run one job claimed by claim_batch() and record the outcome. Returns True on success."""
+    max_attempts = max_attempts or settings.JOBS_MAX_ATTEMPTS
+    job = Job.objects.get(pk=pk)
+    try:
+        get_handler(job.name)(**job.payload)
+    except Exception as e:
+        job.last_error = f'{type(e).__name__}: {e}'
+        if job.attempts >= max_attempts:
+            job.status = Job.STATUS_FAILED
+            job.finished_at = timezone.now()
+            logger.error('Job %s %s failed after %s attempts: %s', job.pk, job.name, job.attempts, e)
+        else:
+            job.status = Job.STATUS_PENDING
+            job.run_after = timezone.now() + retry_delay(job.attempts)
+            logger.warning('Job %s %s failed (attempt %s): %s', job.pk, job.name, job.attempts, e)
+        ok = False
+    else:
+        job.status = Job.STATUS_DONE
+        job.finished_at = timezone.now()
+        job.last_error = ''
+        ok = True
+    job.locked_at = None
+    job.save(update_fields=['status', 'run_after', 'locked_at', 'last_error', 'finished_at'])
+    return ok
@@ -0,0 +1,77 @@
+"""
+Helpers for the async read views served when ASYNC_VIEWS is on (uvicorn
+workers). Django 4.2's condition() and csrf_exempt() only wrap sync views, and
+request.user loads lazily through the sync ORM, so the async views use these
+instead.
+"""
+import datetime
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def _validators(request, etag_func, last_modified_func, args, kwargs):
+    last_modified = None
+    if last_modified_func:
+        dt = last_modified_func(request, *args, **kwargs)
+        if dt:
+            if not timezone.is_aware(dt):
+                dt = timezone.make_aware(dt, datetime.timezone.utc)
+            last_modified = int(dt.timestamp())
+    etag = etag_func(request, *args, **kwargs) if etag_func else None
+    return (quote_etag(etag) if etag is not None else None), last_modified
+
+
+def async_condition(etag_func=None, last_modified_func=None):
+    """django.views.decorators.http.condition() for coroutine views."""
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            # The validator functions use the cache and ORM synchronously.
+            etag, last_modified = await sync_to_async(_validators)(
+                request, etag_func, last_modified_func, args, kwargs,
+            )
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+            if request.method in SAFE_METHODS:
+                if last_modified and not response.has_header('Last-Modified'):
+                    response.headers['Last-Modified'] = http_date(last_modified)
+                if etag:
+                    response.headers.setdefault('ETag', etag)
+            return response
+        return inner
+    return decorator
+
+
+def reads_async(sync_view):
+    """
+    Serve GET/HEAD with the decorated coroutine and every other method with
+    ``sync_view`` (e.g. the DRF view that also handles writes for the URL).
+    """
+    sync_handler = sync_to_async(sync_view)
+
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            if request.method in SAFE_METHODS:
+                return await view(request, *args, **kwargs)
+            return await sync_handler(request, *args, **kwargs)
+        inner.csrf_exempt = getattr(sync_view, 'csrf_exempt', False)
+        return inner
+    return decorator
+
+
+def _load_user(request):
+    request.user.is_authenticated  # evaluates the lazy object
+    return request.user
+
+
+async def resolve_user(request):
+    """Load request.user up front so rendering never touches the sync ORM."""
+    return await sync_to_async(_load_user)(request)
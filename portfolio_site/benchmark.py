@@ -0,0 +1,291 @@
+"""
+Throughput/latency benchmarks for the public views and API endpoints.
+
+Run through `python manage.py benchmark`, which seeds a throwaway test database
+at each requested volume, drives every scenario through the Django test client
+or a raw WSGI loop, and reports req/s, latency percentiles and queries per
+request as JSON.
+"""
+import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import cycle
+
+import django
+from django.contrib.auth.models import User
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection, connections
+from django.test import Client, RequestFactory
+from django.utils import timezone
+
+from accounts_app import stats
+from accounts_app.models import Profile
+from api_app.serializers import ProjectRowSerializer, ProjectSerializer
+from projects_app.models import Project, TechTag
+from projects_app.signals import invalidate_project_caches
+from .metrics import percentile
+
+TECH_POOL = [
+    'Python', 'Django', 'PostgreSQL', 'Redis', 'Docker', 'React', 'TypeScript', 'Go',
+    'Rust', 'Kubernetes', 'Celery', 'GraphQL', 'Tailwind', 'Nginx', 'AWS', 'Flask',
+]
+CONTACT_FORM = {
+    'name': 'Benchmark Visitor',
+    'email': 'bench@example.com',
+    'subject': 'Benchmark',
+    'message': 'A benchmark contact message with enough characters to validate.',
+}
+CSRF_TOKEN = 'b' * 32
+
+
+# ─── Seeding ─────────────────────────────────────────────────────────────────
+
+def seed(volume, batch_size=1000):
+    """Top the Project table up to ``volume`` rows and make sure the owner profile exists."""
+    owner = User.objects.filter(is_superuser=True).first()
+    if owner is None:
+        owner = User.objects.create_superuser('bench-owner', 'owner@example.com', 'BenchOwnerPass123!')
+        Profile.objects.filter(user=owner).update(
+            name='Bench Owner', bio='Portfolio owner used by the benchmark suite.', skills=', '.join(TECH_POOL[:6]),
+        )
+
+    existing = Project.objects.count()
+    tags = {tag.normalized_name: tag for tag in TechTag.objects.ensure(TECH_POOL)}
+    through = Project.tags.through
+    for start in range(existing, volume, batch_size):
+        stop = min(start + batch_size, volume)
+        projects = []
+        for i in range(start, stop):
+            stack = [TECH_POOL[(i + k * 5) % len(TECH_POOL)] for k in range(4)]
+            projects.append(Project(
+                title=f'Benchmark Project {i}',
+                slug=f'benchmark-project-{i}',
+                short_description=f'Seeded project number {i} for benchmarking.',
+                description=' '.join([f'Benchmark project {i} built with {", ".join(stack)}.'] * 8),
+                tech_stack=', '.join(stack),
+                tech_list=stack,
+                is_featured=i % 10 == 0,
+                order=i % 7,
+            ))
+        created = Project.objects.bulk_create(projects)
+        through.objects.bulk_create([
+            through(project_id=project.pk, techtag_id=tags[TechTag.normalize(name)].pk)
+            for project in created for name in project.get_tech_list()
+        ], ignore_conflicts=True)
+    Project.objects.filter(search_vector__isnull=True).update_search_vector()
+    # bulk_create bypasses the model signals that normally invalidate cached pages
+    # and keep the dashboard counters current.
+    invalidate_project_caches()
+    stats.rebuild()
+    return Project.objects.count()
+
+
+# ─── Scenarios ───────────────────────────────────────────────────────────────
+
+def scenarios():
+    """(name, method, paths, data) for every benchmarked endpoint."""
+    slugs = list(Project.objects.order_by('-created_at').values_list('slug', flat=True)[:50])
+    return [
+        ('home', 'GET', ['/'], None),
+        ('projects_list', 'GET', ['/projects/'], None),
+        ('projects_list_filtered', 'GET', ['/projects/?tech=django'], None),
+        ('project_detail', 'GET', [f'/projects/{slug}/' for slug in slugs], None),
+        ('api_projects_list', 'GET', ['/api/projects/'], None),
+        ('api_project_detail', 'GET', [f'/api/projects/{slug}/' for slug in slugs], None),
+        ('api_profile', 'GET', ['/api/profile/'], None),
+        ('contact_post', 'POST', ['/contact/'], CONTACT_FORM),
+        ('api_contact_post', 'POST', ['/api/contact/'], CONTACT_FORM),
+    ]
+
+
+class ClientDriver:
+    name = 'client'
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def _client(self):
+        if not hasattr(self.local, 'client'):
+            self.local.client = Client()
+        return self.local.client
+
+    def request(self, method, path, data):
+        client = self._client()
+        response = client.post(path, data) if method == 'POST' else client.get(path)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response.status_code
+
+
+class WSGIDriver:
+    """Calls the WSGI application directly, as a server worker would."""
+    name = 'wsgi'
+
+    def __init__(self):
+        self.application = WSGIHandler()
+        self.factory = RequestFactory()
+
+    def request(self, method, path, data):
+        if method == 'POST':
+            # Unlike the test client, a real handler enforces CSRF; send a matching cookie and token.
+            environ = self.factory.post(
+                path, {**data, 'csrfmiddlewaretoken': CSRF_TOKEN}, HTTP_COOKIE=f'csrftoken={CSRF_TOKEN}',
+            ).environ
+        else:
+            environ = self.factory.get(path).environ
+        status = []
+        body = self.application(environ, lambda s, headers, exc_info=None: status.append(s))
+        try:
+            for _ in body:
+                pass
+        finally:
+            if hasattr(body, 'close'):
+                body.close()
+        return int(status[0].split()[0])
+
+
+DRIVERS = {'client': ClientDriver, 'wsgi': WSGIDriver}
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self.lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+
+def run_scenario(driver, method, paths, data, requests=200, warmup=5, concurrency=1):
+    targets = cycle(paths)
+    for _ in range(warmup):
+        driver.request(method, next(targets), data)
+
+    counter = QueryCounter()
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(path):
+        nonlocal errors
+        with ExitStack() as stack:
+            for conn in connections.all():
+                stack.enter_context(conn.execute_wrapper(counter))
+            start = time.perf_counter()
+            status = driver.request(method, path, data)
+            elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if status >= 400:
+                errors += 1
+
+    paths_to_hit = [next(targets) for _ in range(requests)]
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, paths_to_hit))
+    else:
+        for path in paths_to_hit:
+            one(path)
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': errors,
+        'rps': round(requests / wall, 2) if wall else 0.0,
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'queries_per_request': round(counter.count / requests, 2),
+    }
+
+
+def serialization(volume, repeat=3):
+    """
+    Best-of-``repeat`` time to fetch and serialize ``volume`` projects with the
+    full ProjectSerializer and with the ProjectRowSerializer list fast path.
+    """
+    request = RequestFactory().get('/api/projects/')
+    queryset = Project.objects.order_by('-created_at', '-id')[:volume]
+
+    def full():
+        return ProjectSerializer(list(queryset), many=True, context={'request': request}).data
+
+    def rows():
+        serializer = ProjectRowSerializer(request)
+        return serializer.serialize(serializer.values(queryset))
+
+    timings = {}
+    for name, func in [('full', full), ('rows', rows)]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[f'{name}_ms'] = round(best * 1000, 2)
+    timings['speedup'] = round(timings['full_ms'] / timings['rows_ms'], 2) if timings['rows_ms'] else 0.0
+    return timings
+
+
+def run(volumes, requests=200, warmup=5, driver='client', concurrency=1, only=None, progress=None,
+        serialization_volumes=()):
+    """
+    Seed each volume in turn and benchmark every scenario against it. With
+    ``serialization_volumes``, also time list serialization at those row counts.
+    """
+    report = {
+        'meta': {
+            'timestamp': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'driver': driver,
+            'requests': requests,
+            'concurrency': concurrency,
+        },
+        'results': {},
+    }
+    bench_driver = DRIVERS[driver]()
+    for volume in sorted(volumes):
+        seed(volume)
+        results = report['results'][str(volume)] = {}
+        for name, method, paths, data in scenarios():
+            if only and name not in only:
+                continue
+            results[name] = run_scenario(bench_driver, method, paths, data, requests, warmup, concurrency)
+            if progress:
+                progress(volume, name, results[name])
+    for volume in sorted(serialization_volumes):
+        seed(volume)
+        report.setdefault('serialization', {})[str(volume)] = serialization(volume)
+    return report
+
+
+def compare(report, baseline, tolerance=0.2):
+    """
+    List regressions of ``report`` against ``baseline``: throughput or p95 worse
+    than ``tolerance`` (a fraction), or any increase in queries per request.
+    """
+    regressions = []
+    for volume, scenarios_ in report['results'].items():
+        for name, current in scenarios_.items():
+            previous = baseline.get('results', {}).get(volume, {}).get(name)
+            if previous is None:
+                continue
+            label = f'{name}@{volume}'
+            if current['rps'] < previous['rps'] * (1 - tolerance):
+                regressions.append(f"{label}: rps {current['rps']} < baseline {previous['rps']}")
+            if current['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+                regressions.append(f"{label}: p95 {current['p95_ms']}ms > baseline {previous['p95_ms']}ms")
+            if current['queries_per_request'] > previous['queries_per_request']:
+                regressions.append(
+                    f"{label}: {current['queries_per_request']} queries/request "
+                    f"> baseline {previous['queries_per_request']}"
+                )
+    return regressions
@@ -0,0 +1,161 @@
+"""
+Response compression, negotiated per request: Brotli when the client accepts it
+(and the Brotli package is installed), otherwise gzip.
+
+Unlike django.middleware.gzip.GZipMiddleware, streamed responses are flushed
+after every chunk, so a page streamed by portfolio_site.streaming reaches the
+browser while the rest is still rendering. Static files never get here:
+WhiteNoise (or nginx) serves their precompressed copies.
+
+Every compressed body, buffered or streamed, starts with up to PADDING_MAX_BYTES
+of random-length padding that decoders skip, like compress_string(...,
+max_random_bytes=100), against BREACH-style length probing.
+"""
+import gzip
+import secrets
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip only
+    brotli = None
+
+# Fast enough to run per response and still smaller than gzip -6.
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+MIN_LENGTH = 200
+PADDING_MAX_BYTES = 100
+COMPRESSIBLE_TYPES = {
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+}
+
+
+def negotiate(accept_encoding):
+    """The coding to use for an Accept-Encoding header: 'br', 'gzip' or None."""
+    weights = {}
+    for part in accept_encoding.split(','):
+        coding, *params = [p.strip() for p in part.split(';')]
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if coding:
+            weights[coding.lower()] = weight
+    available = ('br', 'gzip') if brotli is not None else ('gzip',)
+    # Highest weight wins; ties go to the first, i.e. Brotli.
+    best = max(available, key=lambda c: weights.get(c, weights.get('*', 0.0)))
+    return best if weights.get(best, weights.get('*', 0.0)) > 0 else None
+
+
+def is_compressible(response):
+    content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+    return (
+        content_type.startswith('text/')
+        or content_type in COMPRESSIBLE_TYPES
+        or content_type.endswith(('+json', '+xml'))
+    )
+
+
+def _padded(coding, start):
+    # start is the stream's header, flushed to a byte boundary before any content.
+    length = secrets.randbelow(PADDING_MAX_BYTES)
+    if coding == 'br':
+        if not length:
+            return start
+        # A metadata meta-block (RFC 7932, 9.2): ISLAST=0, MNIBBLES=0, one MSKIPLEN byte.
+        return start + bytes([0x16 | ((length - 1) & 3) << 6, (length - 1) >> 2]) + b'a' * length
+    # The random file name compress_string() puts in the gzip header.
+    header = bytearray(start[:10])
+    header[3] |= gzip.FNAME
+    return bytes(header) + b'a' * length + b'\x00' + start[10:]
+
+
+def _compressor(coding):
+    if coding == 'br':
+        compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+        process, flush, finish = compressor.process, compressor.flush, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        process, flush, finish = compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+    return _padded(coding, flush()), process, flush, finish
+
+
+def compress(content, coding):
+    start, process, flush, finish = _compressor(coding)
+    return start + process(content) + finish()
+
+
+def compress_chunks(chunks, coding):
+    start, process, flush, finish = _compressor(coding)
+    yield start
+    for chunk in chunks:
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
+
+
+async def acompress_chunks(chunks, coding):
+    start, process, flush, finish = _compressor(coding)
+    yield start
+    async for chunk in chunks:
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
+
+
+class CompressionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        # Under ASGI (ASYNC_VIEWS) without a sync hop; compressing needs no I/O.
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or not is_compressible(response):
+            return response
+        if not response.streaming and len(response.content) < MIN_LENGTH:
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if coding is None:
+            return response
+
+        if response.streaming:
+            content = response.streaming_content
+            response.streaming_content = (
+                acompress_chunks(content, coding) if response.is_async else compress_chunks(content, coding)
+            )
+            del response.headers['Content-Length']
+        else:
+            compressed = compress(response.content, coding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # The compressed body is a different representation, so a strong ETag becomes weak.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = coding
+        return response
@@ -0,0 +1,163 @@
+"""
+PostgreSQL backend that borrows connections from an in-process psycopg2 pool.
+
+Django 4.2 has no built-in pool, and CONN_MAX_AGE pins one connection to each
+thread for its whole life. With threaded or async workers that means either a
+connection per thread or a fresh TLS handshake per request. Here closing a
+connection (at the end of every request, since CONN_MAX_AGE must be 0) just
+hands it back to a per-process pool shared by all threads.
+
+Enable with DB_POOL=True (see settings.py); sizes come from DATABASES['POOL'].
+"""
+import os
+import threading
+import time
+
+import psycopg2
+import psycopg2.extras
+from psycopg2 import extensions
+from psycopg2.pool import ThreadedConnectionPool
+
+from django.db import OperationalError
+from django.db.backends.postgresql import base, creation
+from portfolio_site import metrics
+
+DEFAULT_POOL = {'MIN_SIZE': 1, 'MAX_SIZE': 10, 'TIMEOUT': 10, 'CHECK_AFTER': 30}
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool:
+    def __init__(self, conn_params, min_size, max_size, timeout, check_after):
+        self.timeout = timeout
+        self.check_after = check_after
+        self.max_size = max_size
+        self._pool = ThreadedConnectionPool(min_size, max_size, **conn_params)
+        # ThreadedConnectionPool raises when exhausted; make callers wait instead.
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._returned_at = {}
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.checkouts = 0
+        self.discarded = 0
+
+    def getconn(self):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise OperationalError(f'Timed out after {self.timeout}s waiting for a pooled database connection')
+        try:
+            while True:
+                connection = self._pool.getconn()
+                if self._usable(connection):
+                    break
+                self._pool.putconn(connection, close=True)
+                with self._lock:
+                    self.discarded += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.in_use += 1
+            self.checkouts += 1
+        return connection
+
+    def putconn(self, connection):
+        close = bool(connection.closed)
+        if not close and connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except psycopg2.Error:
+                close = True
+        if not close:
+            self._returned_at[id(connection)] = time.monotonic()
+        self._pool.putconn(connection, close=close)
+        with self._lock:
+            self.in_use -= 1
+        self._slots.release()
+
+    def _usable(self, connection):
+        if connection.closed:
+            return False
+        returned_at = self._returned_at.pop(id(connection), None)
+        if returned_at is None or time.monotonic() - returned_at < self.check_after:
+            return True
+        # Idle for a while: the server or a proxy may have dropped it.
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            if connection.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def close(self):
+        self._pool.closeall()
+
+    def stats(self):
+        return {'size': self.max_size, 'in_use': self.in_use,
+                'checkouts': self.checkouts, 'discarded': self.discarded}
+
+
+def get_pool(alias, settings_dict, conn_params):
+    # One pool per process (gunicorn forks after preload) and per target database.
+    key = (os.getpid(), alias, repr(sorted(conn_params.items())))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            options = {**DEFAULT_POOL, **settings_dict.get('POOL', {})}
+            pool = _pools[key] = ConnectionPool(
+                conn_params, options['MIN_SIZE'], options['MAX_SIZE'],
+                options['TIMEOUT'], options['CHECK_AFTER'],
+            )
+        return pool
+
+
+def close_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+def pool_stats():
+    pid = os.getpid()
+    totals = {'size': 0, 'in_use': 0, 'checkouts': 0, 'discarded': 0}
+    for (owner, _, _), pool in list(_pools.items()):
+        if owner == pid:
+            for key, value in pool.stats().items():
+                totals[key] += value
+    return totals
+
+
+metrics.register_stats('db_pool', pool_stats)
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Pooled connections to the test database would block DROP DATABASE.
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def get_new_connection(self, conn_params):
+        # Mirrors the psycopg2 path of the stock backend, minus the connect().
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = (
+            base.IsolationLevel(isolation_level) if isolation_level is not None
+            else base.IsolationLevel.READ_COMMITTED
+        )
+        self._pool = get_pool(self.alias, self.settings_dict, conn_params)
+        connection = self._pool.getconn()
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._pool.putconn(self.connection)
@@ -0,0 +1,115 @@
+"""
+Primary/replica routing.
+
+Reads go to a random replica from settings.DATABASE_REPLICAS; writes, and
+anything Django reads "for write" (get_or_create, update_or_create,
+select_for_update), go to the primary. A read is pinned to the primary:
+
+- inside pin_primary() (workers, imports: anything that reads back its own writes),
+- for the whole of a non-GET request,
+- for REPLICA_PIN_SECONDS after the client's last write (db_pin cookie),
+- for every request within REPLICA_PIN_SECONDS of a public content write
+  (note_write()), so cached pages are never rebuilt from a lagging replica.
+
+With no replicas configured everything uses 'default'.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+
+PRIMARY = 'default'
+PIN_COOKIE = 'db_pin'
+LAST_WRITE_KEY = 'db:last_write'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_pinned = ContextVar('db_pinned', default=False)
+
+
+@contextmanager
+def pin_primary():
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def _marker_cache():
+    # Writes made by the job worker or another web worker must pin this one too.
+    return caches[settings.SHARED_CACHE_ALIAS]
+
+
+def note_write():
+    """Send all reads to the primary until replicas have caught up with a write."""
+    if settings.DATABASE_REPLICAS:
+        _marker_cache().set(LAST_WRITE_KEY, 1, settings.REPLICA_PIN_SECONDS)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        # The database cache table holds state shared between processes; never read it stale.
+        if not replicas or _pinned.get() or model._meta.app_label == 'django_cache':
+            return PRIMARY
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            # Follow relations on the database the instance came from.
+            return instance._state.db
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY
+
+
+class ReplicaPinMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+        pin = self._must_pin(request) or _marker_cache().get(LAST_WRITE_KEY) is not None
+        token = _pinned.set(pin)
+        try:
+            response = self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._set_cookie(request, response)
+
+    async def __acall__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+        pin = self._must_pin(request) or await _marker_cache().aget(LAST_WRITE_KEY) is not None
+        token = _pinned.set(pin)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._set_cookie(request, response)
+
+    def _must_pin(self, request):
+        return request.method not in SAFE_METHODS or PIN_COOKIE in request.COOKIES
+
+    def _set_cookie(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS,
+                                httponly=True, samesite='Lax')
+        return response
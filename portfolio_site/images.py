@@ -0,0 +1,123 @@
+"""
+Responsive image renditions for uploaded images.
+
+Each upload gets resized, re-encoded copies (WebP plus a JPEG fallback) at
+RENDITION_WIDTHS, stored next to the original. The owning model keeps a
+renditions dict like:
+
+    {'source': 'projects/cat.png', 'width': 2400, 'height': 1600,
+     'webp': {'320': 'projects/cat_320w.webp', ...},
+     'jpeg': {'320': 'projects/cat_320w.jpg', ...}}
+
+Templates build srcset attributes from it (see portfolio_site.jinja2).
+"""
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+RENDITION_WIDTHS = (320, 640, 1280)
+RENDITION_FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def rendition_name(source_name, width, extension):
+    stem, _ = os.path.splitext(source_name)
+    return f'{stem}_{width}w.{extension}'
+
+
+def _flatten(image):
+    # JPEG has no alpha channel: composite transparent images onto white.
+    from PIL import Image
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        rgba = image.convert('RGBA')
+        background = Image.new('RGB', rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def generate_renditions(field_file, widths=RENDITION_WIDTHS):
+    """Write every rendition of ``field_file`` to its storage and return the renditions dict."""
+    from PIL import Image, ImageOps
+
+    storage = field_file.storage
+    with storage.open(field_file.name, 'rb') as f:
+        image = Image.open(f)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    renditions = {'source': field_file.name, 'width': image.width, 'height': image.height}
+    # Never upscale; an image narrower than every width gets one rendition at its own width.
+    targets = [w for w in widths if w < image.width] or [image.width]
+    opaque = _flatten(image)
+    for fmt, (pil_format, extension, save_options) in RENDITION_FORMATS.items():
+        source = image if fmt == 'webp' and image.mode in ('RGBA', 'RGB') else opaque
+        renditions[fmt] = {}
+        for width in targets:
+            height = max(round(image.height * width / image.width), 1)
+            resized = source.resize((width, height), Image.LANCZOS)
+            buffer = BytesIO()
+            # Re-encoding drops EXIF (including GPS) metadata.
+            resized.save(buffer, pil_format, **save_options)
+            name = rendition_name(field_file.name, width, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            renditions[fmt][str(width)] = storage.save(name, ContentFile(buffer.getvalue()))
+    return renditions
+
+
+def delete_renditions(renditions, storage):
+    for fmt in RENDITION_FORMATS:
+        for name in (renditions or {}).get(fmt, {}).values():
+            storage.delete(name)
+
+
+def renditions_stale(instance, field_name, renditions_field):
+    field_file = getattr(instance, field_name)
+    source = field_file.name if field_file else ''
+    return (getattr(instance, renditions_field) or {}).get('source', '') != source
+
+
+def sync_renditions(instance, field_name, renditions_field, force=False):
+    """
+    Regenerate ``instance``'s renditions if its image changed since they were built.
+    Idempotent: returns False without touching storage when they are current.
+    """
+    if not force and not renditions_stale(instance, field_name, renditions_field):
+        return False
+
+    field_file = getattr(instance, field_name)
+    source = field_file.name if field_file else ''
+    delete_renditions(getattr(instance, renditions_field), field_file.storage)
+    renditions = {}
+    if source:
+        try:
+            renditions = generate_renditions(field_file)
+        except Exception as e:
+            # Unreadable uploads keep serving the original file.
+            logger.warning('Could not build renditions for %s: %s', source, e)
+            renditions = {'source': source}
+    setattr(instance, renditions_field, renditions)
+    # update() skips save() and its signals; bumping updated_at keeps ETags and
+    # Last-Modified in step with the new markup.
+    type(instance).objects.filter(pk=instance.pk).update(
+        **{renditions_field: renditions, 'updated_at': timezone.now()}
+    )
+    return True
+
+
+def rendition_urls(renditions, storage, build_url=None):
+    """{'webp': {'320': url, ...}, 'jpeg': {...}} for API responses."""
+    build_url = build_url or (lambda url: url)
+    return {
+        fmt: {width: build_url(storage.url(name)) for width, name in (renditions or {}).get(fmt, {}).items()}
+        for fmt in RENDITION_FORMATS
+        if (renditions or {}).get(fmt)
+    }
@@ -0,0 +1,113 @@
+"""
+Cold-start import profiling.
+
+Run through `python manage.py profile_imports`. Each measurement starts a fresh
+interpreter with `-X importtime`, loads the app the way a manage.py command or
+a gunicorn worker does, and parses the per-module report. Times are the best
+of several runs, which filters out disk and scheduler noise.
+"""
+import os
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+
+_SETUP = 'import django; django.setup()'
+_URLS = 'from django.urls import get_resolver; get_resolver().url_patterns'
+
+# What each kind of process imports before it can do any work.
+TARGETS = {
+    # Every manage.py command.
+    'setup': _SETUP,
+    # A command that runs the system checks (migrate, runserver, check).
+    'checks': f'{_SETUP}; from django.core import checks; checks.run_checks()',
+    # A web worker ready for its first request.
+    'wsgi': (
+        'from portfolio_site.wsgi import application; '
+        f'{_URLS}; from django.template import engines; engines.all()'
+    ),
+}
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+class ImportRecord:
+    __slots__ = ('module', 'self_us', 'cumulative_us', 'depth')
+
+    def __init__(self, module, self_us, cumulative_us, depth):
+        self.module = module
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+    @property
+    def package(self):
+        return self.module.split('.', 1)[0]
+
+
+class ImportProfile:
+    def __init__(self, target, records, runs):
+        self.target = target
+        self.records = records
+        self.runs = runs
+
+    @property
+    def total_ms(self):
+        # Top-level imports' cumulative times add up to the whole import cost.
+        return sum(r.cumulative_us for r in self.records if r.depth == 0) / 1000
+
+    def modules(self):
+        return {r.module for r in self.records}
+
+    def top(self, limit=25, key='cumulative', package=None):
+        records = [r for r in self.records if package is None or r.package == package]
+        attr = 'self_us' if key == 'self' else 'cumulative_us'
+        return sorted(records, key=lambda r: getattr(r, attr), reverse=True)[:limit]
+
+    def by_package(self):
+        """Self time summed per top-level package, in ms, largest first."""
+        totals = {}
+        for record in self.records:
+            totals[record.package] = totals.get(record.package, 0) + record.self_us
+        return sorted(((p, us / 1000) for p, us in totals.items()), key=lambda item: item[1], reverse=True)
+
+
+def parse(report):
+    """Parse `python -X importtime` stderr into ImportRecords, in import order."""
+    records = []
+    for line in report.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def _run_once(code):
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return parse(result.stderr)
+
+
+def profile(target='wsgi', runs=3):
+    """Best-of-``runs`` import times for ``target`` (see TARGETS)."""
+    best = {}
+    order = []
+    for _ in range(runs):
+        for record in _run_once(TARGETS[target]):
+            seen = best.get(record.module)
+            if seen is None:
+                best[record.module] = record
+                order.append(record.module)
+            else:
+                seen.self_us = min(seen.self_us, record.self_us)
+                seen.cumulative_us = min(seen.cumulative_us, record.cumulative_us)
+    return ImportProfile(target, [best[module] for module in order], runs)
@@ -1,18 +1,97 @@
-from jinja2 import Environment
+import logging
+import os
+import time
+from jinja2 import Environment, FileSystemBytecodeCache, Template
+from markupsafe import Markup, escape
+from django.conf import settings
 from django.templatetags.static import static
 from django.urls import reverse
 from django.contrib.messages import get_messages
+from . import metrics
+
+logger = logging.getLogger(__name__)
+_compile_stats = {'compiled': 0, 'compile_seconds': 0.0}
 
 
 def url(viewname, *args, **kwargs):
     return reverse(viewname, args=args if args else None, kwargs=kwargs if kwargs else None)
 
 
+def highlight(text):
+    # Escape search headlines, then restore only the <mark> tags added by PostgreSQL.
+    escaped = str(escape(text))
+    return Markup(escaped.replace('&lt;mark&gt;', '<mark>').replace('&lt;/mark&gt;', '</mark>'))
+
+
+def srcset(image, renditions, fmt='jpeg'):
+    # "url 320w, url 640w, ..." for the renditions of ``image`` built by portfolio_site.images,
+    # which live in the image field's storage.
+    variants = (renditions or {}).get(fmt, {})
+    return ', '.join(
+        f'{image.storage.url(name)} {width}w'
+        for width, name in sorted(variants.items(), key=lambda item: int(item[0]))
+    )
+
+
+class TimedTemplate(Template):
+    # Reports render time to the per-request metrics (see MetricsMiddleware).
+    def render(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            metrics.record_template_render(time.perf_counter() - start)
+
+
+class PortfolioEnvironment(Environment):
+    template_class = TimedTemplate
+
+    def compile(self, source, name=None, filename=None, raw=False, defer_init=False):
+        # Only runs on a bytecode cache miss; compile_templates pre-fills the cache.
+        start = time.perf_counter()
+        try:
+            return super().compile(source, name, filename, raw, defer_init)
+        finally:
+            elapsed = time.perf_counter() - start
+            _compile_stats['compiled'] += 1
+            _compile_stats['compile_seconds'] += elapsed
+            if name and not raw:
+                logger.info('Compiled template %s in %.1f ms', name, elapsed * 1000)
+
+
+def template_names(env):
+    return env.list_templates(filter_func=lambda name: name.endswith('.html'))
+
+
+def template_stats():
+    return dict(_compile_stats)
+
+
+metrics.register_stats('templates', template_stats)
+
+
+def bytecode_cache():
+    directory = settings.JINJA2_BYTECODE_CACHE_DIR
+    if not directory:
+        return None
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        logger.warning('Jinja2 bytecode cache disabled, cannot create %s: %s', directory, e)
+        return None
+    return FileSystemBytecodeCache(directory)
+
+
 def environment(**options):
-    env = Environment(**options)
+    options.setdefault('bytecode_cache', bytecode_cache())
+    env = PortfolioEnvironment(**options)
     env.globals.update({
         'static': static,
         'url': url,
         'get_messages': get_messages,
+        'srcset': srcset,
+    })
+    env.filters.update({
+        'highlight': highlight,
     })
     return env
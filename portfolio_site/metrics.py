@@ -0,0 +1,243 @@
+"""
+Per-worker request instrumentation.
+
+MetricsMiddleware records query count, DB time, new database connections,
+template render time and wall time for every request, grouped by URL name. Each metric keeps a rolling window
+of recent samples, so percentiles reflect current traffic. Other subsystems can
+publish counters with register_stats(). Everything is exposed at /api/metrics/.
+"""
+import math
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+METRICS = ('total_seconds', 'db_seconds', 'db_queries', 'db_connections', 'template_seconds')
+QUANTILES = (0.5, 0.95, 0.99)
+
+_current = ContextVar('request_timings', default=None)
+_stat_sources = {}
+_connections = {'opened': 0, 'requests_reused': 0, 'requests_connected': 0}
+_connections_lock = threading.Lock()
+
+
+class RequestTimings:
+    __slots__ = ('queries', 'db_seconds', 'connections', 'template_seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.connections = 0
+        self.template_seconds = 0.0
+
+
+def percentile(sorted_values, quantile):
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(quantile * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+class RouteStats:
+    def __init__(self, window):
+        self.count = 0
+        self.statuses = {}
+        self.samples = {metric: deque(maxlen=window) for metric in METRICS}
+
+    def add(self, status, values):
+        self.count += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        for metric, value in values.items():
+            self.samples[metric].append(value)
+
+    def summary(self):
+        data = {'count': self.count, 'statuses': dict(self.statuses)}
+        for metric, samples in self.samples.items():
+            ordered = sorted(samples)
+            data[metric] = {f'p{int(q * 100)}': percentile(ordered, q) for q in QUANTILES}
+        return data
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def record(self, route, status, values):
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = RouteStats(settings.METRICS_WINDOW)
+            stats.add(status, values)
+
+    def snapshot(self):
+        with self._lock:
+            routes = {route: stats.summary() for route, stats in self._routes.items()}
+        return {'routes': routes, 'stats': collect_stats()}
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+registry = MetricsRegistry()
+
+
+def register_stats(name, func):
+    """Publish a callable returning a dict of numeric counters under ``name``."""
+    _stat_sources[name] = func
+
+
+def collect_stats():
+    return {name: func() for name, func in sorted(_stat_sources.items())}
+
+
+def record_template_render(seconds):
+    timings = _current.get()
+    if timings is not None:
+        timings.template_seconds += seconds
+
+
+def _connection_created(sender, connection, **kwargs):
+    # Fires for every new DB connection (not for a pooled/persistent one being reused).
+    with _connections_lock:
+        _connections['opened'] += 1
+    timings = _current.get()
+    if timings is not None:
+        timings.connections += 1
+
+
+connection_created.connect(_connection_created)
+
+
+def _record_connection_reuse(timings):
+    if not timings.queries:
+        return
+    with _connections_lock:
+        _connections['requests_connected' if timings.connections else 'requests_reused'] += 1
+
+
+def connection_stats():
+    with _connections_lock:
+        stats = dict(_connections)
+    served = stats['requests_reused'] + stats['requests_connected']
+    stats['reuse_ratio'] = stats['requests_reused'] / served if served else 0.0
+    return stats
+
+
+class QueryTimer:
+    def __init__(self, timings):
+        self.timings = timings
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.timings.queries += 1
+            self.timings.db_seconds += time.perf_counter() - start
+
+
+def route_name(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return '<unresolved>'
+    return match.view_name or match.route
+
+
+def _time_queries(stack, timings):
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(QueryTimer(timings)))
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                _time_queries(stack, timings)
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._record(request, response, timings, start)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.METRICS_ENABLED:
+            return await self.get_response(request)
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        try:
+            # Async views run their queries in the request's sync thread, which
+            # has its own connections, so the timers are installed there.
+            stack = ExitStack()
+            await sync_to_async(_time_queries)(stack, timings)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+        finally:
+            _current.reset(token)
+        self._record(request, response, timings, start)
+        return response
+
+    def _record(self, request, response, timings, start):
+        _record_connection_reuse(timings)
+        registry.record(route_name(request), response.status_code, {
+            'total_seconds': time.perf_counter() - start,
+            'db_seconds': timings.db_seconds,
+            'db_queries': timings.queries,
+            'db_connections': timings.connections,
+            'template_seconds': timings.template_seconds,
+        })
+
+
+register_stats('db', connection_stats)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(snapshot):
+    """Render a snapshot() in the Prometheus text exposition format."""
+    lines = [
+        '# TYPE portfolio_requests_total counter',
+    ]
+    routes = snapshot['routes']
+    for route, data in routes.items():
+        for status, count in data['statuses'].items():
+            lines.append(f'portfolio_requests_total{{route="{_label(route)}",status="{status}"}} {count}')
+    for metric in METRICS:
+        name = f'portfolio_request_{metric}'
+        lines.append(f'# TYPE {name} summary')
+        for route, data in routes.items():
+            for quantile in QUANTILES:
+                value = data[metric][f'p{int(quantile * 100)}']
+                lines.append(f'{name}{{route="{_label(route)}",quantile="{quantile}"}} {value}')
+    for source, counters in snapshot['stats'].items():
+        for key, value in counters.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                lines.append(f'portfolio_{source}_{key} {value}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import threading
+import uuid
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from . import metrics
+
+KEY_PREFIX = 'pagecache'
+
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'bypassed': 0}
+
+
+def _cache():
+    return caches[settings.PAGE_CACHE_ALIAS]
+
+
+def _generation_cache():
+    # Pages may be cached per process; generations must be seen by all of them.
+    return caches[settings.SHARED_CACHE_ALIAS]
+
+
+def _record(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def stats():
+    """Hit/miss/bypass counters for this worker process."""
+    with _stats_lock:
+        counters = dict(_stats)
+    lookups = counters['hits'] + counters['misses']
+    counters['hit_ratio'] = counters['hits'] / lookups if lookups else 0.0
+    return counters
+
+
+metrics.register_stats('page_cache', stats)
+
+
+def reset_stats():
+    with _stats_lock:
+        for outcome in _stats:
+            _stats[outcome] = 0
+
+
+def _generation_key(dependency):
+    return f'{KEY_PREFIX}:gen:{dependency}'
+
+
+def _generations(dependencies):
+    # Generations are random tokens rather than counters, so an evicted
+    # generation can never roll back to a value an old cached page was built with.
+    cache = _generation_cache()
+    keys = [_generation_key(dep) for dep in dependencies]
+    found = cache.get_many(keys)
+    generations = []
+    for key in keys:
+        generation = found.get(key)
+        if generation is None:
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            generation = cache.get(key)
+        generations.append(str(generation))
+    return generations
+
+
+def invalidate(*dependencies):
+    """Drop every cached page that depends on any of ``dependencies``."""
+    _generation_cache().set_many({_generation_key(dep): uuid.uuid4().hex for dep in dependencies}, timeout=None)
+
+
+def _page_key(request, dependencies):
+    raw = '|'.join([request.get_host(), request.get_full_path(), *_generations(dependencies)])
+    return f'{KEY_PREFIX}:page:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def _is_cacheable_request(request):
+    if not settings.PAGE_CACHE_ENABLED or request.method not in ('GET', 'HEAD'):
+        return False
+    # Pending flash messages are rendered into the page and must not be shared.
+    if request.COOKIES.get(CookieStorage.cookie_name):
+        return False
+    return not request.user.is_authenticated
+
+
+def _is_cacheable_response(response):
+    return (
+        response.status_code == 200
+        and not (response.streaming and response.is_async)
+        and not response.cookies
+        and 'private' not in response.get('Cache-Control', '')
+    )
+
+
+def _lookup(request, dependencies):
+    """
+    Returns (key, cached_response). key is None when the request bypasses the
+    cache; cached_response is None on a miss.
+    """
+    if not _is_cacheable_request(request):
+        _record('bypassed')
+        return None, None
+    key = _page_key(request, dependencies)
+    cached = _cache().get(key)
+    if cached is None:
+        _record('misses')
+        return key, None
+    _record('hits')
+    content, status, headers = cached
+    response = HttpResponse(content, status=status)
+    for header, value in headers:
+        response[header] = value
+    response['X-Page-Cache'] = 'HIT'
+    return key, response
+
+
+def _tee(key, chunks, status, headers):
+    # Pass the streamed chunks through, caching the page once all of it has been
+    # sent; a page over PAGE_CACHE_MAX_BYTES or a client that went away is not cached.
+    content, size = [], 0
+    for chunk in chunks:
+        if content is not None:
+            size += len(chunk)
+            if size > settings.PAGE_CACHE_MAX_BYTES:
+                content = None
+            else:
+                content.append(chunk)
+        yield chunk
+    if content is not None:
+        _cache().set(key, (b''.join(content), status, headers), settings.PAGE_CACHE_TIMEOUT)
+
+
+def _store(key, response):
+    if _is_cacheable_response(response):
+        if response.streaming:
+            # Headers as the view returned them, before any middleware (compression) runs.
+            response.streaming_content = _tee(
+                key, response.streaming_content, response.status_code, list(response.items()),
+            )
+        else:
+            _cache().set(key, (response.content, response.status_code, list(response.items())),
+                         settings.PAGE_CACHE_TIMEOUT)
+        response['X-Page-Cache'] = 'MISS'
+    return response
+
+
+def cache_public_page(*dependencies):
+    """
+    Cache the rendered response of an anonymous GET, keyed by host, path and query
+    string. ``dependencies`` name the models the page is built from; saving or
+    deleting one of them (see the app signals) invalidates the page.
+    Authenticated users always get a fresh render.
+    Coroutine views get a coroutine wrapper.
+    """
+    def decorator(view_func):
+        if asyncio.iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                # The session, user and cache lookups are all synchronous.
+                key, response = await sync_to_async(_lookup)(request, dependencies)
+                if response is None:
+                    response = await view_func(request, *args, **kwargs)
+                    if key is not None:
+                        await sync_to_async(_store)(key, response)
+                return response
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            key, response = _lookup(request, dependencies)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if key is not None:
+                    _store(key, response)
+            return response
+        return wrapper
+    return decorator
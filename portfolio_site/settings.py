@@ -27,11 +27,16 @@ INSTALLED_APPS = [
     'projects_app',
     'contact_app',
     'api_app',
+    'jobs_app',
 ]
 
 MIDDLEWARE = [
+    'portfolio_site.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'portfolio_site.db.routers.ReplicaPinMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # Below WhiteNoise, which serves its own precompressed static files.
+    'portfolio_site.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -41,8 +46,20 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Serve the public reads (home, featured projects, project detail and profile
+# API) from async views. Meant for uvicorn workers, where gunicorn.conf.py turns
+# it on. WhiteNoise is sync-only and would put every request through a thread,
+# so static files are then left to nginx.
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
+if ASYNC_VIEWS:
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+
 ROOT_URLCONF = 'portfolio_site.urls'
 
+# Compiled Jinja2 templates, shared by all workers; filled at image build time by
+# `python manage.py compile_templates`. Set to an empty string to disable.
+JINJA2_BYTECODE_CACHE_DIR = config('JINJA2_BYTECODE_CACHE_DIR', default=str(BASE_DIR / '.cache' / 'jinja2'))
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.jinja2.Jinja2',
@@ -50,6 +67,8 @@ TEMPLATES = [
         'APP_DIRS': False,
         'OPTIONS': {
             'environment': 'portfolio_site.jinja2.environment',
+            # Skip the per-render mtime check in production.
+            'auto_reload': DEBUG,
         },
     },
     {
@@ -73,11 +92,14 @@ WSGI_APPLICATION = 'portfolio_site.wsgi.application'
 DATABASE_URL = os.environ.get('DATABASE_URL', '').strip()
 
 if DATABASE_URL and DATABASE_URL.startswith(('postgres', 'postgresql')):
-    _db = dj_database_url.parse(DATABASE_URL, conn_max_age=600)
+    _db = dj_database_url.parse(DATABASE_URL)
     if 'OPTIONS' not in _db:
         _db['OPTIONS'] = {}
     _db['OPTIONS'].setdefault('sslmode', 'require')
     DATABASES = {'default': _db}
+elif DATABASE_URL.startswith('sqlite'):
+    # Local benchmarking/development only, e.g. DATABASE_URL=sqlite:///db.sqlite3
+    DATABASES = {'default': dj_database_url.parse(DATABASE_URL)}
 else:
     DATABASES = {
         'default': {
@@ -93,6 +115,47 @@ else:
         }
     }
 
+# Read replicas: DATABASE_REPLICA_URLS (comma-separated URLs) or DB_REPLICA_HOSTS
+# (comma-separated hosts sharing the primary's name and credentials). Reads are
+# spread across them by portfolio_site.db.routers; writes go to 'default'.
+_replica_urls = [u.strip() for u in config('DATABASE_REPLICA_URLS', default='').split(',') if u.strip()]
+_replica_hosts = [h.strip() for h in config('DB_REPLICA_HOSTS', default='').split(',') if h.strip()]
+_replica_dbs = [dj_database_url.parse(url) for url in _replica_urls] + [
+    {**DATABASES['default'], 'HOST': host, 'OPTIONS': dict(DATABASES['default'].get('OPTIONS', {}))}
+    for host in _replica_hosts
+]
+DATABASE_REPLICAS = []
+for _i, _db in enumerate(_replica_dbs, start=1):
+    _db.setdefault('OPTIONS', {}).setdefault('sslmode', 'require')
+    _db['TEST'] = {'MIRROR': 'default'}
+    DATABASES[f'replica_{_i}'] = _db
+    DATABASE_REPLICAS.append(f'replica_{_i}')
+DATABASE_ROUTERS = ['portfolio_site.db.routers.PrimaryReplicaRouter']
+# After a write, the writer's next requests (db_pin cookie) and every public
+# page read (shared cache marker) use the primary for this long.
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=10, cast=int)
+
+# Connection handling applies to every configuration path above.
+# Persistent connections (DB_CONN_MAX_AGE seconds, None = forever) skip the
+# TLS handshake on each request; health checks drop ones the server closed.
+# DB_POOL=True instead shares a per-process psycopg2 pool across threads
+# (gthread/async workers); connections return to it after every request.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+_conn_max_age = config('DB_CONN_MAX_AGE', default='600')
+for _db in DATABASES.values():
+    _db['CONN_MAX_AGE'] = None if _conn_max_age.lower() == 'none' else int(_conn_max_age)
+    _db['CONN_HEALTH_CHECKS'] = True
+    if DB_POOL and _db['ENGINE'] == 'django.db.backends.postgresql':
+        _db.update({
+            'ENGINE': 'portfolio_site.db.pooled_postgresql',
+            'CONN_MAX_AGE': 0,
+            'POOL': {
+                'MIN_SIZE': config('DB_POOL_MIN_SIZE', default=1, cast=int),
+                'MAX_SIZE': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+                'TIMEOUT': config('DB_POOL_TIMEOUT', default=10, cast=float),
+            },
+        })
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -109,8 +172,14 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATIC_DIR = BASE_DIR / 'static'
+# static/ is the output of `npm run build` (Tailwind CSS, self-hosted fonts).
 STATICFILES_DIRS = [STATIC_DIR] if STATIC_DIR.exists() else []
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# collectstatic writes content-hashed names plus .gz and .br (with Brotli installed)
+# copies, which WhiteNoise or nginx serve with far-future caching.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -131,17 +200,101 @@ EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
 DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@portfolio.com')
 ADMIN_EMAIL = config('ADMIN_EMAIL', default='admin@portfolio.com')
 
+# Contact emails are queued in contact_app.OutboundEmail and delivered by
+# `python manage.py send_queued_mail --loop`.
+MAIL_QUEUE_MAX_ATTEMPTS = config('MAIL_QUEUE_MAX_ATTEMPTS', default=5, cast=int)
+MAIL_QUEUE_RETRY_BACKOFF = config('MAIL_QUEUE_RETRY_BACKOFF', default=60, cast=int)
+
+# ─── Background Jobs ──────────────────────────────────────────────────────────
+# Media post-processing is queued in jobs_app.Job and run by
+# `python manage.py run_jobs --loop`. JOBS_RUN_INLINE runs jobs after commit
+# in the enqueuing process instead (local development without a worker).
+JOBS_RUN_INLINE = config('JOBS_RUN_INLINE', default=False, cast=bool)
+JOBS_WORKER_PROCESSES = config('JOBS_WORKER_PROCESSES', default=os.cpu_count() or 1, cast=int)
+JOBS_MAX_ATTEMPTS = config('JOBS_MAX_ATTEMPTS', default=3, cast=int)
+JOBS_RETRY_BACKOFF = config('JOBS_RETRY_BACKOFF', default=30, cast=int)
+JOBS_LEASE_TIMEOUT = config('JOBS_LEASE_TIMEOUT', default=600, cast=int)
+
+# ─── Cache ────────────────────────────────────────────────────────────────────
+# CACHE_BACKEND: locmem (per worker, default), file, or redis (needs `pip install redis`;
+# any Redis-compatible server works, e.g. CACHE_LOCATION=redis://localhost:6379/1).
+_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'portfolio'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', str(BASE_DIR / '.cache')),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://localhost:6379/1'),
+}
+_cache_backend, _cache_location = _CACHE_BACKENDS[config('CACHE_BACKEND', default='locmem')]
+CACHES = {
+    'default': {
+        'BACKEND': _cache_backend,
+        'LOCATION': config('CACHE_LOCATION', default=_cache_location),
+        'TIMEOUT': config('CACHE_TIMEOUT', default=300, cast=int),
+        'OPTIONS': {'MAX_ENTRIES': 5000} if _cache_backend.endswith('LocMemCache') else {},
+    }
+}
+# State every process has to agree on (page cache generations, ...) goes to the
+# 'shared' alias. locmem and file caches are private to a process or container,
+# so unless the cache is Redis that is the database cache table
+# (`python manage.py createcachetable`), seen by every worker, job and command.
+CACHES['shared'] = CACHES['default'] if _cache_backend.endswith('RedisCache') else {
+    'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+    'LOCATION': 'django_cache',
+    'TIMEOUT': CACHES['default']['TIMEOUT'],
+    'OPTIONS': {'MAX_ENTRIES': 100000},
+}
+SHARED_CACHE_ALIAS = 'shared'
+
+# Rendered anonymous pages (see portfolio_site.page_cache); invalidated by model
+# signals through generations kept in SHARED_CACHE_ALIAS.
+PAGE_CACHE_ENABLED = config('PAGE_CACHE_ENABLED', default=True, cast=bool)
+PAGE_CACHE_ALIAS = 'default'
+PAGE_CACHE_TIMEOUT = config('PAGE_CACHE_TIMEOUT', default=3600, cast=int)
+# Streamed pages are copied into the cache as they are sent; larger ones are not cached.
+PAGE_CACHE_MAX_BYTES = config('PAGE_CACHE_MAX_BYTES', default=1024 * 1024, cast=int)
+
+# ─── Metrics ──────────────────────────────────────────────────────────────────
+# Per-worker request timings, served to staff at /api/metrics/ (JSON or ?format=prometheus).
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_WINDOW = config('METRICS_WINDOW', default=1024, cast=int)
+
+# ─── Dashboard ────────────────────────────────────────────────────────────────
+# Read dashboard counts from the StatCounter table instead of counting rows.
+STATS_COUNTERS = config('STATS_COUNTERS', default=True, cast=bool)
+
+# ─── Throttling ───────────────────────────────────────────────────────────────
+# Sliding-window budgets (see portfolio_site.throttle); 'login' and 'contact' are
+# per client IP, 'login_account' per username tried. Counted in the shared cache,
+# so the budgets hold across workers.
+THROTTLE_ENABLED = config('THROTTLE_ENABLED', default=True, cast=bool)
+THROTTLE_CACHE_ALIAS = SHARED_CACHE_ALIAS
+THROTTLE_RATES = {
+    'contact': config('THROTTLE_CONTACT_RATE', default='10/hour'),
+    'login': config('THROTTLE_LOGIN_RATE', default='20/min'),
+    'login_account': config('THROTTLE_LOGIN_ACCOUNT_RATE', default='5/min'),
+}
+# Trusted reverse proxies appending to X-Forwarded-For (nginx in docker-compose: 1).
+NUM_PROXIES = config('NUM_PROXIES', default=0, cast=int)
+
 # ─── REST Framework ───────────────────────────────────────────────────────────
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'api_app.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'api_app.pagination.KeysetPagination',
+    'PAGE_SIZE': 20,
+    'NUM_PROXIES': NUM_PROXIES,
 }
 
+# Resolved API tokens cached per worker (see api_app.authentication); 0 disables.
+TOKEN_AUTH_CACHE_SIZE = config('TOKEN_AUTH_CACHE_SIZE', default=1024, cast=int)
+TOKEN_AUTH_CACHE_TTL = config('TOKEN_AUTH_CACHE_TTL', default=300, cast=int)
+# Tokens older than this are rejected and replaced at the next login; 0 = never expire.
+TOKEN_EXPIRY_SECONDS = config('TOKEN_EXPIRY_SECONDS', default=0, cast=int)
+
 # ─── CORS ─────────────────────────────────────────────────────────────────────
 CORS_ALLOW_ALL_ORIGINS = config('CORS_ALLOW_ALL_ORIGINS', default=False, cast=bool)
 if not CORS_ALLOW_ALL_ORIGINS:
@@ -158,3 +311,28 @@ CSRF_TRUSTED_ORIGINS = [
 ]
 USE_X_FORWARDED_HOST = True
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+
+# ─── Gunicorn Warm-up ─────────────────────────────────────────────────────────
+# Requested once before workers take traffic (see gunicorn.conf.py, warmup.py).
+WARMUP_PATHS = [p for p in config('WARMUP_PATHS', default='/,/projects/,/api/projects/').split(',') if p]
+
+# ─── Startup ──────────────────────────────────────────────────────────────────
+# Cold-start import budget for a web worker, checked by the test suite and
+# `manage.py profile_imports`.
+IMPORT_TIME_BUDGET_MS = config('IMPORT_TIME_BUDGET_MS', default=1500, cast=int)
+
+# ─── Logging ──────────────────────────────────────────────────────────────────
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {'format': '[{asctime}] {levelname} {name}: {message}', 'style': '{'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'simple'},
+    },
+    'loggers': {
+        name: {'handlers': ['console'], 'level': config('LOG_LEVEL', default='INFO'), 'propagate': False}
+        for name in ('portfolio_site', 'projects_app', 'accounts_app', 'contact_app', 'jobs_app')
+    },
+}
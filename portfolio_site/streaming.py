@@ -0,0 +1,51 @@
+"""
+Streamed Jinja2 rendering for pages whose size grows with the data behind them.
+
+stream_template() is render() for a StreamingHttpResponse: the template is
+rendered with Template.generate() and sent in CHUNK_SIZE pieces, so the page head
+goes out while the rest is still rendering and the whole page is never held in
+memory (CompressionMiddleware compresses it chunk by chunk).
+
+The template runs after the middleware has already processed the response, so
+anything a streamed template needs from request-bound state must be settled
+before the response is returned. Flash messages are consumed up front here;
+a streamed template must not be the first thing to use the CSRF token, since
+its cookie would no longer be set.
+"""
+from django.contrib.messages import get_messages
+from django.http import StreamingHttpResponse
+from django.template import engines
+from django.template.backends.utils import csrf_input_lazy, csrf_token_lazy
+
+CHUNK_SIZE = 8192
+
+
+def _buffered(pieces, size=CHUNK_SIZE):
+    buffer, length = [], 0
+    for piece in pieces:
+        buffer.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield ''.join(buffer).encode()
+            buffer, length = [], 0
+    if buffer:
+        yield ''.join(buffer).encode()
+
+
+def stream_template(request, template_name, context=None, content_type='text/html; charset=utf-8', status=200):
+    backend = engines['jinja2']
+    template = backend.get_template(template_name).template
+    context = dict(context or {})
+    # What django.template.backends.jinja2.Template.render() adds.
+    context['request'] = request
+    context['csrf_input'] = csrf_input_lazy(request)
+    context['csrf_token'] = csrf_token_lazy(request)
+    for context_processor in backend.template_context_processors:
+        context.update(context_processor(request))
+    # Iterating marks the messages used, so MessageMiddleware clears them from
+    # storage; the template's own get_messages() still sees them.
+    list(get_messages(request))
+    response = StreamingHttpResponse(_buffered(template.generate(context)), content_type=content_type, status=status)
+    # Tell nginx to pass the chunks on as they come instead of buffering the page.
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,152 @@
+"""
+Sliding-window rate limits for the unauthenticated write endpoints (contact
+form, logins). Counters live in THROTTLE_CACHE_ALIAS, the shared cache (Redis,
+or the database cache table), so the budget holds across all workers rather
+than per worker. The database cache increments by read-then-write, so under
+heavy concurrency a few requests can slip past the limit; Redis is exact.
+
+Each rule counts requests per identity (client IP or posted username) in
+fixed windows. The current window plus the unexpired share of the previous one
+approximates a true sliding window in two cache keys. Over-budget requests get
+429 with Retry-After before the view parses or validates anything; rejections
+are a single cache read. Budgets live in settings.THROTTLE_RATES.
+"""
+import hashlib
+import json
+import math
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, JsonResponse
+from .metrics import register_stats
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+_counts = {}
+_counts_lock = threading.Lock()
+
+
+def parse_rate(rate):
+    """'5/min' -> (5, 60), like DRF's rate strings."""
+    limit, period = rate.split('/')
+    return int(limit), PERIODS[period[0]]
+
+
+def client_ip(request):
+    # With NUM_PROXIES trusted proxies in front, the client is that many hops from the end of X-Forwarded-For.
+    if settings.NUM_PROXIES:
+        forwarded = [a.strip() for a in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if a.strip()]
+        if forwarded:
+            return forwarded[-min(settings.NUM_PROXIES, len(forwarded))]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def posted_username(request):
+    """The username a login form or JSON login body is trying."""
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return None
+        username = data.get('username') if isinstance(data, dict) else None
+    else:
+        username = request.POST.get('username')
+    return username.strip().lower() if isinstance(username, str) and username.strip() else None
+
+
+def _count(scope, outcome):
+    with _counts_lock:
+        key = f'{scope}_{outcome}'
+        _counts[key] = _counts.get(key, 0) + 1
+
+
+def throttle_stats():
+    with _counts_lock:
+        return dict(_counts)
+
+
+register_stats('throttle', throttle_stats)
+
+
+def _retry_after(limit, window, elapsed, previous, current):
+    if current >= limit:
+        # Wait for this window to end, then for its carried-over share to fall below the limit.
+        return window - elapsed + window * (1 - limit / current)
+    # previous * (1 - (elapsed + wait) / window) + current < limit
+    return window * (1 - (limit - current) / previous) - elapsed
+
+
+def check(request, rules, now=None):
+    """
+    Count ``request`` against ``rules`` ((scope, key_func) pairs). Returns None
+    when it is within every budget, else the seconds to wait; a rejected
+    request is not counted.
+    """
+    cache = caches[settings.THROTTLE_CACHE_ALIAS]
+    now = time.time() if now is None else now
+    windows = []
+    for scope, key_func in rules:
+        ident = key_func(request)
+        if not ident:
+            continue
+        # Usernames are attacker-controlled; hash them into safe, fixed-length cache keys.
+        ident = hashlib.sha256(ident.encode()).hexdigest()[:32]
+        limit, window = parse_rate(settings.THROTTLE_RATES[scope])
+        index = int(now // window)
+        windows.append((scope, limit, window, now - index * window,
+                        f'throttle:{scope}:{ident}:{index - 1}', f'throttle:{scope}:{ident}:{index}'))
+    if not windows:
+        return None
+
+    counts = cache.get_many([key for *_, previous, current in windows for key in (previous, current)])
+    wait = None
+    for scope, limit, window, elapsed, previous_key, current_key in windows:
+        previous, current = counts.get(previous_key, 0), counts.get(current_key, 0)
+        if previous * (1 - elapsed / window) + current >= limit:
+            wait = max(wait or 0, _retry_after(limit, window, elapsed, previous, current))
+            _count(scope, 'rejected')
+    if wait is not None:
+        # The first whole second strictly past the point where the count drops to the limit.
+        return math.floor(wait) + 1
+
+    for scope, limit, window, elapsed, previous_key, current_key in windows:
+        # The key must outlive the next window, where it is the "previous" count.
+        cache.add(current_key, 0, timeout=2 * window)
+        try:
+            cache.incr(current_key)
+        except ValueError:  # evicted between add() and incr()
+            cache.set(current_key, 1, timeout=2 * window)
+        _count(scope, 'allowed')
+    return None
+
+
+def throttled_response(retry_after, api=False):
+    message = f'Request was throttled. Expected available in {retry_after} seconds.'
+    if api:
+        response = JsonResponse({'detail': message}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type='text/plain; charset=utf-8')
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def throttle(*rules, methods=('POST',), api=False):
+    """
+    Rate-limit a view. Each rule is a scope from THROTTLE_RATES, counted per
+    client IP, or a (scope, key_func) pair. ``api`` answers in DRF's JSON shape.
+    """
+    rules = [(rule, client_ip) if isinstance(rule, str) else rule for rule in rules]
+
+    def decorator(view):
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            if settings.THROTTLE_ENABLED and request.method in methods:
+                retry_after = check(request, rules)
+                if retry_after:
+                    return throttled_response(retry_after, api)
+            return view(request, *args, **kwargs)
+        return inner
+    return decorator
@@ -0,0 +1,72 @@
+"""
+Boot-time warm-up, run by gunicorn.conf.py before a worker takes traffic.
+
+With preload the master loads code and templates (warm_up(requests=False)), so
+the imported modules, resolved URLconf and compiled templates are inherited
+copy-on-write by every forked worker. The warm-up requests run in each worker
+after it forks: caches filled in the master would be copied into workers forked
+much later (e.g. after max_requests) and never see later invalidations.
+"""
+import logging
+import time
+from io import BytesIO
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.template import engines
+from django.urls import get_resolver
+
+from .jinja2 import template_names
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_host():
+    hosts = [h.lstrip('.') for h in settings.ALLOWED_HOSTS if h not in ('*', '')]
+    return hosts[0] if hosts else 'localhost'
+
+
+def _get(handler, path):
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'SERVER_NAME': _warm_host(),
+        'SERVER_PORT': '443',
+        'HTTP_HOST': _warm_host(),
+        'HTTP_X_FORWARDED_PROTO': 'https',
+        'wsgi.url_scheme': 'https',
+        'wsgi.input': BytesIO(),
+        'wsgi.errors': BytesIO(),
+    }
+    statuses = []
+    response = handler(environ, lambda status, headers, exc_info=None: statuses.append(status))
+    b''.join(response)
+    response.close()
+    return statuses[0]
+
+
+def warm_up(requests=True):
+    start = time.perf_counter()
+    # URLconf: import every view module and build the reverse lookup tables.
+    resolver = get_resolver()
+    resolver.url_patterns
+    resolver.reverse_dict
+
+    env = engines['jinja2'].env
+    for name in template_names(env):
+        env.get_template(name)
+
+    if requests:
+        # Exercise middleware, views, serializers and fill the page cache. Needs
+        # the database, which may not be reachable yet; warm-up is best effort.
+        handler = WSGIHandler()
+        for path in settings.WARMUP_PATHS:
+            try:
+                logger.info('Warm-up GET %s -> %s', path, _get(handler, path))
+            except Exception as e:
+                logger.warning('Warm-up GET %s failed: %s', path, e)
+    # Forked workers must open their own connections.
+    connections.close_all()
+    logger.info('Warm-up finished in %.0f ms', (time.perf_counter() - start) * 1000)
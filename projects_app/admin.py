@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Project
+from jobs_app.queue import enqueue
+from .models import Project, TechTag
 
 
 @admin.register(Project)
@@ -11,6 +12,7 @@ class ProjectAdmin(admin.ModelAdmin):
     list_editable = ['is_featured', 'order']
     ordering = ['-created_at']
     readonly_fields = ['created_at', 'updated_at']
+    actions = ['regenerate_renditions']
     fieldsets = (
         ('Basic Info', {
             'fields': ('title', 'slug', 'short_description', 'description', 'image')
@@ -26,3 +28,21 @@ class ProjectAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+    def get_search_results(self, request, queryset, search_term):
+        # Use the GIN-indexed search_vector instead of ILIKE scans across text columns.
+        if search_term.strip():
+            return queryset.matching(search_term), False
+        return super().get_search_results(request, queryset, search_term)
+
+    def regenerate_renditions(self, request, queryset):
+        for pk in queryset.exclude(image='').exclude(image=None).values_list('pk', flat=True):
+            enqueue('projects.image_renditions', pk=pk, force=True)
+    regenerate_renditions.short_description = 'Regenerate image renditions'
+
+
+@admin.register(TechTag)
+class TechTagAdmin(admin.ModelAdmin):
+    list_display = ['name', 'normalized_name']
+    search_fields = ['normalized_name']
+    ordering = ['normalized_name']
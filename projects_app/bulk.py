@@ -0,0 +1,224 @@
+"""
+Bulk import/export of projects, shared by the import_projects/export_projects
+commands and the API bulk endpoint. Rows are plain dicts keyed by field name.
+"""
+import csv
+import json
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from accounts_app import stats
+from jobs_app.queue import enqueue
+from portfolio_site.db.routers import pin_primary
+from portfolio_site.images import renditions_stale
+from .models import Project, SlugCounter, TechTag
+from .signals import invalidate_project_caches
+
+IMPORT_FIELDS = [
+    'title', 'short_description', 'description', 'tech_stack',
+    'github_link', 'live_demo_link', 'image', 'is_featured', 'order',
+]
+EXPORT_FIELDS = ['slug', *IMPORT_FIELDS, 'created_at', 'updated_at']
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+
+
+# ─── Formats ─────────────────────────────────────────────────────────────────
+
+def read_jsonl(stream):
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_csv(stream):
+    yield from csv.DictReader(stream)
+
+
+def write_jsonl(rows, stream):
+    for row in rows:
+        stream.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+
+def write_csv(rows, stream):
+    writer = csv.DictWriter(stream, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+READERS = {'jsonl': read_jsonl, 'csv': read_csv}
+WRITERS = {'jsonl': write_jsonl, 'csv': write_csv}
+
+
+# ─── Export ──────────────────────────────────────────────────────────────────
+
+def export_rows(queryset=None, chunk_size=2000):
+    """Yield one dict per project; iterator() keeps memory flat for any catalogue size."""
+    queryset = Project.objects.all() if queryset is None else queryset
+    for row in queryset.order_by('id').values(*EXPORT_FIELDS).iterator(chunk_size=chunk_size):
+        row['image'] = row['image'] or ''
+        row['created_at'] = row['created_at'].isoformat()
+        row['updated_at'] = row['updated_at'].isoformat()
+        yield row
+
+
+# ─── Import ──────────────────────────────────────────────────────────────────
+
+class BulkResult:
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.errors = []  # (row number, message)
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'skipped': self.skipped,
+            'errors': [{'row': n, 'error': message} for n, message in self.errors],
+        }
+
+
+def clean_row(row):
+    """Build an unsaved Project from an import row; raises ValidationError."""
+    if not isinstance(row, dict):
+        raise ValidationError('Expected an object.')
+    values = {}
+    for field in IMPORT_FIELDS:
+        value = row.get(field)
+        if value is None or (value == '' and field in ('is_featured', 'order')):
+            continue
+        if field == 'is_featured' and not isinstance(value, bool):
+            value = str(value).strip().lower() in TRUE_VALUES
+        values[field] = value
+    project = Project(slug=(row.get('slug') or '').strip(), **values)
+    project._imported_fields = set(values)
+    project.clean_fields(exclude=['slug', 'image'] if not project.slug else ['image'])
+    created_at = row.get('created_at')
+    if created_at:
+        project._imported_created_at = (
+            created_at if not isinstance(created_at, str) else parse_datetime(created_at)
+        )
+    return project
+
+
+def _batches(rows, size):
+    rows = iter(enumerate(rows, start=1))
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+@pin_primary()
+def import_rows(rows, batch_size=1000, update_existing=True):
+    """
+    Upsert projects from an iterable of dicts, by slug: an existing project gets
+    the fields a row carries and keeps the rest, rows without a slug get a freshly
+    allocated one. Each batch is one transaction of a handful of bulk queries;
+    invalid rows are skipped and reported, and so are the rows of a batch rolled
+    back by a constraint violation (e.g. a slug taken concurrently). If reading
+    the rows fails part way, committed batches stay and the caches are still
+    invalidated.
+    """
+    result = BulkResult()
+    try:
+        for batch in _batches(rows, batch_size):
+            projects, numbers = [], []
+            for number, row in batch:
+                try:
+                    projects.append(clean_row(row))
+                    numbers.append(number)
+                except (ValidationError, ValueError, TypeError) as e:
+                    messages = e.messages if isinstance(e, ValidationError) else [str(e)]
+                    result.errors.append((number, '; '.join(messages)))
+            batch_result = BulkResult()
+            try:
+                with transaction.atomic():
+                    _import_batch(projects, batch_result, update_existing)
+            except IntegrityError as e:
+                result.errors.extend((number, f'Not imported, batch rolled back: {e}') for number in numbers)
+                continue
+            result.created += batch_result.created
+            result.updated += batch_result.updated
+            result.skipped += batch_result.skipped
+    finally:
+        if result.created or result.updated:
+            invalidate_project_caches()
+    return result
+
+
+def _import_batch(projects, result, update_existing):
+    # Later rows win when a batch repeats a slug.
+    by_slug = {p.slug: p for p in projects if p.slug}
+    projects = [p for p in projects if not p.slug] + list(by_slug.values())
+    existing = Project.objects.filter(slug__in=by_slug).values('pk', 'slug', 'image_renditions', *IMPORT_FIELDS)
+
+    to_update = []
+    for current in existing:
+        project = by_slug[current['slug']]
+        project.pk = current['pk']
+        project._state.adding = False
+        # Fields the row leaves out keep their current values, not the model defaults.
+        for field in ['image_renditions', *IMPORT_FIELDS]:
+            if field not in project._imported_fields:
+                setattr(project, field, current[field])
+        to_update.append(project)
+    to_create = [p for p in projects if p.pk is None]
+    if not update_existing:
+        result.skipped += len(to_update)
+        to_update = []
+
+    # bulk_create always stamps created_at; restore the imported values.
+    created = save_projects(to_create, to_update, IMPORT_FIELDS)
+    dated = [p for p in created + to_update if getattr(p, '_imported_created_at', None)]
+    for project in dated:
+        project.created_at = project._imported_created_at
+    Project.objects.bulk_update(dated, ['created_at'])
+    result.created += len(created)
+    result.updated += len(to_update)
+
+
+def save_projects(to_create=(), to_update=(), update_fields=IMPORT_FIELDS):
+    """
+    bulk_create/bulk_update projects and redo what Project.save() would have:
+    slugs, tags, search vectors, dashboard counters and queued image renditions. Call inside a
+    transaction and invalidate_project_caches() afterwards. Returns the created projects.
+    """
+    to_create, to_update = list(to_create), list(to_update)
+    SlugCounter.objects.reserve([p.slug for p in to_create if p.slug])
+    Project.assign_slugs(to_create)
+    now = timezone.now()
+    for project in to_create + to_update:
+        project.tech_list = project.get_tech_list()
+    for project in to_update:
+        project.updated_at = now
+    update_fields = [*update_fields, 'updated_at']
+    if 'tech_stack' in update_fields:
+        update_fields.append('tech_list')
+    created = Project.objects.bulk_create(to_create)
+    Project.objects.bulk_update(to_update, update_fields)
+    stats.adjust(**{stats.PROJECTS: len(created)})
+
+    saved = created + to_update
+    _sync_tags(saved)
+    Project.objects.filter(pk__in=[p.pk for p in saved]).update_search_vector()
+    for project in saved:
+        if renditions_stale(project, 'image', 'image_renditions'):
+            enqueue('projects.image_renditions', pk=project.pk)
+    return created
+
+
+def _sync_tags(projects):
+    # Project.sync_tags() for many projects at once.
+    tags = {t.normalized_name: t.pk for t in TechTag.objects.ensure(
+        name for p in projects for name in p.get_tech_list()
+    )}
+    through = Project.tags.through
+    through.objects.filter(project_id__in=[p.pk for p in projects]).delete()
+    through.objects.bulk_create([
+        through(project_id=p.pk, techtag_id=tag_id)
+        for p in projects
+        for tag_id in {tags[TechTag.normalize(name)] for name in p.get_tech_list()}
+    ], ignore_conflicts=True)
@@ -0,0 +1,122 @@
+import hashlib
+
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from .models import Project
+
+STATE_CACHE_KEY = 'conditional:project-state'
+
+
+def _state_cache():
+    # Every worker, the job worker and import_projects must see the same state.
+    return caches[settings.SHARED_CACHE_ALIAS]
+
+
+def project_state():
+    """
+    (last_modified, count) of the Project table, cached in the shared cache until
+    the next change, so validating a list request costs one cache read.
+    """
+    cache = _state_cache()
+    state = cache.get(STATE_CACHE_KEY)
+    if state is None or 'count' not in state:
+        aggregate = Project.objects.aggregate(last_modified=Max('updated_at'), count=Count('id'))
+        # Deletes can lower MAX(updated_at), so remember when the table last changed.
+        candidates = [aggregate['last_modified'], state and state.get('invalidated_at')]
+        state = {
+            'last_modified': max(filter(None, candidates), default=None),
+            'count': aggregate['count'],
+        }
+        cache.set(STATE_CACHE_KEY, state, None)
+    return state
+
+
+def forget_project_state():
+    _state_cache().set(STATE_CACHE_KEY, {'invalidated_at': timezone.now()}, None)
+
+
+def make_etag(*parts):
+    return hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _viewer(request):
+    return request.user.pk if request.user.is_authenticated else 'anonymous'
+
+
+def _has_pending_messages(request):
+    # Pages carrying flash messages must always be re-rendered.
+    return bool(request.COOKIES.get(CookieStorage.cookie_name))
+
+
+def _project_updated_at(request, slug):
+    # condition() calls the ETag and Last-Modified functions separately; query once.
+    if not hasattr(request, '_project_updated_at'):
+        request._project_updated_at = (
+            Project.objects.filter(slug=slug).values_list('updated_at', flat=True).first()
+        )
+    return request._project_updated_at
+
+
+def _state(request):
+    # Likewise for the table state.
+    if not hasattr(request, '_project_state'):
+        request._project_state = project_state()
+    return request._project_state
+
+
+# ─── HTML pages ──────────────────────────────────────────────────────────────
+
+def project_list_etag(request, *args, **kwargs):
+    if _has_pending_messages(request):
+        return None
+    state = _state(request)
+    return make_etag(state['last_modified'], state['count'], request.get_full_path(), _viewer(request))
+
+
+def project_list_last_modified(request, *args, **kwargs):
+    if _has_pending_messages(request):
+        return None
+    return _state(request)['last_modified']
+
+
+def project_detail_etag(request, slug):
+    updated_at = _project_updated_at(request, slug)
+    if updated_at is None or _has_pending_messages(request):
+        return None
+    # The detail page also lists related projects, so include the table state.
+    state = _state(request)
+    return make_etag(updated_at, state['last_modified'], state['count'], slug, _viewer(request))
+
+
+def project_detail_last_modified(request, slug):
+    if _project_updated_at(request, slug) is None or _has_pending_messages(request):
+        return None
+    return _state(request)['last_modified']
+
+
+# ─── API ─────────────────────────────────────────────────────────────────────
+
+def api_project_list_etag(request, *args, **kwargs):
+    state = _state(request)
+    return make_etag(
+        state['last_modified'], state['count'], request.get_full_path(), request.META.get('HTTP_ACCEPT', ''),
+    )
+
+
+def api_project_list_last_modified(request, *args, **kwargs):
+    return _state(request)['last_modified']
+
+
+def api_project_detail_etag(request, slug):
+    updated_at = _project_updated_at(request, slug)
+    if updated_at is None:
+        return None
+    return make_etag(updated_at, slug, request.get_full_path(), request.META.get('HTTP_ACCEPT', ''))
+
+
+def api_project_detail_last_modified(request, slug):
+    return _project_updated_at(request, slug)
@@ -0,0 +1,19 @@
+from .models import TechTag
+
+
+def parse_tech_terms(values):
+    """Split repeated and/or comma-separated ``tech`` values into normalized terms."""
+    terms = []
+    for value in values:
+        for part in value.split(','):
+            term = TechTag.normalize(part)
+            if term and term != '*' and term not in terms:
+                terms.append(term)
+    return terms
+
+
+def apply_tech_filter(queryset, params):
+    """Apply the ``tech``/``match`` query parameters shared by the HTML and API lists."""
+    terms = parse_tech_terms(params.getlist('tech'))
+    match = 'any' if params.get('match') == 'any' else 'all'
+    return queryset.with_tech(terms, match=match), terms, match
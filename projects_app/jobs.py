@@ -0,0 +1,14 @@
+from jobs_app.queue import register
+from portfolio_site.images import sync_renditions
+from .models import Project
+from .signals import invalidate_project_caches
+
+
+@register('projects.image_renditions')
+def build_image_renditions(pk, force=False):
+    project = Project.objects.filter(pk=pk).first()
+    # sync_renditions saves with update(), which sends no signals. The page cache
+    # generations and validator state live in the shared cache, so this reaches
+    # the web workers from the job worker's process.
+    if project and sync_renditions(project, 'image', 'image_renditions', force=force):
+        invalidate_project_caches()
@@ -0,0 +1,68 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from portfolio_site import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmark public views and API endpoints against a seeded throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--volumes', default='10,1000',
+                            help='Comma-separated project counts to seed, e.g. 10,1000,50000')
+        parser.add_argument('--requests', type=int, default=200, help='Measured requests per scenario')
+        parser.add_argument('--warmup', type=int, default=5, help='Unmeasured requests per scenario')
+        parser.add_argument('--driver', choices=sorted(benchmark.DRIVERS), default='client')
+        parser.add_argument('--concurrency', type=int, default=1, help='Threads issuing requests')
+        parser.add_argument('--only', default='', help='Comma-separated scenario names to run')
+        parser.add_argument('--no-page-cache', action='store_true', help='Disable the rendered page cache')
+        parser.add_argument('--serialization', default='',
+                            help='Comma-separated row counts at which to time ProjectSerializer against '
+                                 'the list fast path, e.g. 1000,10000')
+        parser.add_argument('--output', help='Write the JSON report to this file')
+        parser.add_argument('--baseline', help='Compare against a previously saved report')
+        parser.add_argument('--tolerance', type=float, default=0.2,
+                            help='Allowed fractional slowdown before a scenario counts as a regression')
+
+    def handle(self, *args, **options):
+        volumes = [int(v) for v in options['volumes'].split(',') if v.strip()]
+        only = {name.strip() for name in options['only'].split(',') if name.strip()}
+
+        def progress(volume, name, result):
+            self.stderr.write(
+                f"{volume:>7} {name:<24} {result['rps']:>9.1f} req/s  p95 {result['p95_ms']:>8.2f}ms  "
+                f"{result['queries_per_request']:>5.1f} q/req"
+            )
+
+        # Never seed the real database: benchmark against a fresh test database,
+        # with the same environment (locmem email, 'testserver' host) the test suite uses.
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            # The contact scenarios post from a single client address; don't throttle them.
+            with override_settings(PAGE_CACHE_ENABLED=not options['no_page_cache'], THROTTLE_ENABLED=False):
+                report = benchmark.run(
+                    volumes, requests=options['requests'], warmup=options['warmup'],
+                    driver=options['driver'], concurrency=options['concurrency'],
+                    only=only, progress=progress,
+                    serialization_volumes=[int(v) for v in options['serialization'].split(',') if v.strip()],
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
+
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                regressions = benchmark.compare(report, json.load(f), options['tolerance'])
+            if regressions:
+                raise CommandError('Performance regressions:\n  ' + '\n  '.join(regressions))
+            self.stderr.write(self.style.SUCCESS('No regressions against baseline.'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+from projects_app.bulk import WRITERS, export_rows
+
+
+class Command(BaseCommand):
+    help = 'Stream every project to a JSON Lines or CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="File to write, or '-' for stdout (default)")
+        parser.add_argument('--format', choices=sorted(WRITERS), help='Defaults to the file extension, or jsonl')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('jsonl' if path == '-' else path.rsplit('.', 1)[-1].lower())
+        if fmt not in WRITERS:
+            raise CommandError('Pass --format jsonl or --format csv.')
+        stream = self.stdout if path == '-' else open(path, 'w', newline='', encoding='utf-8')
+        try:
+            WRITERS[fmt](export_rows(chunk_size=options['chunk_size']), stream)
+        finally:
+            if stream is not self.stdout:
+                stream.close()
+        if stream is not self.stdout:
+            self.stdout.write(self.style.SUCCESS(f'Exported projects to {path}'))
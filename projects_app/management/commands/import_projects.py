@@ -0,0 +1,39 @@
+import csv
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from projects_app.bulk import READERS, import_rows
+
+
+class Command(BaseCommand):
+    help = 'Create or update projects (matched by slug) from a JSON Lines or CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="File to read, or '-' for stdin")
+        parser.add_argument('--format', choices=sorted(READERS), help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--skip-existing', action='store_true', help='Leave projects with a matching slug untouched')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or path.rsplit('.', 1)[-1].lower()
+        if fmt not in READERS:
+            raise CommandError('Pass --format jsonl or --format csv.')
+        stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        try:
+            result = import_rows(
+                READERS[fmt](stream),
+                batch_size=options['batch_size'],
+                update_existing=not options['skip_existing'],
+            )
+        except (ValueError, csv.Error) as e:
+            # Malformed JSON/CSV aborts the remaining batches; committed ones stay.
+            raise CommandError(f'Could not parse {path}: {e}')
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        for number, message in sorted(result.errors):
+            self.stderr.write(f'Row {number}: {message}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {result.created}, updated {result.updated}, '
+            f'skipped {result.skipped}, invalid {len(result.errors)}'
+        ))
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from portfolio_site import importtime
+
+
+class Command(BaseCommand):
+    help = 'Report per-module import time for a cold manage.py process or web worker'
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=sorted(importtime.TARGETS), default='wsgi',
+                            help='setup: any manage.py command; checks: commands running system checks; '
+                                 'wsgi: a web worker ready to serve')
+        parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters to take the best time from')
+        parser.add_argument('--limit', type=int, default=25, help='Modules to list')
+        parser.add_argument('--sort', choices=['cumulative', 'self'], default='cumulative')
+        parser.add_argument('--package', help='Only list modules from this top-level package, e.g. rest_framework')
+        parser.add_argument('--packages', action='store_true', help='Also list self time per top-level package')
+        parser.add_argument('--budget-ms', type=float, default=None,
+                            help=f'Fail when the total exceeds this (default IMPORT_TIME_BUDGET_MS, '
+                                 f'currently {settings.IMPORT_TIME_BUDGET_MS})')
+
+    def handle(self, *args, **options):
+        try:
+            result = importtime.profile(options['target'], runs=max(options['runs'], 1))
+        except RuntimeError as e:
+            raise CommandError(f'Profiling failed: {e}')
+
+        self.stdout.write(
+            f"Cold start ({result.target}): {result.total_ms:.1f} ms importing "
+            f"{len(result.records)} modules, best of {result.runs}"
+        )
+        self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for record in result.top(options['limit'], key=options['sort'], package=options['package']):
+            self.stdout.write(
+                f'{record.self_us / 1000:>9.1f} {record.cumulative_us / 1000:>9.1f}  '
+                f"{'  ' * record.depth}{record.module}"
+            )
+        if options['packages']:
+            self.stdout.write(f"\n{'self ms':>9}  package")
+            for package, ms in result.by_package()[:options['limit']]:
+                self.stdout.write(f'{ms:>9.1f}  {package}')
+
+        budget = options['budget_ms']
+        if budget is None:
+            budget = settings.IMPORT_TIME_BUDGET_MS
+        if result.total_ms > budget:
+            raise CommandError(f'Import time {result.total_ms:.1f} ms exceeds the {budget:.0f} ms budget')
@@ -6,6 +6,9 @@ from django.db.utils import OperationalError
 
 class Command(BaseCommand):
     help = 'Wait for database to be available'
+    # Runs first in every container start; the checks (which import the URLconf,
+    # DRF and Pillow) run in the migrate that follows.
+    requires_system_checks = []
 
     def handle(self, *args, **options):
         self.stdout.write('Waiting for database...')
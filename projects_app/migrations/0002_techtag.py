@@ -0,0 +1,31 @@
+# Generated by Django 4.2.16 on 2026-10-17 20:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('normalized_name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Tech Tag',
+                'verbose_name_plural': 'Tech Tags',
+                'ordering': ['normalized_name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tags',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='projects', to='projects_app.techtag'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+def get_tech_list(tech_stack):
+    # Mirrors Project.get_tech_list(); model methods are unavailable in migrations.
+    if tech_stack:
+        return [t.strip() for t in tech_stack.split(',') if t.strip()]
+    return []
+
+
+def backfill_tags(apps, schema_editor):
+    Project = apps.get_model('projects_app', 'Project')
+    TechTag = apps.get_model('projects_app', 'TechTag')
+    Through = Project.tags.through
+
+    labels = {}
+    for tech_stack in Project.objects.values_list('tech_stack', flat=True).iterator():
+        for name in get_tech_list(tech_stack):
+            labels.setdefault(name.lower(), name)
+    TechTag.objects.bulk_create(
+        [TechTag(name=label, normalized_name=key) for key, label in labels.items()],
+        ignore_conflicts=True,
+    )
+    tag_ids = dict(TechTag.objects.values_list('normalized_name', 'id'))
+
+    links = []
+    for project_id, tech_stack in Project.objects.values_list('id', 'tech_stack').iterator():
+        keys = {name.lower() for name in get_tech_list(tech_stack)}
+        links.extend(Through(project_id=project_id, techtag_id=tag_ids[key]) for key in keys)
+    Through.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_app', '0002_techtag'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.16 on 2026-10-17 20:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['search_vector'], name='project_search_vector_gin',
+)
+
+
+def create_search_index(apps, schema_editor):
+    # GIN indexes are PostgreSQL-only; other backends keep the index in state only.
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('projects_app', 'Project'), SEARCH_INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('projects_app', 'Project'), SEARCH_INDEX)
+
+
+def backfill_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Project = apps.get_model('projects_app', 'Project')
+    Project.objects.update(search_vector=(
+        SearchVector('title', weight='A', config='english')
+        + SearchVector('short_description', weight='B', config='english')
+        + SearchVector('description', weight='C', config='english')
+        + SearchVector('tech_stack', weight='D', config='english')
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_app', '0003_backfill_techtags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='project', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_app', '0004_project_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at', '-id'], name='project_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_featured', 'order', 'id'], name='project_featured_order_idx'),
+        ),
+    ]
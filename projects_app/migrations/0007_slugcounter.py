@@ -0,0 +1,41 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:13
+
+import re
+
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    # Seed each base with a suffix past every existing slug built from it.
+    Project = apps.get_model('projects_app', 'Project')
+    SlugCounter = apps.get_model('projects_app', 'SlugCounter')
+    next_suffix = {}
+    for slug in Project.objects.values_list('slug', flat=True).iterator():
+        next_suffix[slug] = max(next_suffix.get(slug, 0), 1)
+        match = re.fullmatch(r'(.+)-(\d+)', slug)
+        if match:
+            base, suffix = match.group(1), int(match.group(2))
+            next_suffix[base] = max(next_suffix.get(base, 0), suffix + 1)
+    SlugCounter.objects.bulk_create(
+        [SlugCounter(base=base, next_suffix=n) for base, n in next_suffix.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_app', '0006_project_image_renditions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlugCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('base', models.CharField(max_length=200, unique=True)),
+                ('next_suffix', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.16 on 2026-10-17 21:39
+
+from django.db import migrations, models
+
+
+def backfill_tech_list(apps, schema_editor):
+    # Same split as Project.get_tech_list(); historical models don't carry methods.
+    Project = apps.get_model('projects_app', 'Project')
+    batch = []
+    for project in Project.objects.only('id', 'tech_stack').iterator(chunk_size=1000):
+        project.tech_list = [t.strip() for t in (project.tech_stack or '').split(',') if t.strip()]
+        batch.append(project)
+        if len(batch) == 1000:
+            Project.objects.bulk_update(batch, ['tech_list'])
+            batch = []
+    Project.objects.bulk_update(batch, ['tech_list'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects_app', '0007_slugcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='tech_list',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(backfill_tech_list, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,217 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchHeadline, SearchQuery, SearchRank, SearchVector, SearchVectorField,
+)
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models.functions import Cast
 from django.utils.text import slugify
 from django.urls import reverse
+from jobs_app.queue import enqueue
+from portfolio_site.db.routers import pin_primary
+from portfolio_site.images import renditions_stale
+
+SEARCH_CONFIG = 'english'
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_STOP = '</mark>'
+SLUG_MAX_LENGTH = 200
+SLUG_SAVE_ATTEMPTS = 3
+
+
+def project_search_vector():
+    # Weights rank title matches above short_description, description and tech_stack.
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('short_description', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('description', weight='C', config=SEARCH_CONFIG)
+        + SearchVector('tech_stack', weight='D', config=SEARCH_CONFIG)
+    )
+
+
+class TechTagQuerySet(models.QuerySet):
+    def ensure(self, names):
+        """Return tags for the given names, creating any that are missing."""
+        wanted = {}
+        for name in names:
+            wanted.setdefault(TechTag.normalize(name), name.strip())
+        if not wanted:
+            return []
+        existing = {t.normalized_name for t in self.filter(normalized_name__in=wanted)}
+        missing = [TechTag(name=label, normalized_name=key)
+                   for key, label in wanted.items() if key not in existing]
+        if missing:
+            self.bulk_create(missing, ignore_conflicts=True)
+        return list(self.filter(normalized_name__in=wanted))
+
+
+class TechTag(models.Model):
+    name = models.CharField(max_length=100)
+    normalized_name = models.CharField(max_length=100, unique=True)
+
+    objects = TechTagQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['normalized_name']
+        verbose_name = 'Tech Tag'
+        verbose_name_plural = 'Tech Tags'
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def normalize(name):
+        return name.strip().lower()
+
+
+def slug_base(title):
+    return slugify(title)[:SLUG_MAX_LENGTH] or 'project'
+
+
+def format_slug(base, suffix):
+    if not suffix:
+        return base
+    tail = f'-{suffix}'
+    return base[:SLUG_MAX_LENGTH - len(tail)] + tail
+
+
+class SlugCounterQuerySet(models.QuerySet):
+    def allocate(self, bases):
+        """
+        Reserve one slug per entry in ``bases`` (repeats get successive suffixes:
+        'app', 'app-1', 'app-2', ...) in a constant number of queries. Counter rows
+        are locked until the surrounding transaction ends, so concurrent callers
+        never hand out the same slug; a concurrent first use of a base raises
+        IntegrityError and the caller retries.
+        """
+        wanted = {}
+        for base in bases:
+            wanted[base] = wanted.get(base, 0) + 1
+        if not wanted:
+            return []
+        with transaction.atomic():
+            counters = {c.base: c for c in self.select_for_update().filter(base__in=wanted)}
+            missing = [SlugCounter(base=base) for base in wanted if base not in counters]
+            self.bulk_create(missing)
+            counters.update((c.base, c) for c in missing)
+            next_suffix = {base: c.next_suffix for base, c in counters.items()}
+            for base, count in wanted.items():
+                counters[base].next_suffix += count
+            self.bulk_update(counters.values(), ['next_suffix'])
+        slugs = []
+        for base in bases:
+            slugs.append(format_slug(base, next_suffix[base]))
+            next_suffix[base] += 1
+        return slugs
+
+    def reserve(self, slugs):
+        """Record slugs chosen by the caller (e.g. imported ones) so allocate() never reissues them."""
+        floor = {}
+        for slug in slugs:
+            floor[slug] = max(floor.get(slug, 0), 1)
+            base, _, suffix = slug.rpartition('-')
+            if base and suffix.isdigit():
+                floor[base] = max(floor.get(base, 0), int(suffix) + 1)
+        if not floor:
+            return
+        with transaction.atomic():
+            counters = {c.base: c for c in self.select_for_update().filter(base__in=floor)}
+            self.bulk_create([SlugCounter(base=base, next_suffix=n)
+                              for base, n in floor.items() if base not in counters])
+            raised = [c for c in counters.values() if c.next_suffix < floor[c.base]]
+            for counter in raised:
+                counter.next_suffix = floor[counter.base]
+            self.bulk_update(raised, ['next_suffix'])
+
+    def repair(self, base):
+        """
+        Move the counter for ``base`` past every slug already taken, including
+        ones set by hand. One range scan over the unique slug index.
+        """
+        taken = [0]
+        for slug in Project.objects.filter(slug__startswith=base).values_list('slug', flat=True):
+            if slug == base:
+                taken.append(1)
+            elif slug.startswith(f'{base}-') and slug[len(base) + 1:].isdigit():
+                taken.append(int(slug[len(base) + 1:]) + 1)
+        self.update_or_create(base=base, defaults={'next_suffix': max(taken)})
+
+
+class SlugCounter(models.Model):
+    # Next free suffix per base slug: 0 means the bare base is still free.
+    base = models.CharField(max_length=SLUG_MAX_LENGTH, unique=True)
+    next_suffix = models.PositiveIntegerField(default=0)
+
+    objects = SlugCounterQuerySet.as_manager()
+
+    def __str__(self):
+        return f'{self.base} -> {self.next_suffix}'
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_tech(self, terms, match='all'):
+        """
+        Filter by normalized tech tags. A term ending in '*' is a prefix match.
+        match='all' requires every term, match='any' requires at least one.
+        """
+        through = Project.tags.through.objects
+        lookups = []
+        for term in terms:
+            if term.endswith('*'):
+                lookups.append(models.Q(techtag__normalized_name__startswith=term[:-1]))
+            else:
+                lookups.append(models.Q(techtag__normalized_name=term))
+        if not lookups:
+            return self
+        if match == 'any':
+            combined = lookups[0]
+            for lookup in lookups[1:]:
+                combined |= lookup
+            return self.filter(pk__in=through.filter(combined).values('project_id'))
+        queryset = self
+        for lookup in lookups:
+            queryset = queryset.filter(pk__in=through.filter(lookup).values('project_id'))
+        return queryset
+
+    def _full_text_enabled(self):
+        return connections[self.db].vendor == 'postgresql'
+
+    def matching(self, text):
+        """
+        Filter to projects matching ``text`` using the GIN-indexed search_vector.
+        Falls back to substring matching on databases without full-text search.
+        """
+        text = text.strip()
+        if not text:
+            return self
+        if not self._full_text_enabled():
+            return self.filter(
+                models.Q(title__icontains=text)
+                | models.Q(short_description__icontains=text)
+                | models.Q(description__icontains=text)
+                | models.Q(tech_stack__icontains=text)
+            )
+        return self.filter(search_vector=SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG))
+
+    def search(self, text):
+        """Like matching(), but ranked by relevance and annotated with a highlighted ``headline``."""
+        text = text.strip()
+        if not text or not self._full_text_enabled():
+            return self.matching(text)
+        query = SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+        return self.matching(text).annotate(
+            # ts_rank() is a float4; as a float8 it round-trips through a keyset
+            # cursor exactly, so the page boundary comparison matches the same rows.
+            search_rank=Cast(SearchRank(models.F('search_vector'), query), models.FloatField()),
+            headline=SearchHeadline(
+                'description', query, config=SEARCH_CONFIG,
+                start_sel=HIGHLIGHT_START, stop_sel=HIGHLIGHT_STOP,
+                min_words=15, max_words=35,
+            ),
+        ).order_by('-search_rank', '-created_at', '-id')
+
+    def update_search_vector(self):
+        if not self._full_text_enabled():
+            return 0
+        return self.update(search_vector=project_search_vector())
 
 
 class Project(models.Model):
@@ -9,32 +220,100 @@ class Project(models.Model):
     description = models.TextField()
     short_description = models.CharField(max_length=300, blank=True)
     tech_stack = models.CharField(max_length=500, help_text='Comma-separated tech stack')
+    # get_tech_list(), stored on save so list serialization skips re-splitting tech_stack.
+    tech_list = models.JSONField(default=list, blank=True, editable=False)
+    tags = models.ManyToManyField(TechTag, related_name='projects', blank=True, editable=False)
     github_link = models.URLField(blank=True)
     live_demo_link = models.URLField(blank=True)
     image = models.ImageField(upload_to='projects/', blank=True, null=True)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     is_featured = models.BooleanField(default=False)
     order = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ProjectQuerySet.as_manager()
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            GinIndex(fields=['search_vector'], name='project_search_vector_gin'),
+            models.Index(fields=['-created_at', '-id'], name='project_created_id_idx'),
+            models.Index(fields=['is_featured', 'order', 'id'], name='project_featured_order_idx'),
+        ]
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
 
     def __str__(self):
         return self.title
 
+    @pin_primary()
     def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Project.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f'{base_slug}-{counter}'
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        self.tech_list = self.get_tech_list()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'tech_stack' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'tech_list'}
+        # Tag and slug bookkeeping reads back rows this save just wrote.
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            self._save_with_new_slug(*args, **kwargs)
+        self.sync_tags()
+        Project.objects.filter(pk=self.pk).update_search_vector()
+        if renditions_stale(self, 'image', 'image_renditions'):
+            # Resizing runs in the run_jobs worker (see projects_app.jobs), not the request.
+            enqueue('projects.image_renditions', pk=self.pk)
+
+    @staticmethod
+    def assign_slugs(projects):
+        """
+        Give every unsaved project without a slug a unique one, for bulk_create.
+        Counters don't know about slugs set by hand, or that one base's suffixed
+        slug is another title's bare base ('App' twice -> 'app-1', 'App 1' ->
+        'app-1'), so candidates are checked against the table and the batch;
+        clashing bases are repaired and re-allocated.
+        """
+        pending = [p for p in projects if not p.slug]
+        bases = [slug_base(p.title) for p in pending]
+        taken = {p.slug for p in projects if p.slug}
+        todo = list(range(len(pending)))
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            for i, slug in zip(todo, SlugCounter.objects.allocate([bases[i] for i in todo])):
+                pending[i].slug = slug
+            existing = set(Project.objects.filter(
+                slug__in=[pending[i].slug for i in todo]).values_list('slug', flat=True))
+            clashing = []
+            for i in todo:
+                if pending[i].slug in existing or pending[i].slug in taken:
+                    clashing.append(i)
+                else:
+                    taken.add(pending[i].slug)
+            if not clashing:
+                return projects
+            for base in {bases[i] for i in clashing}:
+                SlugCounter.objects.repair(base)
+            # repair() only sees saved projects; keep counters past this batch's slugs too.
+            SlugCounter.objects.reserve(taken)
+            todo = clashing
+        for i in todo:
+            pending[i].slug = ''
+        raise IntegrityError('Could not allocate unique project slugs')
+
+    def _save_with_new_slug(self, *args, **kwargs):
+        base = slug_base(self.title)
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    self.slug = SlugCounter.objects.allocate([base])[0]
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                # A slug set by hand, or a concurrent first use of this base.
+                self.slug = ''
+                if attempt == SLUG_SAVE_ATTEMPTS - 1:
+                    raise
+                SlugCounter.objects.repair(base)
 
     def get_absolute_url(self):
         return reverse('project_detail', kwargs={'slug': self.slug})
@@ -43,3 +322,6 @@ class Project(models.Model):
         if self.tech_stack:
             return [t.strip() for t in self.tech_stack.split(',') if t.strip()]
         return []
+
+    def sync_tags(self):
+        self.tags.set(TechTag.objects.ensure(self.get_tech_list()))
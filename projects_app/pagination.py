@@ -0,0 +1,141 @@
+import base64
+import binascii
+import json
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+
+DEFAULT_ORDERING = ('-created_at', '-id')
+SEARCH_ORDERING = ('-search_rank', '-created_at', '-id')
+FEATURED_ORDERING = ('order', 'id')
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class KeysetPage:
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def _model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        # Annotations such as search_rank are kept as their JSON value.
+        return None
+
+
+def encode_cursor(obj, ordering, model=None):
+    model = model or type(obj)
+    if isinstance(obj, dict):
+        # A .values() row; value_to_string() only needs attribute access.
+        obj = SimpleNamespace(**obj)
+    values = []
+    for key in ordering:
+        name = key.lstrip('-')
+        field = _model_field(model, name)
+        value = getattr(obj, field.attname if field else name)
+        values.append(field.value_to_string(obj) if field else value)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, model, ordering):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(str(e))
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor('Cursor does not match ordering.')
+    decoded = []
+    for key, value in zip(ordering, values):
+        field = _model_field(model, key.lstrip('-'))
+        try:
+            decoded.append(field.to_python(value) if field else value)
+        except ValidationError as e:
+            raise InvalidCursor(str(e))
+    return decoded
+
+
+def keyset_filter(ordering, values):
+    """
+    Build the row-value comparison "rows after (v1, v2, ...)" for the ordering,
+    e.g. created_at < v1 OR (created_at = v1 AND id < v2) for ('-created_at', '-id').
+    """
+    condition = Q()
+    for i, key in enumerate(ordering):
+        name = key.lstrip('-')
+        lookup = 'lt' if key.startswith('-') else 'gt'
+        step = Q(**{f'{name}__{lookup}': values[i]})
+        for prev_key, prev_value in zip(ordering[:i], values[:i]):
+            step &= Q(**{prev_key.lstrip('-'): prev_value})
+        condition |= step
+    return condition
+
+
+def default_ordering(queryset):
+    if 'search_rank' in queryset.query.annotations:
+        return SEARCH_ORDERING
+    return DEFAULT_ORDERING
+
+
+def _page_queryset(queryset, cursor, ordering):
+    ordering = ordering or default_ordering(queryset)
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(keyset_filter(ordering, decode_cursor(cursor, queryset.model, ordering)))
+    return queryset, ordering
+
+
+def _make_page(items, page_size, ordering, model):
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_cursor(items[-1], ordering, model)
+    return KeysetPage(items, next_cursor)
+
+
+def keyset_paginate(queryset, cursor=None, page_size=20, ordering=None):
+    """
+    Return one page of ``queryset`` after ``cursor``. Fetches page_size + 1 rows to
+    learn whether another page exists, so no COUNT query is needed.
+    """
+    queryset, ordering = _page_queryset(queryset, cursor, ordering)
+    return _make_page(list(queryset[:page_size + 1]), page_size, ordering, queryset.model)
+
+
+async def akeyset_paginate(queryset, cursor=None, page_size=20, ordering=None):
+    queryset, ordering = _page_queryset(queryset, cursor, ordering)
+    return _make_page([obj async for obj in queryset[:page_size + 1]], page_size, ordering, queryset.model)
+
+
+def _count_queryset(queryset, cap):
+    return queryset.order_by().values('pk')[:cap + 1]
+
+
+def capped_count(queryset, cap=1000):
+    """
+    Count at most ``cap`` rows. Returns (count, exact); exact is False when
+    there are more than ``cap`` matches.
+    """
+    count = _count_queryset(queryset, cap).count()
+    return min(count, cap), count <= cap
+
+
+async def acapped_count(queryset, cap=1000):
+    count = await _count_queryset(queryset, cap).acount()
+    return min(count, cap), count <= cap
@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from portfolio_site import page_cache
+from portfolio_site.db.routers import note_write
+from .conditional import forget_project_state
+from .models import Project
+
+
+def invalidate_project_caches():
+    note_write()
+    page_cache.invalidate('project')
+    forget_project_state()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_pages(sender, instance, **kwargs):
+    # Invalidate now and again after commit, so a concurrent request cannot
+    # re-cache the pre-commit state.
+    invalidate_project_caches()
+    transaction.on_commit(invalidate_project_caches)
@@ -1,8 +1,9 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('', views.home_view, name='home'),
+    path('', views.home_view_async if settings.ASYNC_VIEWS else views.home_view, name='home'),
     path('about/', views.about_view, name='about'),
     path('projects/', views.projects_list_view, name='projects_list'),
     path('projects/new/', views.project_create_view, name='project_create'),
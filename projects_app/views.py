@@ -1,13 +1,26 @@
 from django.shortcuts import render, get_object_or_404, redirect
+from django.http import Http404
+from django.views.decorators.http import condition
 from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
 from .models import Project
 from .forms import ProjectForm
+from .filters import apply_tech_filter
+from .pagination import InvalidCursor, capped_count, keyset_paginate
+from .conditional import (
+    project_detail_etag, project_detail_last_modified, project_list_etag, project_list_last_modified,
+)
 from accounts_app.models import Profile
 from django.contrib.auth.models import User
+from portfolio_site.async_views import resolve_user
+from portfolio_site.page_cache import cache_public_page
+from portfolio_site.streaming import stream_template
 
+PROJECTS_PAGE_SIZE = 12
 
+
+@cache_public_page('project', 'profile')
 def home_view(request):
     featured_projects = Project.objects.filter(is_featured=True).order_by('order')[:3]
     all_projects = Project.objects.all().order_by('-created_at')[:6]
@@ -20,22 +33,58 @@ def home_view(request):
     return render(request, 'home.html', context)
 
 
+@cache_public_page('project', 'profile')
+async def home_view_async(request):
+    # Served instead of home_view when settings.ASYNC_VIEWS is on.
+    featured_projects = [p async for p in Project.objects.filter(is_featured=True).order_by('order')[:3]]
+    all_projects = [p async for p in Project.objects.all().order_by('-created_at')[:6]]
+    profile = await Profile.objects.filter(user__is_superuser=True).afirst()
+    await resolve_user(request)
+    context = {
+        'featured_projects': featured_projects,
+        'recent_projects': all_projects,
+        'profile': profile,
+    }
+    return render(request, 'home.html', context)
+
+
+@cache_public_page('profile')
 def about_view(request):
     profile = Profile.objects.filter(user__is_superuser=True).first()
     return render(request, 'about.html', {'profile': profile})
 
 
+@condition(etag_func=project_list_etag, last_modified_func=project_list_last_modified)
+@cache_public_page('project')
 def projects_list_view(request):
     projects = Project.objects.all().order_by('-created_at')
-    tech_filter = request.GET.get('tech', '')
-    if tech_filter:
-        projects = projects.filter(tech_stack__icontains=tech_filter)
-    return render(request, 'projects/list.html', {
-        'projects': projects,
-        'tech_filter': tech_filter,
+    projects, tech_terms, tech_match = apply_tech_filter(projects, request.GET)
+    query = request.GET.get('q', '').strip()
+    if query:
+        projects = projects.search(query)
+    try:
+        page = keyset_paginate(projects, cursor=request.GET.get('cursor'), page_size=PROJECTS_PAGE_SIZE)
+    except InvalidCursor:
+        raise Http404('Invalid cursor')
+    total_count, count_exact = capped_count(projects)
+    next_query = None
+    if page.has_next:
+        params = request.GET.copy()
+        params['cursor'] = page.next_cursor
+        next_query = params.urlencode()
+    return stream_template(request, 'projects/list.html', {
+        'projects': page.items,
+        'total_count': total_count,
+        'count_exact': count_exact,
+        'next_query': next_query,
+        'tech_filter': ', '.join(tech_terms),
+        'tech_match': tech_match,
+        'query': query,
     })
 
 
+@condition(etag_func=project_detail_etag, last_modified_func=project_detail_last_modified)
+@cache_public_page('project')
 def project_detail_view(request, slug):
     project = get_object_or_404(Project, slug=slug)
     related_projects = Project.objects.exclude(pk=project.pk).order_by('-created_at')[:3]
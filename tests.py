@@ -2,19 +2,57 @@
 Comprehensive test suite for the Portfolio Site Django application.
 Tests cover models, views, API endpoints, forms, and authentication.
 """
+import io
+import json
+import os
+import shutil
+import tempfile
 import pytest
-from django.test import TestCase, Client
+import unittest
+from unittest import mock
+from django.conf import settings
+from django.core.cache import cache
+from django.db import OperationalError, connection
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import HttpResponse
+from django.test import TestCase, Client, override_settings
 from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import CommandError, call_command
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework.authtoken.models import Token
-from projects_app.models import Project
-from contact_app.models import ContactMessage
+from projects_app.models import Project, SlugCounter, TechTag
+from contact_app.models import ContactMessage, OutboundEmail
 from accounts_app.models import Profile
+from jobs_app.models import Job
+from jobs_app.queue import claim_batch, enqueue, register, run_job
 
 
 # ─── Fixtures ────────────────────────────────────────────────────────────────
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Cached pages and counters live in the process-wide cache; isolate each test.
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def unhashed_static():
+    # The suite runs without `npm run build` / collectstatic, so there is no manifest to look names up in.
+    with override_settings(STORAGES={
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }):
+        yield
+
+
+def body(response):
+    # A streamed page (see portfolio_site.streaming) can only be read once.
+    return b''.join(response.streaming_content) if response.streaming else response.content
+
+
 @pytest.fixture
 def client():
     return Client()
@@ -97,6 +135,44 @@ class ProjectModelTest(TestCase):
         self.assertNotEqual(self.project.slug, project2.slug)
         self.assertIn('my-portfolio-project', project2.slug)
 
+    def test_slug_allocation_is_constant_time(self):
+        for _ in range(5):
+            Project.objects.create(title='Popular', description='Same title again.', tech_stack='Python')
+        # Savepoint, locked SELECT, UPDATE, release, however many slugs exist.
+        with self.assertNumQueries(4):
+            self.assertEqual(SlugCounter.objects.allocate(['popular']), ['popular-5'])
+
+    def test_slug_retry_skips_hand_set_slug(self):
+        Project.objects.create(title='Taken', slug='clash-1', description='Slug set by hand.', tech_stack='Go')
+        Project.objects.create(title='Clash', description='First project.', tech_stack='Go')
+        project = Project.objects.create(title='Clash', description='Second project.', tech_stack='Go')
+        self.assertEqual(project.slug, 'clash-2')
+
+    def test_assign_slugs_in_bulk(self):
+        projects = Project.assign_slugs([
+            Project(title=title, description='Imported project.', tech_stack='Python')
+            for title in ['Bulk', 'Bulk', 'My Portfolio Project']
+        ])
+        self.assertEqual([p.slug for p in projects], ['bulk', 'bulk-1', 'my-portfolio-project-1'])
+
+    def test_assign_slugs_suffix_clashes_with_bare_base(self):
+        projects = Project.assign_slugs([
+            Project(title=title, description='Imported project.', tech_stack='Python')
+            for title in ['App', 'App', 'App 1']
+        ])
+        slugs = [p.slug for p in projects]
+        self.assertEqual(slugs[:2], ['app', 'app-1'])
+        self.assertEqual(len(set(slugs)), 3)
+        Project.objects.bulk_create(projects)
+
+    def test_assign_slugs_skips_hand_set_slug(self):
+        Project.objects.create(title='Anything', slug='manual', description='Slug set by hand.', tech_stack='Go')
+        projects = Project.assign_slugs([
+            Project(title='Manual', description='Imported project.', tech_stack='Python')
+        ])
+        self.assertEqual(projects[0].slug, 'manual-1')
+        Project.objects.bulk_create(projects)
+
     def test_get_tech_list(self):
         tech_list = self.project.get_tech_list()
         self.assertIsInstance(tech_list, list)
@@ -111,6 +187,381 @@ class ProjectModelTest(TestCase):
         self.assertEqual(str(self.project), 'My Portfolio Project')
 
 
+class TechTagTest(TestCase):
+    def setUp(self):
+        self.django = Project.objects.create(
+            title='Django Shop',
+            description='An e-commerce site built with Django and PostgreSQL.',
+            tech_stack='Python, Django, PostgreSQL',
+        )
+        self.go = Project.objects.create(
+            title='Go Service',
+            description='A small HTTP service written in Go with Redis.',
+            tech_stack='Go, Redis',
+        )
+
+    def test_tags_synced_from_tech_stack(self):
+        self.assertEqual(
+            sorted(self.django.tags.values_list('normalized_name', flat=True)),
+            ['django', 'postgresql', 'python'],
+        )
+        self.django.tech_stack = 'Python, Flask'
+        self.django.save()
+        self.assertEqual(
+            sorted(self.django.tags.values_list('normalized_name', flat=True)),
+            ['flask', 'python'],
+        )
+        self.assertEqual(TechTag.objects.filter(normalized_name='python').count(), 1)
+
+    def test_exact_match_does_not_match_substring(self):
+        self.assertEqual(list(Project.objects.with_tech(['go'])), [self.go])
+
+    def test_prefix_match(self):
+        self.assertEqual(list(Project.objects.with_tech(['postgres*'])), [self.django])
+
+    def test_match_all_and_any(self):
+        self.assertEqual(Project.objects.with_tech(['python', 'redis']).count(), 0)
+        self.assertEqual(Project.objects.with_tech(['python', 'redis'], match='any').count(), 2)
+
+    def test_list_view_and_api_filter(self):
+        response = self.client.get(reverse('projects_list'), {'tech': 'Go'})
+        self.assertContains(response, 'Go Service')
+        self.assertNotContains(response, 'Django Shop')
+        response = APIClient().get('/api/projects/', {'tech': 'django,go', 'match': 'any'})
+        self.assertEqual(len(response.data['results']), 2)
+
+
+class ProjectSearchTest(TestCase):
+    def setUp(self):
+        self.title_match = Project.objects.create(
+            title='Realtime Chat',
+            description='A messaging app built on websockets and Redis pub/sub.',
+            tech_stack='Python, Django Channels',
+        )
+        self.body_match = Project.objects.create(
+            title='Analytics Pipeline',
+            description='Streams events into a warehouse and powers a realtime dashboard.',
+            tech_stack='Kafka, Spark',
+        )
+
+    def test_search_filters_projects(self):
+        results = Project.objects.search('websockets')
+        self.assertEqual(list(results), [self.title_match])
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'Full-text ranking requires PostgreSQL')
+    def test_search_ranks_title_above_description(self):
+        results = list(Project.objects.search('realtime'))
+        self.assertEqual(results, [self.title_match, self.body_match])
+        self.assertIn('<mark>', results[1].headline)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'Full-text ranking requires PostgreSQL')
+    def test_search_pages_cover_tied_and_fractional_ranks(self):
+        from projects_app.pagination import keyset_paginate
+        for i in range(7):
+            Project.objects.create(
+                title='Realtime Board' if i % 2 else f'Board {i}',
+                description='A realtime board. ' * (i % 3 + 1),
+                tech_stack='Python',
+            )
+        Project.objects.update(created_at=self.title_match.created_at)
+        expected = [p.pk for p in Project.objects.search('realtime')]
+        seen, cursor = [], None
+        while True:
+            page = keyset_paginate(Project.objects.search('realtime'), cursor=cursor, page_size=2)
+            seen.extend(p.pk for p in page)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(expected), 9)
+
+    def test_search_query_param_on_list_and_api(self):
+        response = self.client.get(reverse('projects_list'), {'q': 'warehouse'})
+        self.assertContains(response, 'Analytics Pipeline')
+        self.assertNotContains(response, 'Realtime Chat')
+        response = APIClient().get('/api/projects/', {'q': 'warehouse'})
+        self.assertEqual([p['slug'] for p in response.data['results']], [self.body_match.slug])
+
+    def test_highlight_filter_escapes_html(self):
+        from portfolio_site.jinja2 import highlight
+        self.assertEqual(
+            highlight('<script>x</script> <mark>Django</mark>'),
+            '&lt;script&gt;x&lt;/script&gt; <mark>Django</mark>',
+        )
+
+
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        # Identical created_at values exercise the id tie-breaker.
+        self.projects = [
+            Project.objects.create(
+                title=f'Paged Project {i}',
+                description='A project used to exercise keyset pagination.',
+                tech_stack='Python',
+            )
+            for i in range(5)
+        ]
+        Project.objects.update(created_at=self.projects[0].created_at)
+
+    def test_api_pages_cover_every_project_once(self):
+        client = APIClient()
+        response = client.get('/api/projects/', {'page_size': 2})
+        self.assertEqual(response.data['count'], 5)
+        self.assertTrue(response.data['count_exact'])
+        seen = [p['id'] for p in response.data['results']]
+        while response.data['next']:
+            response = client.get(response.data['next'])
+            seen.extend(p['id'] for p in response.data['results'])
+        self.assertEqual(seen, sorted((p.pk for p in self.projects), reverse=True))
+
+    def test_api_invalid_cursor(self):
+        response = APIClient().get('/api/projects/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_capped_count(self):
+        from projects_app.pagination import capped_count
+        self.assertEqual(capped_count(Project.objects.all(), cap=3), (3, False))
+        self.assertEqual(capped_count(Project.objects.all(), cap=10), (5, True))
+
+    def test_list_view_load_more_link(self):
+        from projects_app import views
+        original, views.PROJECTS_PAGE_SIZE = views.PROJECTS_PAGE_SIZE, 3
+        try:
+            content = body(self.client.get(reverse('projects_list'))).decode()
+            self.assertIn('id="load-more"', content)
+            self.assertEqual(content.count('View Details'), 3)
+        finally:
+            views.PROJECTS_PAGE_SIZE = original
+
+
+class ImageRenditionTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def upload(self, size=(1000, 500), mode='RGBA'):
+        from PIL import Image
+        buffer = io.BytesIO()
+        Image.new(mode, size, (200, 30, 30, 128) if mode == 'RGBA' else (200, 30, 30)).save(buffer, 'PNG')
+        return SimpleUploadedFile('cover.png', buffer.getvalue(), content_type='image/png')
+
+    def run_jobs(self):
+        call_command('run_jobs', processes=0, stdout=io.StringIO())
+
+    def test_renditions_generated_by_worker(self):
+        from PIL import Image
+        project = Project.objects.create(
+            title='Image Project', description='Project with an uploaded cover image.',
+            tech_stack='Python', image=self.upload(),
+        )
+        self.assertEqual(Project.objects.get(pk=project.pk).image_renditions, {})
+        self.run_jobs()
+        renditions = Project.objects.get(pk=project.pk).image_renditions
+        self.assertEqual(renditions['source'], project.image.name)
+        # 1280 is wider than the original, so it is skipped rather than upscaled.
+        self.assertEqual(sorted(renditions['webp']), ['320', '640'])
+        with Image.open(os.path.join(self.media_root, renditions['jpeg']['320'])) as jpeg:
+            self.assertEqual((jpeg.format, jpeg.size), ('JPEG', (320, 160)))
+
+        project.refresh_from_db()
+        project.save()
+        self.assertFalse(Job.objects.filter(status=Job.STATUS_PENDING).exists())
+
+    def test_srcset_uses_field_storage(self):
+        from django.core.files.storage import FileSystemStorage
+        from portfolio_site.jinja2 import srcset
+        storage = FileSystemStorage(location=self.media_root, base_url='/cdn/')
+        with mock.patch.object(Project._meta.get_field('image'), 'storage', storage):
+            image = Project(image='projects/cover.png').image
+            renditions = {'jpeg': {'640': 'projects/cover_640w.jpg', '320': 'projects/cover_320w.jpg'}}
+            self.assertEqual(
+                srcset(image, renditions),
+                '/cdn/projects/cover_320w.jpg 320w, /cdn/projects/cover_640w.jpg 640w',
+            )
+
+    def test_small_image_keeps_own_width(self):
+        profile = User.objects.create_user(username='pic', password='x').profile
+        profile.profile_image = self.upload(size=(200, 200), mode='RGB')
+        profile.save()
+        self.run_jobs()
+        profile.refresh_from_db()
+        self.assertEqual(list(profile.profile_image_renditions['jpeg']), ['200'])
+
+    def test_templates_and_api_use_renditions(self):
+        project = Project.objects.create(
+            title='Image Project', description='Project with an uploaded cover image.',
+            tech_stack='Python', image=self.upload(),
+        )
+        self.run_jobs()
+        content = body(self.client.get(reverse('projects_list'))).decode()
+        self.assertIn('type="image/webp"', content)
+        self.assertIn('_320w.webp 320w, ', content)
+
+        data = APIClient().get(reverse('api_project_detail', kwargs={'slug': project.slug})).json()
+        self.assertTrue(data['image_variants']['jpeg']['640'].startswith('http://testserver/media/'))
+
+    def test_worker_invalidates_web_caches(self):
+        Project.objects.create(
+            title='Image Project', description='Project with an uploaded cover image.',
+            tech_stack='Python', image=self.upload(),
+        )
+        self.assertNotIn(b'type="image/webp"', body(self.client.get(reverse('projects_list'))))
+        # run_jobs is a separate process with a locmem cache of its own.
+        worker = {**settings.CACHES, 'default': {**settings.CACHES['default'], 'LOCATION': 'job-worker'}}
+        with override_settings(CACHES=worker):
+            self.run_jobs()
+        self.assertIn(b'type="image/webp"', body(self.client.get(reverse('projects_list'))))
+
+
+class JobQueueTest(TestCase):
+    def setUp(self):
+        self.calls = []
+        register('test.record')(lambda value: self.calls.append(value))
+        register('test.fail')(lambda: 1 / 0)
+
+    def test_enqueue_reuses_pending_job(self):
+        first = enqueue('test.record', value=1)
+        self.assertEqual(enqueue('test.record', value=1), first)
+        self.assertNotEqual(enqueue('test.record', value=2), first)
+
+    def test_worker_runs_jobs(self):
+        enqueue('test.record', value=1)
+        enqueue('test.record', value=2)
+        call_command('run_jobs', processes=0, stdout=io.StringIO())
+        self.assertEqual(sorted(self.calls), [1, 2])
+        self.assertEqual(Job.objects.filter(status=Job.STATUS_DONE).count(), 2)
+
+    @override_settings(JOBS_MAX_ATTEMPTS=2)
+    def test_failed_job_retries_then_fails(self):
+        job = enqueue('test.fail')
+        self.assertEqual(claim_batch(), [job.pk])
+        self.assertEqual(claim_batch(), [])
+        self.assertFalse(run_job(job.pk))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.STATUS_PENDING, 1))
+        self.assertIn('ZeroDivisionError', job.last_error)
+        self.assertGreater(job.run_after, timezone.now())
+
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        self.assertEqual(claim_batch(), [job.pk])
+        run_job(job.pk)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.STATUS_FAILED, 2))
+
+    @override_settings(JOBS_MAX_ATTEMPTS=2, JOBS_LEASE_TIMEOUT=60)
+    def test_job_that_kills_its_worker_runs_out_of_attempts(self):
+        job = enqueue('test.record', value=1)
+        for attempt in (1, 2):
+            self.assertEqual(claim_batch(), [job.pk])
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts), (Job.STATUS_RUNNING, attempt))
+            # The worker dies mid-job; the lease runs out.
+            Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timezone.timedelta(seconds=120))
+        self.assertEqual(claim_batch(), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.STATUS_FAILED)
+        self.assertIn('Lease expired', job.last_error)
+        self.assertEqual(self.calls, [])
+
+
+class BulkImportExportTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            title='Exported', description='Project that gets exported.', tech_stack='Python, Django',
+        )
+
+    def export(self, fmt):
+        out = io.StringIO()
+        call_command('export_projects', format=fmt, stdout=out)
+        return out.getvalue()
+
+    def import_file(self, content, suffix):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False) as f:
+            f.write(content)
+        self.addCleanup(os.remove, f.name)
+        out, err = io.StringIO(), io.StringIO()
+        call_command('import_projects', f.name, batch_size=2, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_jsonl_round_trip_upserts_by_slug(self):
+        row = json.loads(self.export('jsonl'))
+        self.assertEqual(row['slug'], 'exported')
+        row.update(title='Renamed', tech_stack='Go')
+        rows = [row, {'title': 'Exported', 'description': 'Same title, new slug.', 'tech_stack': 'Rust'}]
+        out, _ = self.import_file(''.join(json.dumps(r) + '\n' for r in rows), '.jsonl')
+        self.assertIn('Created 1, updated 1', out)
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.title, 'Renamed')
+        self.assertEqual(self.project.created_at.isoformat(), row['created_at'])
+        self.assertEqual([t.normalized_name for t in self.project.tags.all()], ['go'])
+        self.assertTrue(Project.objects.filter(slug='exported-1').exists())
+
+    def test_csv_import_reports_invalid_rows(self):
+        content = (
+            'slug,title,description,tech_stack,is_featured,order\n'
+            ',CSV One,Imported from a CSV file.,Python,true,3\n'
+            ',,Missing its title.,Python,,\n'
+            ',CSV Two,Imported from a CSV file.,Python,,not-a-number\n'
+        )
+        out, err = self.import_file(content, '.csv')
+        self.assertIn('Created 1, updated 0, skipped 0, invalid 2', out)
+        self.assertIn('Row 2', err)
+        project = Project.objects.get(slug='csv-one')
+        self.assertEqual((project.is_featured, project.order), (True, 3))
+        self.assertIn('CSV One', self.export('csv'))
+
+    def test_constraint_violation_skips_batch(self):
+        from projects_app import bulk
+        from django.db import IntegrityError
+        save_projects, calls = bulk.save_projects, []
+
+        def flaky(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise IntegrityError('duplicate key value violates unique constraint')
+            return save_projects(*args, **kwargs)
+
+        rows = [{'title': f'Batch {i}', 'description': 'Imported project.', 'tech_stack': 'Go'} for i in range(3)]
+        with mock.patch.object(bulk, 'save_projects', flaky):
+            out, err = self.import_file(''.join(json.dumps(r) + '\n' for r in rows), '.jsonl')
+        self.assertIn('Created 1, updated 0, skipped 0, invalid 2', out)
+        self.assertIn('Row 1: Not imported', err)
+        self.assertIn('Row 2: Not imported', err)
+        self.assertTrue(Project.objects.filter(title='Batch 2').exists())
+
+    def test_partial_row_keeps_omitted_fields(self):
+        Project.objects.filter(pk=self.project.pk).update(
+            github_link='https://github.com/example/exported', is_featured=True, order=5,
+        )
+        row = {'slug': 'exported', 'title': 'Renamed', 'description': 'Only the basics.', 'tech_stack': 'Python, Django'}
+        out, _ = self.import_file(json.dumps(row) + '\n', '.jsonl')
+        self.assertIn('updated 1', out)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.title, 'Renamed')
+        self.assertEqual(self.project.github_link, 'https://github.com/example/exported')
+        self.assertEqual((self.project.is_featured, self.project.order), (True, 5))
+        self.assertEqual(self.project.tags.count(), 2)
+
+    def test_parse_error_still_invalidates_committed_batches(self):
+        rows = ''.join(
+            json.dumps({'title': f'Early {i}', 'description': 'Committed first.', 'tech_stack': 'Go'}) + '\n'
+            for i in range(2)
+        ) + '{not json\n'
+        with mock.patch('projects_app.bulk.invalidate_project_caches') as invalidate:
+            with self.assertRaisesMessage(CommandError, 'Could not parse'):
+                self.import_file(rows, '.jsonl')
+        invalidate.assert_called_once()
+        self.assertEqual(Project.objects.filter(title__startswith='Early').count(), 2)
+
+        content = 'title,description,tech_stack\nCSV,Too big.,' + 'x' * 200000 + '\n'
+        with self.assertRaisesMessage(CommandError, 'field larger than field limit'):
+            self.import_file(content, '.csv')
+
+
 class ContactMessageModelTest(TestCase):
     def test_contact_message_creation(self):
         msg = ContactMessage.objects.create(
@@ -240,6 +691,48 @@ class AuthViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class DashboardStatsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='dash', password='SecurePass123!')
+        self.client.login(username='dash', password='SecurePass123!')
+
+    def _message(self, **kwargs):
+        return ContactMessage.objects.create(name='A', email='a@example.com', message='Hello there.', **kwargs)
+
+    def test_counters_follow_writes(self):
+        from accounts_app import stats
+        from contact_app.admin import ContactMessageAdmin
+        from django.contrib.admin.sites import site
+        first, second = self._message(), self._message(is_read=True)
+        self._message()
+        project = Project.objects.create(title='Counted', description='d', tech_stack='Go')
+        first.is_read = True
+        first.save()
+        admin = ContactMessageAdmin(ContactMessage, site)
+        admin.mark_as_unread(None, ContactMessage.objects.all())
+        admin.mark_as_read(None, ContactMessage.objects.filter(pk=second.pk))
+        second.delete()
+        project.delete()
+        expected = {stats.PROJECTS: 0, stats.MESSAGES: 2, stats.UNREAD: 2}
+        self.assertEqual(stats.counter_values(), expected)
+        self.assertEqual(stats.aggregate_counts(), expected)
+
+    def test_dashboard_queries_do_not_grow(self):
+        for i in range(25):
+            Project.objects.create(title=f'Dash {i}', description='d', tech_stack='Python, Django')
+        self._message()
+        self.client.get(reverse('dashboard'))
+        with self.assertNumQueries(4):  # session, user, counters, one page of projects
+            content = body(self.client.get(reverse('dashboard'))).decode()
+        self.assertIn('Dash 24', content)
+        self.assertNotIn('Dash 4<', content)
+        self.assertIn('1 unread', content)
+        cursor = content.split('?cursor=')[1].split('"')[0]
+        response = self.client.get(reverse('dashboard'), {'cursor': cursor})
+        self.assertContains(response, 'Dash 4<')
+        self.assertEqual(self.client.get(reverse('dashboard'), {'cursor': '!'}).status_code, 404)
+
+
 class ProjectCRUDTest(TestCase):
     def setUp(self):
         self.client = Client()
@@ -283,6 +776,116 @@ class ProjectCRUDTest(TestCase):
         self.assertFalse(Project.objects.filter(title='Delete Me').exists())
 
 
+class PageCacheTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            title='Cached Project',
+            description='A project used to exercise the rendered page cache.',
+            tech_stack='Python',
+        )
+
+    def test_anonymous_page_served_from_cache(self):
+        from portfolio_site import page_cache
+        before = page_cache.stats()
+        first = self.client.get(reverse('projects_list'))
+        first_content = body(first)  # a streamed page is cached once it has all been sent
+        second = self.client.get(reverse('projects_list'))
+        self.assertEqual(first['X-Page-Cache'], 'MISS')
+        self.assertEqual(second['X-Page-Cache'], 'HIT')
+        self.assertEqual(first_content, second.content)
+        after = page_cache.stats()
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertEqual(after['misses'] - before['misses'], 1)
+
+    def test_project_save_and_delete_invalidate(self):
+        url = reverse('project_detail', kwargs={'slug': self.project.slug})
+        self.client.get(url)
+        self.project.title = 'Renamed Project'
+        self.project.save()
+        response = self.client.get(url)
+        self.assertEqual(response['X-Page-Cache'], 'MISS')
+        self.assertContains(response, 'Renamed Project')
+        self.project.delete()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_profile_save_invalidates_about_only(self):
+        admin = User.objects.create_superuser(username='owner', password='OwnerPass123!')
+        self.client.get(reverse('about'))
+        body(self.client.get(reverse('projects_list')))
+        admin.profile.name = 'Portfolio Owner'
+        admin.profile.save()
+        self.assertContains(self.client.get(reverse('about')), 'Portfolio Owner')
+        self.assertEqual(self.client.get(reverse('projects_list'))['X-Page-Cache'], 'HIT')
+
+    def test_invalidation_reaches_other_processes(self):
+        from portfolio_site import page_cache
+        body(self.client.get(reverse('projects_list')))
+        # Another worker, or the job worker, has a locmem cache of its own.
+        other = {**settings.CACHES, 'default': {**settings.CACHES['default'], 'LOCATION': 'other-process'}}
+        with override_settings(CACHES=other):
+            page_cache.invalidate('project')
+        self.assertEqual(self.client.get(reverse('projects_list'))['X-Page-Cache'], 'MISS')
+
+    def test_authenticated_requests_bypass_cache(self):
+        User.objects.create_user(username='reader', password='ReaderPass123!')
+        self.client.login(username='reader', password='ReaderPass123!')
+        self.client.get(reverse('projects_list'))
+        response = self.client.get(reverse('projects_list'))
+        self.assertNotIn('X-Page-Cache', response)
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            title='Conditional Project',
+            description='A project used to exercise ETag and Last-Modified handling.',
+            tech_stack='Python',
+        )
+        self.api = APIClient()
+
+    def test_api_detail_not_modified(self):
+        url = f'/api/projects/{self.project.slug}/'
+        response = self.api.get(url)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+        response = self.api.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_api_list_etag_changes_on_write(self):
+        etag = self.api.get('/api/projects/')['ETag']
+        with self.assertNumQueries(1):  # the project state, from the database cache table
+            response = self.api.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        Project.objects.create(title='Another Project', description='Changes the list validator.', tech_stack='Go')
+        response = self.api.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+
+    def test_state_shared_between_processes(self):
+        etag = self.api.get('/api/projects/')['ETag']
+        other = {**settings.CACHES, 'default': {**settings.CACHES['default'], 'LOCATION': 'other-process'}}
+        with override_settings(CACHES=other):
+            Project.objects.create(title='Imported Project', description='Written by another process.', tech_stack='Go')
+        self.assertEqual(self.api.get('/api/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_api_list_etag_changes_on_delete(self):
+        etag = self.api.get('/api/projects/')['ETag']
+        self.project.delete()
+        self.assertEqual(self.api.get('/api/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_html_detail_not_modified(self):
+        url = reverse('project_detail', kwargs={'slug': self.project.slug})
+        response = self.client.get(url)
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_api_profile_not_modified(self):
+        User.objects.create_superuser(username='owner', password='OwnerPass123!')
+        etag = self.api.get('/api/profile/')['ETag']
+        self.assertEqual(self.api.get('/api/profile/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
 # ─── API Tests ───────────────────────────────────────────────────────────────
 
 class APITest(TestCase):
@@ -357,6 +960,496 @@ class APITest(TestCase):
         })
         self.assertEqual(response.status_code, 400)
 
+    def test_bulk_operations(self):
+        doomed = Project.objects.create(title='Doomed', description='Deleted by the bulk API.', tech_stack='Go')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        response = self.client.post('/api/projects/bulk/', [
+            {'op': 'create', 'data': {'title': 'Bulk One', 'description': 'Created in a bulk request.',
+                                      'tech_stack': 'Rust'}},
+            {'op': 'update', 'slug': self.project.slug, 'data': {'tech_stack': 'Go, Rust'}},
+            {'op': 'delete', 'slug': doomed.slug},
+            {'op': 'delete', 'slug': 'already-gone'},
+        ], format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['status'] for r in response.data['results']],
+                         ['created', 'updated', 'deleted', 'not_found'])
+        self.assertEqual(response.data['results'][0]['slug'], 'bulk-one')
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.title, 'API Test Project')
+        self.assertEqual(list(Project.objects.with_tech(['rust']).order_by('title')
+                              .values_list('title', flat=True)), ['API Test Project', 'Bulk One'])
+        self.assertFalse(Project.objects.filter(pk=doomed.pk).exists())
+
+    def test_bulk_rejects_non_string_op_and_slug(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        response = self.client.post('/api/projects/bulk/', [
+            {'op': ['create']},
+            {'op': 'delete', 'slug': ['x']},
+            {'op': 'update', 'slug': {'a': 1}, 'data': {}},
+        ], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([list(r['errors']) for r in response.data['results']], [['op'], ['slug'], ['slug']])
+
+    def test_bulk_creates_with_clashing_slugs(self):
+        from projects_app import bulk
+        from django.db import IntegrityError
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        operations = [{'op': 'create', 'data': {'title': title, 'description': 'Created in a bulk request.',
+                                                'tech_stack': 'Go'}} for title in ['App', 'App', 'App 1']]
+        response = self.client.post('/api/projects/bulk/', operations, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len({r['slug'] for r in response.data['results']}), 3)
+        with mock.patch('api_app.views.save_projects', side_effect=IntegrityError('duplicate key')):
+            response = self.client.post('/api/projects/bulk/', operations[:1], format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data['results'][0]['status'], 'invalid')
+        self.assertEqual(Project.objects.filter(title='App').count(), 2)
+
+    def test_bulk_rejects_whole_batch_on_invalid_item(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        response = self.client.post('/api/projects/bulk/', [
+            {'op': 'create', 'data': {'title': 'Fine', 'description': 'A perfectly valid project.',
+                                      'tech_stack': 'Go'}},
+            {'op': 'create', 'data': {'title': 'A', 'description': 'Short', 'tech_stack': ''}},
+            {'op': 'update', 'slug': 'missing', 'data': {}},
+        ], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([r['status'] for r in response.data['results']], ['not_applied', 'invalid', 'invalid'])
+        self.assertIn('title', response.data['results'][1]['errors'])
+        self.assertFalse(Project.objects.filter(title='Fine').exists())
+
+
+class CachedTokenAuthTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(username='tokenadmin', password='TokenAdminPass123!')
+        self.token = Token.objects.create(user=self.admin)
+        self.project = Project.objects.create(title='Synced', description='Kept in sync by CI.', tech_stack='Go')
+
+    def _auth(self, key):
+        from api_app.authentication import CachedTokenAuthentication
+        return CachedTokenAuthentication().authenticate_credentials(key)
+
+    def test_warm_cache_skips_token_lookup(self):
+        from api_app.authentication import token_cache
+        self._auth(self.token.key)
+        with self.assertNumQueries(1):  # the generation, from the database cache table
+            user, token = self._auth(self.token.key)
+        self.assertEqual(user, self.admin)
+        self.assertGreaterEqual(token_cache.stats()['hits'], 1)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        metrics = self.client.get('/api/metrics/').json()
+        self.assertIn('hit_ratio', metrics['stats']['token_auth'])
+
+    def test_logout_and_deactivation_invalidate(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, 200)
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, 401)
+
+        token = Token.objects.create(user=self.admin)
+        self._auth(token.key)
+        self.admin.is_active = False
+        self.admin.save()
+        with self.assertRaises(Exception):
+            self._auth(token.key)
+
+    def test_revocation_reaches_other_workers(self):
+        from api_app.authentication import token_cache
+        from rest_framework.exceptions import AuthenticationFailed
+        key = self.token.key
+        self._auth(key)
+        # Logged out on another worker: its own locmem cache and token cache, not ours.
+        other = {**settings.CACHES, 'default': {**settings.CACHES['default'], 'LOCATION': 'other-process'}}
+        with override_settings(CACHES=other), mock.patch.object(token_cache, 'clear'):
+            self.token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self._auth(key)
+
+    def test_expiry_and_rotation(self):
+        Token.objects.filter(pk=self.token.pk).update(created=timezone.now() - timezone.timedelta(days=2))
+        self._auth(self.token.key)  # cached before expiry is switched on
+        with override_settings(TOKEN_EXPIRY_SECONDS=3600):
+            self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+            self.assertEqual(self.client.patch(f'/api/projects/{self.project.slug}/', {'order': 2}).status_code, 401)
+            response = self.client.post('/api/auth/login/', {'username': 'tokenadmin', 'password': 'TokenAdminPass123!'})
+        new_key = response.data['token']
+        self.assertNotEqual(new_key, self.token.key)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {new_key}')
+        rotated = self.client.post('/api/auth/token/rotate/').data['token']
+        self.assertEqual(self.client.patch(f'/api/projects/{self.project.slug}/', {'order': 2}).status_code, 401)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {rotated}')
+        self.assertEqual(self.client.patch(f'/api/projects/{self.project.slug}/', {'order': 2}).status_code, 200)
+
+
+class ProjectRowSerializerTest(TestCase):
+    def test_output_is_byte_identical(self):
+        from rest_framework.renderers import JSONRenderer
+        from rest_framework.test import APIRequestFactory
+        from api_app.serializers import ProjectRowSerializer, ProjectSerializer
+        Project.objects.create(title='No Stack', description='A project without any tech.', tech_stack='')
+        pictured = Project.objects.create(
+            title='Café Pictured', description='Has an image and renditions.', tech_stack=' Go ,, Rust ',
+            github_link='https://github.com/x/y', is_featured=True, order=2,
+        )
+        Project.objects.filter(pk=pictured.pk).update(
+            image='projects/café.png',
+            image_renditions={'source': 'projects/café.png', 'webp': {'320': 'projects/renditions/café-320.webp'}},
+        )
+        queryset = Project.objects.order_by('-created_at', '-id')
+        for request in [APIRequestFactory().get('/api/projects/'), None]:
+            rows = ProjectRowSerializer(request)
+            full = ProjectSerializer(queryset, many=True, context={'request': request}).data
+            self.assertEqual(JSONRenderer().render(rows.serialize(rows.values(queryset))), JSONRenderer().render(full))
+
+    def test_tech_list_stored_on_save(self):
+        project = Project.objects.create(title='Stored', description='Tech list stored on save.', tech_stack='A, B')
+        project.tech_stack = 'C'
+        project.save(update_fields=['tech_stack'])
+        self.assertEqual(Project.objects.values_list('tech_list', flat=True).get(pk=project.pk), ['C'])
+
+
+class AsyncViewTest(TestCase):
+    # The async read views (ASYNC_VIEWS) must answer exactly like the sync ones.
+    def setUp(self):
+        from django.test import AsyncRequestFactory
+        self.factory = AsyncRequestFactory()
+        owner = User.objects.create_superuser(username='owner', password='OwnerPass123!')
+        Profile.objects.filter(user=owner).update(name='Owner', skills='Python, Go')
+        self.project = Project.objects.create(
+            title='Async Project', description='Served without a sync worker.',
+            tech_stack='Python, asyncio', is_featured=True,
+        )
+
+    def call(self, view, path, view_kwargs=None, **extra):
+        from asgiref.sync import async_to_sync
+        from django.contrib.auth.models import AnonymousUser
+        request = self.factory.get(path, **extra)
+        request.user = AnonymousUser()
+        return async_to_sync(view)(request, **(view_kwargs or {}))
+
+    def test_api_matches_sync_views(self):
+        from api_app import views
+        slug = self.project.slug
+        for view, path, view_kwargs in [
+            (views.featured_projects_async, '/api/projects/featured/', {}),
+            (views.project_detail_async, f'/api/projects/{slug}/', {'slug': slug}),
+            (views.project_detail_async, '/api/projects/missing/', {'slug': 'missing'}),
+            (views.profile_async, '/api/profile/', {}),
+        ]:
+            expected = APIClient().get(path, HTTP_ACCEPT='application/json')
+            response = self.call(view, path, view_kwargs=view_kwargs, headers={'accept': 'application/json'})
+            self.assertEqual(response.status_code, expected.status_code, path)
+            self.assertEqual(json.loads(response.content), expected.json(), path)
+            self.assertEqual(response.get('ETag'), expected.get('ETag'), path)
+
+        etag = self.call(views.project_detail_async, f'/api/projects/{slug}/', view_kwargs={'slug': slug})['ETag']
+        response = self.call(views.project_detail_async, f'/api/projects/{slug}/',
+                             view_kwargs={'slug': slug}, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_writes_fall_through_to_sync_view(self):
+        from asgiref.sync import async_to_sync
+        from api_app import views
+        request = self.factory.delete(f'/api/projects/{self.project.slug}/')
+        response = async_to_sync(views.project_detail_async)(request, slug=self.project.slug)
+        self.assertEqual(response.status_code, 401)
+        self.assertTrue(views.project_detail_async.csrf_exempt)
+
+    def test_home_renders_and_is_cached(self):
+        from projects_app.views import home_view_async
+        response = self.call(home_view_async, '/')
+        self.assertContains(response, 'Async Project')
+        self.assertEqual(response['X-Page-Cache'], 'MISS')
+        self.assertEqual(self.call(home_view_async, '/')['X-Page-Cache'], 'HIT')
+
+
+class MetricsTest(TestCase):
+    def setUp(self):
+        from portfolio_site import metrics
+        metrics.registry.reset()
+        self.admin = User.objects.create_superuser(username='ops', password='OpsPass123!')
+        self.api = APIClient()
+
+    def test_records_route_timings(self):
+        self.client.get(reverse('home'))
+        self.api.force_authenticate(self.admin)
+        data = self.api.get('/api/metrics/').data
+        home = data['routes']['home']
+        self.assertEqual(home['count'], 1)
+        self.assertEqual(home['statuses'], {200: 1})
+        self.assertGreater(home['db_queries']['p50'], 0)
+        self.assertGreater(home['template_seconds']['p99'], 0)
+        self.assertIn('page_cache', data['stats'])
+
+    def test_prometheus_format(self):
+        self.client.get(reverse('about'))
+        self.api.force_authenticate(self.admin)
+        response = self.api.get('/api/metrics/', {'format': 'prometheus'})
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn('portfolio_requests_total{route="about",status="200"} 1', response.content.decode())
+        self.assertIn('portfolio_page_cache_misses', response.content.decode())
+
+    def test_staff_only(self):
+        self.assertEqual(self.api.get('/api/metrics/').status_code, 401)
+
+    def test_percentile(self):
+        from portfolio_site.metrics import percentile
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_connection_reuse(self):
+        from portfolio_site import metrics
+        before = metrics.connection_stats()
+        self.client.get(reverse('about'))
+        after = metrics.connection_stats()
+        # The test connection stays open across requests, like CONN_MAX_AGE in production.
+        self.assertEqual(after['requests_reused'], before['requests_reused'] + 1)
+        self.assertEqual(after['opened'], before['opened'])
+        self.assertEqual(metrics.registry.snapshot()['routes']['about']['db_connections']['p99'], 0)
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1'])
+class ReplicaRoutingTest(TestCase):
+    def setUp(self):
+        from portfolio_site.db.routers import PrimaryReplicaRouter
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_go_to_replica_and_writes_to_primary(self):
+        from portfolio_site.db.routers import pin_primary
+        self.assertEqual(self.router.db_for_read(Project), 'replica_1')
+        self.assertEqual(self.router.db_for_write(Project), 'default')
+        with pin_primary():
+            self.assertEqual(self.router.db_for_read(Project), 'default')
+        self.assertFalse(self.router.allow_migrate('replica_1', 'projects_app'))
+        # Shared cache state (database cache table) is never read from a lagging replica.
+        from django.core.cache import caches
+        shared = caches[settings.SHARED_CACHE_ALIAS]
+        if hasattr(shared, 'cache_model_class'):
+            self.assertEqual(self.router.db_for_read(shared.cache_model_class), 'default')
+
+    def test_middleware_pins_after_write(self):
+        from django.test import RequestFactory
+        from portfolio_site.db.routers import PIN_COOKIE, ReplicaPinMiddleware
+        seen = []
+        middleware = ReplicaPinMiddleware(
+            lambda request: seen.append(self.router.db_for_read(Project)) or HttpResponse()
+        )
+        factory = RequestFactory()
+        response = middleware(factory.post('/contact/'))
+        self.assertIn(PIN_COOKIE, response.cookies)
+        middleware(factory.get('/', HTTP_COOKIE=f'{PIN_COOKIE}=1'))
+        middleware(factory.get('/'))
+        self.assertEqual(seen, ['default', 'default', 'replica_1'])
+
+        # A content write pins every reader until replicas catch up, also one made by another process.
+        other = {**settings.CACHES, 'default': {**settings.CACHES['default'], 'LOCATION': 'other-process'}}
+        with override_settings(CACHES=other):
+            Project.objects.create(title='Fresh', description='Just written to the primary.', tech_stack='Go')
+        middleware(factory.get('/'))
+        self.assertEqual(seen[-1], 'default')
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'psycopg2 pool needs PostgreSQL')
+class ConnectionPoolTest(TestCase):
+    def test_connections_are_reused(self):
+        from portfolio_site.db.pooled_postgresql.base import ConnectionPool
+        pool = ConnectionPool(connection.get_connection_params(), 1, 2, timeout=1, check_after=0)
+        self.addCleanup(pool.close)
+        first = pool.getconn()
+        pool.putconn(first)
+        self.assertIs(pool.getconn(), first)
+        pool.getconn()
+        with self.assertRaises(OperationalError):
+            pool.getconn()
+        self.assertEqual(pool.stats()['in_use'], 2)
+
+
+class TemplateBytecodeCacheTest(TestCase):
+    def test_compile_templates_fills_cache(self):
+        from django.template import engines
+        env = engines['jinja2'].env
+        call_command('compile_templates', stdout=io.StringIO())
+        out = io.StringIO()
+        call_command('compile_templates', stdout=out)
+        self.assertIn('Compiled 0 of', out.getvalue())
+
+        # A fresh environment loads from the cache instead of compiling.
+        from portfolio_site.jinja2 import environment, template_stats
+        fresh = environment(loader=env.loader)
+        before = template_stats()['compiled']
+        fresh.get_template('home.html')
+        self.assertEqual(template_stats()['compiled'], before)
+
+
+class StaticBuildTest(TestCase):
+    def test_pages_load_no_third_party_assets(self):
+        content = self.client.get(reverse('home')).content.decode()
+        self.assertIn('/static/css/site.css', content)
+        self.assertNotIn('cdn.tailwindcss.com', content)
+        self.assertNotIn('fonts.googleapis.com', content)
+        self.assertNotIn('cdnjs.cloudflare.com', content)
+
+    def test_buildpack_deploy_builds_assets(self):
+        with open(os.path.join(settings.BASE_DIR, 'package.json')) as f:
+            scripts = json.load(f)['scripts']
+        self.assertEqual(scripts['heroku-postbuild'], 'npm run build')
+        with open(os.path.join(settings.BASE_DIR, 'docker-compose.yml')) as f:
+            self.assertNotIn(':latest', f.read())
+
+    def test_collectstatic_writes_hashed_precompressed_files(self):
+        source, root = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source)
+        self.addCleanup(shutil.rmtree, root)
+        os.makedirs(os.path.join(source, 'css'))
+        os.makedirs(os.path.join(source, 'fonts'))
+        with open(os.path.join(source, 'css', 'site.css'), 'w') as f:
+            f.write("@font-face { src: url('../fonts/inter.woff2'); }\n" + '.p-4 { padding: 1rem; }\n' * 100)
+        with open(os.path.join(source, 'fonts', 'inter.woff2'), 'wb') as f:
+            f.write(b'wOF2' * 100)
+        storages = {**settings.STORAGES, 'staticfiles': {
+            'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'}}
+        with override_settings(STATICFILES_DIRS=[source], STATIC_ROOT=root, STORAGES=storages):
+            call_command('collectstatic', interactive=False, verbosity=0)
+            from django.templatetags.static import static
+            url = static('css/site.css')
+        self.assertRegex(url, r'^/static/css/site\.[0-9a-f]{12}\.css$')
+        hashed = os.path.join(root, url[len('/static/'):])
+        self.assertTrue(os.path.exists(hashed + '.gz'))
+        self.assertTrue(os.path.exists(hashed + '.br'))
+        with open(hashed) as f:
+            self.assertRegex(f.read(), r'url\("?\.\./fonts/inter\.[0-9a-f]{12}\.woff2')
+
+
+class StreamingCompressionTest(TestCase):
+    def setUp(self):
+        for i in range(30):
+            Project.objects.create(title=f'Streamed {i}', description='A streamed project. ' * 20, tech_stack='Python')
+
+    @override_settings(PAGE_CACHE_ENABLED=False)
+    def test_list_page_streams_compressed(self):
+        import gzip
+        import brotli
+        for coding, decompress in [('br', brotli.decompress), ('gzip', gzip.decompress)]:
+            response = self.client.get(reverse('projects_list'), HTTP_ACCEPT_ENCODING=f'{coding}, deflate')
+            self.assertTrue(response.streaming)
+            self.assertEqual(response['Content-Encoding'], coding)
+            self.assertIn('Accept-Encoding', response['Vary'])
+            self.assertFalse(response.has_header('Content-Length'))
+            self.assertIn(b'Streamed 29', decompress(body(response)))
+
+    @override_settings(PAGE_CACHE_ENABLED=False)
+    def test_every_compressed_body_is_padded(self):
+        import gzip
+        import brotli
+        for coding, decompress in [('br', brotli.decompress), ('gzip', gzip.decompress)]:
+            streamed = [
+                body(self.client.get(reverse('projects_list'), HTTP_ACCEPT_ENCODING=coding)) for _ in range(10)
+            ]
+            buffered = [
+                APIClient().get('/api/projects/', HTTP_ACCEPT_ENCODING=coding).content for _ in range(10)
+            ]
+            for bodies in (streamed, buffered):
+                self.assertGreater(len({len(b) for b in bodies}), 1)
+                self.assertEqual(len({decompress(b) for b in bodies}), 1)
+
+    def test_negotiation(self):
+        from portfolio_site.compression import negotiate
+        self.assertEqual(negotiate('gzip, deflate, br'), 'br')
+        self.assertEqual(negotiate('br;q=0, gzip'), 'gzip')
+        self.assertEqual(negotiate('br;q=0.5, gzip;q=0.8'), 'gzip')
+        self.assertEqual(negotiate('*'), 'br')
+        self.assertIsNone(negotiate('identity'))
+        self.assertIsNone(negotiate(''))
+
+    def test_buffered_responses(self):
+        import gzip
+        response = APIClient().get('/api/projects/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertEqual(json.loads(gzip.decompress(response.content))['results'][0]['title'], 'Streamed 29')
+        redirect = self.client.get(reverse('dashboard'), HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(redirect.has_header('Content-Encoding'))
+
+    def test_async_chain_runs_without_adapter(self):
+        from asgiref.sync import async_to_sync, iscoroutinefunction
+        from django.test import RequestFactory
+        from portfolio_site.compression import CompressionMiddleware
+
+        async def view(request):
+            return HttpResponse('<p>compressible</p>' * 50, content_type='text/html')
+
+        middleware = CompressionMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip'))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_streamed_page_consumes_flash_messages(self):
+        User.objects.create_user(username='streamer', password='StreamPass123!')
+        self.client.post(reverse('login'), {'username': 'streamer', 'password': 'StreamPass123!'})
+        self.assertIn(b'Welcome back, streamer!', body(self.client.get(reverse('dashboard'))))
+        self.assertNotIn(b'Welcome back, streamer!', body(self.client.get(reverse('dashboard'))))
+
+
+class ImportTimeTest(TestCase):
+    def test_parse_report(self):
+        from portfolio_site.importtime import parse
+        records = parse(
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       120 |        450 |   jinja2.utils\n'
+            'import time:       330 |        780 | jinja2\n'
+        )
+        self.assertEqual([(r.module, r.self_us, r.cumulative_us, r.depth) for r in records],
+                         [('jinja2.utils', 120, 450, 1), ('jinja2', 330, 780, 0)])
+
+    def test_worker_cold_start_within_budget(self):
+        from portfolio_site.importtime import profile
+        result = profile('wsgi', runs=2)
+        slowest = '\n'.join(f'{r.cumulative_us / 1000:8.1f} ms  {r.module}' for r in result.top(15))
+        self.assertLessEqual(result.total_ms, settings.IMPORT_TIME_BUDGET_MS, f'Slowest imports:\n{slowest}')
+        # Pillow is only needed when renditions are generated.
+        self.assertNotIn('PIL', result.modules())
+
+
+class WarmUpTest(TestCase):
+    @override_settings(WARMUP_PATHS=['/', '/missing/'], ALLOWED_HOSTS=['*', 'example.com'])
+    def test_warm_up_requests_paths(self):
+        from portfolio_site import warmup
+        with mock.patch.object(warmup.connections, 'close_all'), \
+                self.assertLogs('portfolio_site.warmup', 'INFO') as logs:
+            warmup.warm_up()
+        output = '\n'.join(logs.output)
+        self.assertIn('GET / -> 200 OK', output)
+        self.assertIn('GET /missing/ -> 404', output)
+        self.assertEqual(warmup._warm_host(), 'example.com')
+
+    def test_master_warm_up_fills_no_caches(self):
+        from portfolio_site import page_cache, warmup
+        before = page_cache.stats()
+        with mock.patch.object(warmup.connections, 'close_all'), self.assertNumQueries(0):
+            warmup.warm_up(requests=False)
+        self.assertEqual(page_cache.stats()['misses'], before['misses'])
+
+
+class BenchmarkSuiteTest(TestCase):
+    def test_run_reports_every_scenario(self):
+        from portfolio_site import benchmark
+        report = benchmark.run([3], requests=2, warmup=0)
+        results = report['results']['3']
+        self.assertEqual(Project.objects.count(), 3)
+        self.assertEqual(set(results), {name for name, *_ in benchmark.scenarios()})
+        for result in results.values():
+            self.assertEqual(result['errors'], 0)
+            self.assertIn('p95_ms', result)
+        self.assertEqual(benchmark.compare(report, report), [])
+
+    def test_compare_flags_regressions(self):
+        from portfolio_site import benchmark
+        baseline = {'results': {'10': {'home': {'rps': 100, 'p95_ms': 5, 'queries_per_request': 2}}}}
+        current = {'results': {'10': {'home': {'rps': 50, 'p95_ms': 5, 'queries_per_request': 3}}}}
+        self.assertEqual(len(benchmark.compare(current, baseline)), 2)
+
 
 # ─── Contact Form Tests ───────────────────────────────────────────────────────
 
@@ -382,3 +1475,132 @@ class ContactFormTest(TestCase):
         })
         self.assertEqual(response.status_code, 200)
         self.assertFalse(ContactMessage.objects.filter(name='Test').exists())
+
+
+@override_settings(THROTTLE_RATES={'contact': '2/min', 'login': '5/min', 'login_account': '2/min'})
+class ThrottleTest(TestCase):
+    form = {'name': 'Bot', 'email': 'bot@example.com', 'message': 'Buy cheap things right now, friend.'}
+
+    def test_contact_rejected_before_validation(self):
+        for _ in range(2):
+            self.assertEqual(self.client.post(reverse('contact'), self.form).status_code, 302)
+        with self.assertNumQueries(1):  # the counters, from the database cache table
+            response = self.client.post(reverse('contact'), self.form)
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+        self.assertEqual(ContactMessage.objects.count(), 2)
+        # Budgets are per client, and the API shares the contact budget.
+        other = Client(REMOTE_ADDR='203.0.113.9')
+        self.assertEqual(other.post('/api/contact/', self.form).status_code, 201)
+        response = self.client.post('/api/contact/', self.form)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('throttled', response.json()['detail'])
+
+    def test_budget_shared_between_workers(self):
+        other = {**settings.CACHES, 'default': {**settings.CACHES['default'], 'LOCATION': 'other-process'}}
+        with override_settings(CACHES=other):
+            for _ in range(2):
+                self.assertEqual(self.client.post(reverse('contact'), self.form).status_code, 302)
+        self.assertEqual(self.client.post(reverse('contact'), self.form).status_code, 429)
+
+    def test_login_limited_per_account_across_ips(self):
+        User.objects.create_user(username='victim', password='VictimPass123!')
+        for i in range(2):
+            Client(REMOTE_ADDR=f'198.51.100.{i}').post(reverse('login'), {'username': 'victim', 'password': 'nope'})
+        response = APIClient(REMOTE_ADDR='198.51.100.7').post(
+            '/api/auth/login/', {'username': 'Victim', 'password': 'VictimPass123!'}, format='json',
+        )
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.json()['detail'][:25], 'Request was throttled. Ex')
+        from portfolio_site.metrics import collect_stats
+        self.assertGreaterEqual(collect_stats()['throttle']['login_account_rejected'], 1)
+
+    def test_clients_behind_compose_nginx_get_own_budgets(self):
+        import re
+        with open(os.path.join(settings.BASE_DIR, 'docker-compose.yml')) as f:
+            services = dict(re.findall(r'^  (\w+):\n(.*?)(?=^  \w+:|^\S|\Z)', f.read(), re.M | re.S))
+        self.assertNotIn('ports:', services['web'])
+        num_proxies = int(re.search(r'NUM_PROXIES=(\d+)', services['web']).group(1))
+        # nginx appends the address it saw, so a spoofed header only adds hops on the left.
+        first = Client(REMOTE_ADDR='172.18.0.5', HTTP_X_FORWARDED_FOR='spoofed, 198.51.100.1')
+        second = Client(REMOTE_ADDR='172.18.0.5', HTTP_X_FORWARDED_FOR='198.51.100.2')
+        with override_settings(NUM_PROXIES=num_proxies):
+            for _ in range(2):
+                self.assertEqual(first.post(reverse('contact'), self.form).status_code, 302)
+            self.assertEqual(first.post(reverse('contact'), self.form).status_code, 429)
+            self.assertEqual(second.post(reverse('contact'), self.form).status_code, 302)
+
+    def test_sliding_window_and_proxies(self):
+        from django.test import RequestFactory
+        from portfolio_site.throttle import check, client_ip
+        request = RequestFactory().post('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='1.1.1.1, 2.2.2.2')
+        self.assertEqual(client_ip(request), '10.0.0.1')
+        with override_settings(NUM_PROXIES=1):
+            self.assertEqual(client_ip(request), '2.2.2.2')
+        rules = [('contact', client_ip)]
+        self.assertIsNone(check(request, rules, now=60))
+        self.assertIsNone(check(request, rules, now=90))
+        self.assertEqual(check(request, rules, now=100), 21)
+        self.assertEqual(check(request, rules, now=120), 1)
+        # The previous minute's requests slide out gradually rather than all at once.
+        self.assertIsNone(check(request, rules, now=121))
+        self.assertEqual(check(request, rules, now=125), 26)
+        self.assertIsNone(check(request, rules, now=151))
+
+
+class MailQueueTest(TestCase):
+    def test_contact_submissions_only_enqueue(self):
+        self.client.post(reverse('contact'), {
+            'name': 'Queue Tester',
+            'email': 'queue@example.com',
+            'message': 'This message should be queued rather than sent inline.',
+        })
+        APIClient().post('/api/contact/', {
+            'name': 'Api Tester',
+            'email': 'api@example.com',
+            'message': 'This message should also be queued rather than sent.',
+        })
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.STATUS_PENDING).count(), 4)
+        self.assertTrue(OutboundEmail.objects.filter(recipients=['queue@example.com']).exists())
+
+    def test_longest_valid_subject_fits_outbox(self):
+        response = self.client.post(reverse('contact'), {
+            'name': 'N' * 100,
+            'email': 'long@example.com',
+            'subject': 'S' * 200,
+            'message': 'The admin notice subject is longer than both inputs.',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(ContactMessage.objects.filter(email='long@example.com').exists())
+        notice = OutboundEmail.objects.get(recipients=[settings.ADMIN_EMAIL])
+        self.assertEqual(notice.subject, f'[Portfolio Contact] {"S" * 200} from {"N" * 100}')
+        max_length = OutboundEmail._meta.get_field('subject').max_length
+        self.assertTrue(max_length is None or len(notice.subject) <= max_length)
+
+    def test_worker_sends_batch(self):
+        from contact_app.outbox import queue_contact_emails
+        queue_contact_emails(ContactMessage.objects.create(
+            name='Batch', email='batch@example.com', message='Delivered by the worker.',
+        ))
+        call_command('send_queued_mail', stdout=mock.MagicMock())
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.STATUS_SENT).count(), 2)
+
+    def test_failures_back_off_then_dead_letter(self):
+        from contact_app.outbox import send_queued_batch
+        email = OutboundEmail.objects.create(
+            subject='Flaky', body='Body', from_email='noreply@test.com', recipients=['x@example.com'],
+        )
+        with mock.patch('contact_app.outbox.EmailMessage.send', side_effect=OSError('SMTP down')):
+            self.assertEqual(send_queued_batch(max_attempts=2), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutboundEmail.STATUS_PENDING)
+            self.assertGreater(email.next_attempt_at, email.created_at)
+            self.assertEqual(send_queued_batch(max_attempts=2), (0, 0))
+
+            OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=email.created_at)
+            send_queued_batch(max_attempts=2)
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.STATUS_DEAD)
+        self.assertIn('SMTP down', email.last_error)